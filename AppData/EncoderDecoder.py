@@ -73,34 +73,75 @@ class Serializable:
         return self.__dict__
 
     def copy(self) -> typing.Self:
-        return Decoder.decode(Encoder.encode(self))
+        return Copier.copy(self)
 
 
 class Encoder:
+    _PRIMITIVE_TYPES = frozenset((int, float, bool, type(None)))
+    _encoders: dict[type, typing.Callable[[typing.Any], typing.Any]] = {}
+
     @classmethod
     def encode(cls, obj: typing.Any) -> typing.Any:
+        objectType = type(obj)
+        if objectType in cls._PRIMITIVE_TYPES:
+            return obj
+        encoder = cls._encoders.get(objectType)
+        if encoder == None:
+            encoder = cls._encoders[objectType] = cls._getEncoder(obj)
+        return encoder(obj)
+
+    @classmethod
+    def _getEncoder(cls, obj: typing.Any) -> typing.Callable[[typing.Any], typing.Any]:
         if isinstance(obj, str):
-            return f"str:{obj}"
+            return cls._encodeString
         elif isinstance(obj, QtCore.QDateTime):
-            return f"datetime:{obj.toString(QtCore.Qt.DateFormat.ISODateWithMs)}"
+            return cls._encodeDateTime
         elif isinstance(obj, QtCore.QTimeZone):
-            return f"timezone:{obj.id().data().decode()}"
+            return cls._encodeTimeZone
         elif isinstance(obj, QtCore.QUrl):
-            return f"url:{obj.toString()}"
+            return cls._encodeUrl
         elif isinstance(obj, bytes):
-            return f"bytes:{obj.decode()}"
+            return cls._encodeBytes
         elif isinstance(obj, bytearray):
-            return f"bytearray:{obj.decode()}"
+            return cls._encodeByteArray
         elif isinstance(obj, tuple):
-            return cls._encodeTuple(obj)
+            return cls._encodeTuple
         elif isinstance(obj, list):
-            return cls._encodeList(obj)
+            return cls._encodeList
         elif isinstance(obj, dict):
-            return cls._encodeDict(obj)
+            return cls._encodeDict
         elif cls._isObjectType(obj):
-            return cls._encodeObject(obj)
+            return cls._encodeObject
         else:
-            return obj
+            return cls._encodeValue
+
+    @classmethod
+    def _encodeValue(cls, obj: typing.Any) -> typing.Any:
+        return obj
+
+    @classmethod
+    def _encodeString(cls, obj: str) -> str:
+        return f"str:{obj}"
+
+    @classmethod
+    def _encodeDateTime(cls, obj: QtCore.QDateTime) -> str:
+        return f"datetime:{obj.toString(QtCore.Qt.DateFormat.ISODateWithMs)}"
+
+    @classmethod
+    def _encodeTimeZone(cls, obj: QtCore.QTimeZone) -> str:
+        return f"timezone:{obj.id().data().decode()}"
+
+    @classmethod
+    def _encodeUrl(cls, obj: QtCore.QUrl) -> str:
+        return f"url:{obj.toString()}"
+
+    @classmethod
+    def _encodeBytes(cls, obj: bytes) -> str:
+        return f"bytes:{obj.decode()}"
+
+    @classmethod
+    def _encodeByteArray(cls, obj: bytearray) -> str:
+        return f"bytearray:{obj.decode()}"
 
     @classmethod
     def _encodeTuple(cls, obj: tuple) -> dict:
@@ -131,14 +172,17 @@ class Encoder:
 
 
 class Decoder:
+    _objectTypes: dict[str, typing.Type[typing.Any]] = {}
+
     @classmethod
     def decode(cls, obj: typing.Any) -> typing.Any:
-        if isinstance(obj, list):
-            obj = cls._decodeList(obj)
-        elif isinstance(obj, dict):
-            obj = cls._decodeDict(obj)
-        elif isinstance(obj, str):
-            obj = cls._decodeString(obj)
+        objectType = type(obj)
+        if objectType is str:
+            return cls._decodeString(obj)
+        elif objectType is dict:
+            return cls._decodeDict(obj)
+        elif objectType is list:
+            return cls._decodeList(obj)
         return obj
 
     @classmethod
@@ -146,29 +190,39 @@ class Decoder:
         return [cls.decode(data) for data in obj]
 
     @classmethod
-    def _decodeDict(cls, obj: dict) -> typing.Any:
-        dataType = obj.pop("__type__", "dict")
-        if dataType.startswith("obj:"):
+    def _getObjectType(cls, dataType: str) -> types.ModuleType | typing.Type[typing.Any]:
+        objectType = cls._objectTypes.get(dataType)
+        if objectType == None:
             moduleInfo, classInfo = dataType.split(":", 1)[1].split(":", 1)
             objectType = importlib.import_module(moduleInfo)
             for name in classInfo.split("."):
                 objectType = getattr(objectType, name)
+            cls._objectTypes[dataType] = objectType
+        return objectType
+
+    @classmethod
+    def _decodeDict(cls, obj: dict) -> typing.Any:
+        dataType = obj.pop("__type__", "dict")
+        if dataType == "dict":
+            return {key: cls.decode(value) for key, value in obj.items()}
+        elif dataType == "tuple":
+            return tuple(cls.decode(data) for data in obj["data"])
+        elif dataType.startswith("obj:"):
+            objectType = cls._getObjectType(dataType)
             objectData = {key: cls.decode(value) for key, value in obj.items()}
-            if issubclass(objectType, Serializable):
+            if isinstance(objectType, type) and issubclass(objectType, Serializable):
                 return objectType.__load__(objectData)
             else:
                 raise Exceptions.DecodeError(objectType, objectData)
-        elif dataType == "tuple":
-            return tuple(cls.decode(data) for data in obj["data"])
         else:
-            return {key: cls.decode(obj[key]) for key, value in obj.items()}
+            return {key: cls.decode(value) for key, value in obj.items()}
 
     @classmethod
     def _decodeString(cls, obj: str) -> typing.Any:
-        key, data = obj.split(":", 1)
-        if key == "str":
-            return data
-        elif key == "datetime":
+        if obj.startswith("str:"):
+            return obj[4:]
+        key, separator, data = obj.partition(":")
+        if key == "datetime":
             return QtCore.QDateTime.fromString(data, QtCore.Qt.DateFormat.ISODateWithMs)
         elif key == "timezone":
             return QtCore.QTimeZone(data.encode())
@@ -178,5 +232,33 @@ class Decoder:
             return data.encode()
         elif key == "bytearray":
             return bytearray(data.encode())
+        else:
+            return obj
+
+
+class Copier:
+    @classmethod
+    def copy(cls, obj: typing.Any) -> typing.Any:
+        objectType = type(obj)
+        if objectType in Encoder._PRIMITIVE_TYPES or objectType is str or objectType is bytes:
+            return obj
+        elif objectType is list:
+            return [cls.copy(data) for data in obj]
+        elif objectType is dict:
+            return {key: cls.copy(value) for key, value in obj.items()}
+        elif objectType is tuple:
+            return tuple(cls.copy(data) for data in obj)
+        elif isinstance(obj, Serializable):
+            return objectType.__load__({key: cls.copy(value) for key, value in obj.__save__().items()})
+        elif isinstance(obj, QtCore.QDateTime):
+            return QtCore.QDateTime(obj)
+        elif isinstance(obj, QtCore.QTimeZone):
+            return QtCore.QTimeZone(obj)
+        elif isinstance(obj, QtCore.QUrl):
+            return QtCore.QUrl(obj)
+        elif isinstance(obj, bytearray):
+            return bytearray(obj)
+        elif Encoder._isObjectType(obj):
+            raise Exceptions.EncodeError(obj)
         else:
             return obj
\ No newline at end of file
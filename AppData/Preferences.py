@@ -1,5 +1,5 @@
 from .EncoderDecoder import Serializable, Encoder, Decoder
-from .Updater import Updaters
+from .Updater import Exceptions as UpdaterExceptions, Updaters
 
 from Core import App
 from Core.Config import Config
@@ -34,6 +34,7 @@ class Setup(Serializable):
 class Account(Serializable):
     def __init__(self):
         self._accountData = (None, None)
+        self._integrityData = None
 
     def __setup__(self):
         App.Account.setData(*self._accountData)
@@ -41,8 +42,15 @@ class Account(Serializable):
 
     def __save__(self):
         self._accountData = App.Account.getData()
+        if App.isServiceCreated("TwitchIntegrityGenerator"):
+            self._integrityData = App.TwitchIntegrityGenerator.exportIntegrity()
         return super().__save__()
 
+    def takeIntegrityData(self) -> str | None:
+        integrityData = self._integrityData
+        self._integrityData = None
+        return integrityData
+
 
 class General(Serializable):
     def __init__(self):
@@ -155,12 +163,8 @@ class Temp(Serializable):
         self._blockedContent = {}
 
     def __setup__(self):
-        App.DownloadHistory.setHistoryList(self._downloadHistory)
-        del self._downloadHistory
-
-    def __save__(self):
-        self._downloadHistory = App.DownloadHistory.getHistoryList()
-        return super().__save__()
+        if App.DownloadHistory.importHistoryList(self._downloadHistory):
+            self._downloadHistory = []
 
     def getDownloadOptionHistory(self, historyType: DownloadOptionHistory.BaseOptionHistory) -> None:
         return self._downloadOptionHistory[historyType.getId()]
@@ -226,16 +230,60 @@ class ScheduledDownloads(Serializable):
         return super().__save__()
 
 
+class PreferencesWriter(QtCore.QRunnable):
+    def __init__(self, preferences: "Preferences", data: str, sections: dict[str, str], dirtySections: list[str]):
+        super().__init__()
+        self.preferences = preferences
+        self.data = data
+        self.sections = sections
+        self.dirtySections = dirtySections
+
+    def run(self) -> None:
+        elapsedTimer = QtCore.QElapsedTimer()
+        elapsedTimer.start()
+        try:
+            OSUtils.createDirectory(Config.APPDATA_PATH)
+            OSUtils.writeFileAtomic(Config.APPDATA_FILE, self.data)
+        except Exception as e:
+            self.preferences.logger.error("Unable to save data.")
+            self.preferences.logger.exception(e)
+            self.preferences._writeFinished.emit(self.sections, False)
+            return
+        self.preferences.logger.info(f"Saved {', '.join(self.dirtySections)} in {elapsedTimer.elapsed()} ms.")
+        self.preferences._writeFinished.emit(self.sections, True)
+
+
 class Preferences(QtCore.QObject):
+    _writeFinished = QtCore.pyqtSignal(object, bool)
+
+    DOWNLOAD_HOST_SECTIONS = ("account", "localization", "download")
+
     def __init__(self, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self.logger = logger
         self.version = Config.APP_VERSION
         self._clearData()
-        App.Instance.aboutToQuit.connect(self.save)
+        self._savedSections: dict[str, str] = {}
+        self._pendingSections: dict[str, str] | None = None
+        self._writeFinished.connect(self._writeFinishedHandler, QtCore.Qt.ConnectionType.QueuedConnection)
+        self._writerPool = QtCore.QThreadPool(parent=self)
+        self._writerPool.setMaxThreadCount(1)
+        self._saveTimer = QtCore.QTimer(parent=self)
+        self._saveTimer.setSingleShot(True)
+        self._saveTimer.setInterval(Config.PREFERENCES_SAVE_DELAY)
+        self._saveTimer.timeout.connect(self._saveChanges)
+        self._autoSaveTimer = QtCore.QTimer(parent=self)
+        self._autoSaveTimer.setInterval(Config.PREFERENCES_AUTO_SAVE_INTERVAL)
+        self._autoSaveTimer.timeout.connect(self.requestSave)
+        if not App.Instance.isDownloadHost():
+            self._autoSaveTimer.start()
+            App.Instance.aboutToQuit.connect(self.save)
 
     def load(self) -> None:
         self._clearData()
+        if App.Instance.isDownloadHost():
+            self._loadDownloadHostSections()
+            return
         if not OSUtils.isFile(Config.APPDATA_FILE):
             Updaters.FindPreferences()
         try:
@@ -249,14 +297,71 @@ class Preferences(QtCore.QObject):
             self.reset()
             self.logger.info("Starting with default settings.")
 
-    def save(self) -> None:
+    def _loadDownloadHostSections(self) -> None:
+        loadedSections = []
         try:
-            OSUtils.createDirectory(Config.APPDATA_PATH)
-            with open(Config.APPDATA_FILE, "w", encoding="utf-8") as file:
-                json.dump(Encoder.encode(self.getSaveData()), file, indent=3)
+            with open(Config.APPDATA_FILE, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            updaters = Updaters.getUpdaters(Updaters.detectVersion(data))
+            if updaters == None:
+                raise UpdaterExceptions.UnknownVersion
+            for updater in updaters:
+                data = updater(data)
+            for key in self.DOWNLOAD_HOST_SECTIONS:
+                if key in data:
+                    setattr(self, key, Decoder.decode(data[key]))
+                    loadedSections.append(key)
+        except Exception as e:
+            self.logger.warning("Unable to load data for the download host.")
+            self.logger.exception(e)
+        for key in self.DOWNLOAD_HOST_SECTIONS:
+            if key not in loadedSections:
+                getattr(self, key).__setup__()
+
+    def requestSave(self) -> None:
+        if not App.Instance.isDownloadHost() and not self._saveTimer.isActive():
+            self._saveTimer.start()
+
+    def _encodeSections(self) -> tuple[dict[str, str], list[str]]:
+        elapsedTimer = QtCore.QElapsedTimer()
+        elapsedTimer.start()
+        sections = {key: json.dumps(Encoder.encode(value), separators=(",", ":")) for key, value in self.getSaveData().items()}
+        baseSections = self._savedSections if self._pendingSections == None else self._pendingSections
+        dirtySections = [key for key, data in sections.items() if baseSections.get(key) != data]
+        self.logger.debug(f"Encoded preferences in {elapsedTimer.elapsed()} ms.")
+        return sections, dirtySections
+
+    def _createWriter(self) -> PreferencesWriter | None:
+        try:
+            sections, dirtySections = self._encodeSections()
         except Exception as e:
             self.logger.error("Unable to save data.")
             self.logger.exception(e)
+            return None
+        if len(dirtySections) == 0:
+            return None
+        self._pendingSections = sections
+        data = ",".join(f"{json.dumps(key)}:{value}" for key, value in {**sections, "__type__": json.dumps("dict")}.items())
+        return PreferencesWriter(self, f"{{{data}}}", sections, dirtySections)
+
+    def _writeFinishedHandler(self, sections: dict[str, str], saved: bool) -> None:
+        if saved:
+            self._savedSections = sections
+        if sections is self._pendingSections:
+            self._pendingSections = None
+
+    def _saveChanges(self) -> None:
+        writer = self._createWriter()
+        if writer != None:
+            self._writerPool.start(writer)
+
+    def save(self) -> None:
+        self._saveTimer.stop()
+        self._autoSaveTimer.stop()
+        self._writerPool.waitForDone()
+        writer = self._createWriter()
+        if writer != None:
+            writer.run()
 
     def _clearData(self) -> None:
         self.setup = Setup()
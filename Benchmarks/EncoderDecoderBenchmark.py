@@ -0,0 +1,61 @@
+from AppData.EncoderDecoder import Serializable, Encoder, Decoder
+
+from PyQt6 import QtCore
+
+import json
+import time
+import typing
+
+
+class Entry(Serializable):
+    def __init__(self):
+        self.title = ""
+        self.url = QtCore.QUrl()
+        self.createdAt = QtCore.QDateTime.currentDateTimeUtc()
+        self.range = (None, None)
+        self.tags = []
+        self.details = {}
+
+
+class Document(Serializable):
+    def __init__(self):
+        self.version = "0.0.0"
+        self.entries = []
+
+
+def createDocument(entryCount: int) -> Document:
+    document = Document()
+    createdAt = QtCore.QDateTime.currentDateTimeUtc()
+    for index in range(entryCount):
+        entry = Entry()
+        entry.title = f"Entry {index}"
+        entry.url = QtCore.QUrl(f"https://www.twitch.tv/videos/{index}")
+        entry.createdAt = createdAt.addSecs(-index)
+        entry.range = (index * 1000, None)
+        entry.tags = ["stream", "video", str(index % 10)]
+        entry.details = {"files": index, "byteSize": index * 1024, "muted": index % 2 == 0}
+        document.entries.append(entry)
+    return document
+
+
+def measure(name: str, function: typing.Callable[[], typing.Any]) -> typing.Any:
+    startedAt = time.perf_counter()
+    result = function()
+    print(f"{name:<24}{(time.perf_counter() - startedAt) * 1000:>10.1f} ms")
+    return result
+
+
+def main(entryCount: int = 50000) -> None:
+    print(f"Entries: {entryCount}")
+    document = measure("create", lambda: createDocument(entryCount))
+    encoded = measure("encode", lambda: Encoder.encode(document))
+    text = measure("json.dumps", lambda: json.dumps(encoded, separators=(",", ":")))
+    print(f"{'size':<24}{len(text) / 1024 / 1024:>10.1f} MB")
+    data = measure("json.loads", lambda: json.loads(text))
+    measure("decode", lambda: Decoder.decode(data))
+    measure("copy", lambda: document.copy())
+    measure("encode/decode copy", lambda: Decoder.decode(Encoder.encode(document)))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+from Services.Profiling.Config import Config
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def getCommit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def runOnce(reportPath: str, timeout: int) -> dict:
+    environment = dict(os.environ)
+    environment[Config.ENVIRONMENT_VARIABLE] = Config.EXIT_VALUE
+    environment[Config.REPORT_ENVIRONMENT_VARIABLE] = reportPath
+    startedAt = time.perf_counter()
+    process = subprocess.run([sys.executable, os.path.join(APP_ROOT, "TwitchLink.py")], cwd=APP_ROOT, env=environment, timeout=timeout, check=False)
+    wallTime = (time.perf_counter() - startedAt) * 1000
+    if not os.path.isfile(reportPath):
+        raise BenchmarkError(f"TwitchLink exited with code {process.returncode} without writing a startup report. If another TwitchLink instance is running, the benchmark run was handed off to it; close it and try again.")
+    with open(reportPath, encoding="utf-8") as file:
+        report = json.load(file)
+    os.remove(reportPath)
+    report["wall"] = wallTime
+    return report
+
+
+def summarize(reports: list[dict]) -> dict:
+    phases = {}
+    for report in reports:
+        for phase in report["phases"]:
+            if phase["duration"] != None:
+                phases.setdefault(phase["name"], []).append(phase["duration"])
+    return {
+        "wall": statistics.median(report["wall"] for report in reports),
+        "startup": statistics.median(report["total"] for report in reports),
+        "imports": statistics.median(report["imports"]["total"] for report in reports),
+        "phases": {name: statistics.median(values) for name, values in phases.items()}
+    }
+
+
+def loadPreviousResult(historyPath: str | None) -> dict | None:
+    if historyPath == None or not os.path.isfile(historyPath):
+        return None
+    with open(historyPath, encoding="utf-8") as file:
+        lines = [line for line in file.read().splitlines() if line.strip() != ""]
+    return json.loads(lines[-1]) if len(lines) != 0 else None
+
+
+def formatDelta(value: float, previousValue: float | None) -> str:
+    return "" if previousValue == None else f"{value - previousValue:>+10.1f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the cold-start time of TwitchLink.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=int, default=120)
+    parser.add_argument("--history", help="JSON lines file to compare against and append the result to.")
+    arguments = parser.parse_args()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            reports = [runOnce(os.path.join(directory, f"startup_{index}.json"), arguments.timeout) for index in range(arguments.runs)]
+    except BenchmarkError as e:
+        sys.exit(f"Startup benchmark failed: {e}")
+    result = {"commit": getCommit(), "runs": arguments.runs, **summarize(reports)}
+    previousResult = loadPreviousResult(arguments.history)
+    print(f"Commit: {result['commit']} ({arguments.runs} runs, median)" + ("" if previousResult == None else f" compared with {previousResult['commit']}"))
+    for name in ("wall", "startup", "imports"):
+        print(f"{name:<40}{result[name]:>10.1f} ms{formatDelta(result[name], None if previousResult == None else previousResult.get(name))}")
+    for name, value in sorted(result["phases"].items(), key=lambda item: item[1], reverse=True):
+        print(f"  {name:<38}{value:>10.1f} ms{formatDelta(value, None if previousResult == None else previousResult['phases'].get(name))}")
+    if arguments.history != None:
+        with open(arguments.history, "a", encoding="utf-8") as file:
+            file.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -2,10 +2,13 @@ from Core.Launcher import SingleApplicationLauncher
 from Core.SystemTrayIcon import SystemTrayIcon
 from Core.Notification import Notification
 from Core.Config import Config
+from Services.Profiling.StartupProfiler import Profiler
 
 from PyQt6 import QtCore, QtWidgets
 
 import sys
+import os
+import importlib
 
 
 class App(SingleApplicationLauncher):
@@ -13,78 +16,154 @@ class App(SingleApplicationLauncher):
 
     def __init__(self, appId: str, argv: list[str]):
         super().__init__(appId, argv)
-        self.systemTrayIcon = SystemTrayIcon(parent=self)
-        self.notification = Notification(self.systemTrayIcon, parent=self)
+        if self.isDownloadHost():
+            self.systemTrayIcon: SystemTrayIcon | None = None
+            self.notification: Notification | None = None
+        else:
+            self.systemTrayIcon = SystemTrayIcon(parent=self)
+            self.notification = Notification(self.systemTrayIcon, parent=self)
         self.mainWindow: QtWidgets.QMainWindow | None = None
 
     def start(self, mainWindow: QtWidgets.QMainWindow) -> int:
         self.mainWindow = mainWindow
+        self.logger.info(f"Main window created in {Profiler.getElapsed()} ms.")
+        QtCore.QTimer.singleShot(0, self._startupFinished)
         self.appStarted.emit()
         exitCode = self.exec()
         self.mainWindow = None
         return exitCode
 
+    def _startupFinished(self) -> None:
+        self.logger.info(f"Startup finished in {Profiler.getElapsed()} ms.")
+        if not Profiler.isEnabled():
+            return
+        try:
+            reportPath = Profiler.writeReport(f"{os.path.splitext(self.logger.getPath())[0]}_Startup.json")
+            self.logger.info(f"Startup profile saved to '{reportPath}'.")
+        except Exception as e:
+            self.logger.error("Unable to save startup profile.")
+            self.logger.exception(e)
+        if Profiler.isExitRequested():
+            self.exit()
+
     def exit(self, exitCode: int = 0) -> None:
         super().exit(exitCode)
 
     def restart(self) -> None:
         self.exit(self.EXIT_CODE.RESTART)
 
-Instance = App(Config.APP_ROOT, sys.argv)
-
-
-from Services.NetworkAccessManager import NetworkAccessManager as _NetworkAccessManager
-NetworkAccessManager = _NetworkAccessManager(parent=Instance)
-
-from Services.Twitch.GQL.TwitchGQLAPI import TwitchGQL as _TwitchGQL
-TwitchGQL = _TwitchGQL(parent=Instance)
-
-from Services.Translator.Translator import Translator as _Translator
-Translator = _Translator(parent=Instance)
-T = Translator.translate
-
-from Services.NotificationManager import NotificationManager as _NotificationManager
-Notifications = _NotificationManager(parent=Instance)
-
-from Services.ContentManager import ContentManager as _ContentManager
-ContentManager = _ContentManager(parent=Instance)
-
-from Services.Temp.TempManager import TempManager as _TempManager
-TempManager = _TempManager(logger=Instance.logger, parent=Instance)
-
-from Services.Image.Loader import ImageLoader as _ImageLoader
-ImageLoader = _ImageLoader(parent=Instance)
-
-from Services.PartnerContent.PartnerContentManager import PartnerContentManager as _PartnerContentManager
-PartnerContentManager = _PartnerContentManager(parent=Instance)
-
-from Services.Twitch.Authentication.Integrity.IntegrityGenerator import TwitchIntegrityGenerator as _TwitchIntegrityGenerator
-TwitchIntegrityGenerator = _TwitchIntegrityGenerator(logger=Instance.logger, parent=Instance)
-
-from Services.Account.TwitchAccount import TwitchAccount as _TwitchAccount
-Account = _TwitchAccount(parent=Instance)
-
-from Download.Downloader.Core.Engine.File.FileDownloadManager import FileDownloadManager as _FileDownloadManager
-FileDownloadManager = _FileDownloadManager(parent=Instance)
-
-from Download.DownloadManager import DownloadManager as _DownloadManager
-DownloadManager = _DownloadManager(parent=Instance)
-
-from Download.ScheduledDownloadPubSubManager import ScheduledDownloadPubSubManager as _ScheduledDownloadPubSubManager
-ScheduledDownloadPubSubManager = _ScheduledDownloadPubSubManager(logger=Instance.logger, parent=Instance)
-
-from Download.ScheduledDownloadManager import ScheduledDownloadManager as _ScheduledDownloadManager
-ScheduledDownloadManager = _ScheduledDownloadManager(parent=Instance)
-
-from Download.GlobalDownloadManager import GlobalDownloadManager as _GlobalDownloadManager
-GlobalDownloadManager = _GlobalDownloadManager(parent=Instance)
-
-from Download.History.DownloadHistoryManager import DownloadHistoryManager as _DownloadHistoryManager
-DownloadHistory = _DownloadHistoryManager(parent=Instance)
-
-from Core.Updater import Updater as _Updater
-Updater = _Updater(parent=Instance)
-
-from AppData.Preferences import Preferences as _Preferences
-Preferences = _Preferences(logger=Instance.logger, parent=Instance)
-Preferences.load()
\ No newline at end of file
+with Profiler.phase("Application"):
+    Instance = App(Config.APP_ROOT, sys.argv)
+
+
+_SERVICES = {
+    "NetworkAccessManager": ("Services.NetworkAccessManager", "NetworkAccessManager", False),
+    "TwitchGQL": ("Services.Twitch.GQL.TwitchGQLAPI", "TwitchGQL", False),
+    "Translator": ("Services.Translator.Translator", "Translator", False),
+    "Notifications": ("Services.NotificationManager", "NotificationManager", False),
+    "ContentManager": ("Services.ContentManager", "ContentManager", False),
+    "TempManager": ("Services.Temp.TempManager", "TempManager", True),
+    "ImageLoader": ("Services.Image.Loader", "ImageLoader", False),
+    "PartnerContentManager": ("Services.PartnerContent.PartnerContentManager", "PartnerContentManager", False),
+    "TwitchIntegrityGenerator": ("Services.Twitch.Authentication.Integrity.IntegrityGenerator", "TwitchIntegrityGenerator", True),
+    "Account": ("Services.Account.TwitchAccount", "TwitchAccount", False),
+    "RetryPolicy": ("Services.Retry.RetryPolicy", "RetryPolicy", True),
+    "DownloadReactor": ("Download.Downloader.Core.Engine.File.DownloadReactor", "DownloadReactor", False),
+    "FileDownloadManager": ("Download.Downloader.Core.Engine.File.FileDownloadManager", "FileDownloadManager", False),
+    "PlaylistHub": ("Download.Downloader.Core.Engine.Playlist.PlaylistHub", "PlaylistHub", False),
+    "SegmentCache": ("Download.Downloader.Core.Engine.Playlist.SegmentCache", "SegmentCache", True),
+    "DownloadManager": ("Download.DownloadManager", "DownloadManager", False),
+    "ScheduledDownloadPubSubManager": ("Download.ScheduledDownloadPubSubManager", "ScheduledDownloadPubSubManager", True),
+    "ScheduledDownloadManager": ("Download.ScheduledDownloadManager", "ScheduledDownloadManager", False),
+    "GlobalDownloadManager": ("Download.GlobalDownloadManager", "GlobalDownloadManager", False),
+    "DownloadHistory": ("Download.History.DownloadHistoryManager", "DownloadHistoryManager", True),
+    "Updater": ("Core.Updater", "Updater", False),
+    "Preferences": ("AppData.Preferences", "Preferences", True)
+}
+
+_EAGER_SERVICES = (
+    "NetworkAccessManager",
+    "TwitchGQL",
+    "Translator",
+    "Notifications",
+    "ContentManager",
+    "Account",
+    "RetryPolicy",
+    "DownloadReactor",
+    "FileDownloadManager",
+    "PlaylistHub",
+    "SegmentCache",
+    "DownloadManager",
+    "ScheduledDownloadManager",
+    "GlobalDownloadManager",
+    "DownloadHistory",
+    "Preferences"
+)
+
+_DOWNLOAD_HOST_SERVICES = (
+    "NetworkAccessManager",
+    "TwitchGQL",
+    "Translator",
+    "Account",
+    "RetryPolicy",
+    "DownloadReactor",
+    "FileDownloadManager",
+    "PlaylistHub",
+    "SegmentCache",
+    "Preferences"
+)
+
+_WARM_UP_SERVICES = (
+    "TempManager",
+    "TwitchIntegrityGenerator",
+    "ScheduledDownloadPubSubManager",
+    "PartnerContentManager"
+)
+
+
+def _createService(name: str) -> QtCore.QObject:
+    moduleName, className, hasLogger = _SERVICES.pop(name)
+    with Profiler.phase(f"Service {name}") as phase:
+        serviceClass = getattr(importlib.import_module(moduleName), className)
+        service = serviceClass(logger=Instance.logger, parent=Instance) if hasLogger else serviceClass(parent=Instance)
+    globals()[name] = service
+    Instance.logger.info(f"Service '{name}' created in {phase.getElapsed()} ms.")
+    return service
+
+
+def _warmUpServices(names: list[str]) -> None:
+    name = names.pop(0)
+    service = globals()[name] if name not in _SERVICES else _createService(name)
+    if hasattr(service, "warmUp"):
+        with Profiler.phase(f"Warm-up {name}") as phase:
+            service.warmUp()
+        Instance.logger.info(f"Service '{name}' warmed up in {phase.getElapsed()} ms.")
+    if len(names) != 0:
+        QtCore.QTimer.singleShot(0, lambda: _warmUpServices(names))
+
+
+def _scheduleWarmUp() -> None:
+    QtCore.QTimer.singleShot(Config.SERVICE_WARM_UP_DELAY, lambda: _warmUpServices(list(_WARM_UP_SERVICES)))
+
+
+def isServiceCreated(name: str) -> bool:
+    return name not in _SERVICES
+
+
+def __getattr__(name: str) -> object:
+    if name in _SERVICES:
+        return _createService(name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+for _name in _DOWNLOAD_HOST_SERVICES if Instance.isDownloadHost() else _EAGER_SERVICES:
+    _createService(_name)
+    if _name == "Translator":
+        T = globals()["Translator"].translate
+
+with Profiler.phase("Preferences load") as _phase:
+    globals()["Preferences"].load()
+Instance.logger.info(f"Preferences loaded in {_phase.getElapsed()} ms.")
+Instance.logger.info(f"Core services initialized in {Profiler.getElapsed()} ms.")
+if not Instance.isDownloadHost():
+    Instance.appStarted.connect(_scheduleWarmUp)
\ No newline at end of file
@@ -20,6 +20,7 @@ class Config(Meta):
 
     APPDATA_PATH = _P(os.getenv("APPDATA"), Meta.APP_NAME)
     APPDATA_FILE = _P(APPDATA_PATH, "settings.json")
+    HISTORY_DATABASE_FILE = _P(APPDATA_PATH, "history.db")
     TRACEBACK_FILE = _P(APPDATA_PATH, "traceback")
 
     TEMP_PATH = _P(os.getenv("TEMP"), Meta.APP_NAME)
@@ -38,5 +39,12 @@ class Config(Meta):
 
     SHOW_STATS = [50, [10, 30]]
 
+    DOWNLOAD_HOST_ARGUMENT = "--download-host"
+
+    PREFERENCES_SAVE_DELAY = 1000
+    PREFERENCES_AUTO_SAVE_INTERVAL = 10000
+
+    SERVICE_WARM_UP_DELAY = 1000
+
     APP_SHUTDOWN_TIMEOUT = 60
     SYSTEM_SHUTDOWN_TIMEOUT = 100
\ No newline at end of file
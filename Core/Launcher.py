@@ -31,8 +31,11 @@ class SingleApplicationLauncher(QtWidgets.QApplication):
         self.logger = Logger(fileName=f"{Config.APP_NAME}_{Logger.getFormattedTime()}#{uuid.uuid4()}.log")
         self.logger.info(f"\n\n{Config.getProjectInfo()}\n")
         self.logger.info(OSUtils.getOSInfo())
+        self._downloadHostServerName = argv[argv.index(Config.DOWNLOAD_HOST_ARGUMENT) + 1] if Config.DOWNLOAD_HOST_ARGUMENT in argv[:-1] else None
         self.shared = QtCore.QSharedMemory(appId, parent=self)
-        if self.shared.create(512, QtCore.QSharedMemory.AccessMode.ReadWrite):
+        if self.isDownloadHost():
+            self.logger.info(f"Application started as a download host for '{self._downloadHostServerName}'.")
+        elif self.shared.create(512, QtCore.QSharedMemory.AccessMode.ReadWrite):
             self.logger.info("Application started successfully.")
             self._server = QtNetwork.QLocalServer(parent=self)
             self._server.newConnection.connect(self.newInstanceStarted)
@@ -48,10 +51,19 @@ class SingleApplicationLauncher(QtWidgets.QApplication):
         self._started: QtCore.QDateTime | None = None
         self._crashed = False
 
+    def isDownloadHost(self) -> bool:
+        return self._downloadHostServerName != None
+
+    def getDownloadHostServerName(self) -> str | None:
+        return self._downloadHostServerName
+
     def _excepthook(self, exceptionType: typing.Type[BaseException], exception: BaseException, tracebackType: types.TracebackType | None) -> None:
         self.logger.critical("Unexpected Error", exc_info=(exceptionType, exception, tracebackType))
         if not self._crashed:
             self._crashed = True
+            if self.isDownloadHost():
+                self.exit(self.EXIT_CODE.UNEXPECTED_ERROR)
+                return
             try:
                 file = QtCore.QFile(Config.TRACEBACK_FILE, self)
                 file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
@@ -69,4 +81,5 @@ class SingleApplicationLauncher(QtWidgets.QApplication):
         returnCode = super().exec()
         self.logger.info(f"Application exited with exit code {returnCode}.")
         self.logger.info(f"All logs were written to '{self.logger.getPath()}'.")
+        Logger.flush()
         return returnCode
\ No newline at end of file
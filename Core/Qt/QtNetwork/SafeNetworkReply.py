@@ -72,6 +72,14 @@ class SafeNetworkReply(QtCore.QObject):
                 self._handleRuntimeError(e)
         return None
 
+    def rawHeader(self, headerName: bytes) -> QtCore.QByteArray:
+        if not self._hasRuntimeError():
+            try:
+                return self._reply.rawHeader(QtCore.QByteArray(headerName))
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+        return QtCore.QByteArray()
+
     def readAll(self) -> QtCore.QByteArray:
         if not self._hasRuntimeError():
             try:
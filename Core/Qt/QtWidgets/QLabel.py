@@ -13,6 +13,7 @@ class _QLabel(QtWidgets.QLabel):
         self._text = super().text()
         self._pixmap = super().pixmap()
         self._imageUrl = ""
+        self._imageLoadSize: QtCore.QSize | None = None
         self._imageLoading = False
         self.setKeepAspectRatio(False)
         self._imageSynced = False
@@ -24,11 +25,18 @@ class _QLabel(QtWidgets.QLabel):
         self._imageUrl = ImageUrlFormatter.formatUrl(url) if urlFormatSize == None else ImageUrlFormatter.formatUrl(url, *urlFormatSize)
         if self._imageUrl != "":
             self._imageLoading = True
-            App.ImageLoader.request(QtCore.QUrl(self._imageUrl), self._imageLoaded, refresh=refresh)
+            self._imageLoadSize = self._getImageLoadSize()
+            App.ImageLoader.request(QtCore.QUrl(self._imageUrl), self._imageLoaded, size=self._imageLoadSize, refresh=refresh)
 
     def getImageUrl(self) -> str:
         return self._imageUrl
 
+    def _getImageLoadSize(self) -> QtCore.QSize | None:
+        size = self.maximumSize()
+        if size.width() >= QtWidgets.QWIDGETSIZE_MAX or size.height() >= QtWidgets.QWIDGETSIZE_MAX:
+            return None
+        return size * self.devicePixelRatioF()
+
     def _imageLoaded(self, pixmap: QtGui.QPixmap) -> None:
         if not pixmap.isNull():
             self.setPixmap(pixmap)
@@ -62,7 +70,7 @@ class _QLabel(QtWidgets.QLabel):
 
     def cancelImageRequest(self) -> None:
         if self._imageLoading:
-            App.ImageLoader.cancelRequest(QtCore.QUrl(self._imageUrl), self._imageLoaded)
+            App.ImageLoader.cancelRequest(QtCore.QUrl(self._imageUrl), self._imageLoaded, size=self._imageLoadSize)
             self._imageLoading = False
 
     def setImageSizePolicy(self, minimumSize: QtCore.QSize, maximumSize: QtCore.QSize, keepAspectRatio: bool = True) -> None:
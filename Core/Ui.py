@@ -5,6 +5,7 @@ from Core.Config import Config
 from Services.Utils.Utils import Utils
 from Services.Image.Presets import *
 from Services import PartnerContent
+from Services.Profiling.StartupProfiler import Profiler
 
 from PyQt6 import QtCore, QtGui, QtWidgets, QtWebEngineWidgets, uic
 
@@ -37,7 +38,8 @@ class UiLoader:
     def load(cls, name: str, instance: QtWidgets.QWidget) -> typing.Any:
         if name not in cls.cache:
             try:
-                cls.cache[name] = uic.loadUiType(f"{Utils.joinPath(Config.UI_ROOT, name)}.ui")[0]
+                with Profiler.phase(f"UI {name}"):
+                    cls.cache[name] = uic.loadUiType(f"{Utils.joinPath(Config.UI_ROOT, name)}.ui")[0]
             except:
                 raise Exceptions.FileSystemError
         GeneratedClass = cls.cache[name]
@@ -271,6 +271,7 @@ class Updater(QtCore.QObject):
             from Services.Translator.Config import Config as TranslatorConfig
             from Services.Temp.Config import Config as TempConfig
             from Services.Logging.Config import Config as LogConfig
+            from Services.Retry.Config import Config as RetryConfig
             from Services.Twitch.Authentication.Integrity.IntegrityConfig import Config as IntegrityConfig
             from Services.Twitch.GQL.TwitchGQLConfig import Config as GQLConfig
             from Services.Twitch.Playback.TwitchPlaybackConfig import Config as PlaybackConfig
@@ -287,6 +288,7 @@ class Updater(QtCore.QObject):
                 "TRANSLATOR": TranslatorConfig,
                 "TEMP": TempConfig,
                 "LOG": LogConfig,
+                "RETRY": RetryConfig,
                 "INTEGRITY": IntegrityConfig,
                 "GQL": GQLConfig,
                 "PLAYBACK": PlaybackConfig,
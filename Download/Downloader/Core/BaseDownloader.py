@@ -1,6 +1,9 @@
 from .Engine import Modules
 from .Engine.BaseEngine import BaseEngine
+from .Engine.ProcessEngine import ProcessEngine
+from .Engine.Config import Config as EngineConfig
 
+from Core import App
 from Core.Config import Config
 from Core.GlobalExceptions import Exceptions
 from Download.DownloadInfo import DownloadInfo
@@ -53,8 +56,29 @@ class BaseDownloader(QtCore.QThread):
         self._abortRequested.connect(engine.abort)
         return engine
 
+    def getHostOptions(self) -> dict:
+        return {}
+
+    def setHostOptions(self, options: dict) -> None:
+        pass
+
+    def _createProcessEngine(self) -> ProcessEngine:
+        engine = ProcessEngine(
+            downloadInfo=self.downloadInfo,
+            status=self.status,
+            progress=self.progress,
+            logger=self.logger,
+            options=self.getHostOptions(),
+            parent=None
+        )
+        self._abortRequested.connect(engine.abort)
+        return engine
+
+    def _isProcessHostEnabled(self) -> bool:
+        return EngineConfig.PROCESS_HOST_ENABLED and not App.Instance.isDownloadHost()
+
     def run(self) -> None:
-        engine = self._createEngine()
+        engine = self._createProcessEngine() if self._isProcessHostEnabled() else self._createEngine()
         engine.finished.connect(self.exit)
         engine.start()
         self.exec()
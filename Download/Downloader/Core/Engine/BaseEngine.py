@@ -1,3 +1,5 @@
+from .Config import Config as EngineConfig
+
 from Core.Config import Config
 from Core.GlobalExceptions import Exceptions
 from Services.Logging.Logger import Logger
@@ -16,6 +18,10 @@ class BaseEngine(QtCore.QObject):
         self.status = status
         self.progress = progress
         self.logger = logger
+        self._progressSyncTimer = QtCore.QTimer(parent=self)
+        self._progressSyncTimer.setSingleShot(True)
+        self._progressSyncTimer.setInterval(EngineConfig.PROGRESS_SYNC_INTERVAL)
+        self._progressSyncTimer.timeout.connect(self.progress.sync)
         self._networkAccessManager = QtNetwork.QNetworkAccessManager(parent=self)
         self.file = QtCore.QFile(self.downloadInfo.getAbsoluteFileName(), self)
         self.file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
@@ -60,8 +66,10 @@ class BaseEngine(QtCore.QObject):
         return self.file.size() == 0
 
     def _syncStatus(self) -> None:
+        self._progressSyncTimer.stop()
         self.status.sync()
         self.progress.sync()
 
     def _syncProgress(self) -> None:
-        self.progress.sync()
\ No newline at end of file
+        if not self._progressSyncTimer.isActive():
+            self._progressSyncTimer.start()
\ No newline at end of file
@@ -2,20 +2,57 @@ class Config:
     PLAYLIST_REQUEST_TIMEOUT = 5000
     PLAYLIST_UPDATE_MAX_RETRY_COUNT = 10
     PLAYLIST_UPDATE_RETRY_INTERVAL = 3000
-    PLAYLIST_UPDATE_INTERVAL = 2000
+    PLAYLIST_UPDATE_MIN_INTERVAL = 1000
+    PLAYLIST_UPDATE_MAX_INTERVAL = 6000
+    PLAYLIST_HUB_ENABLED = True
+    PLAYLIST_HUB_MAX_AGE = 2000
 
     FILE_CHUNK_SIZE = 1024
     FILE_REQUEST_TIMEOUT = 10000
     FILE_REQUEST_MAX_RETRY_COUNT = 3
     FILE_REQUEST_RETRY_INTERVAL = 5000
+    FILE_REQUEST_MIN_RETRY_INTERVAL = 500
     FILE_DOWNLOAD_MANAGER_MIN_POOL_SIZE = 1
     FILE_DOWNLOAD_MANAGER_MAX_POOL_SIZE = 20
+    PROCESS_HOST_ENABLED = False
+
+    DOWNLOAD_REACTOR_ENABLED = True
+    DOWNLOAD_REACTOR_THREAD_COUNT = 4
+    DOWNLOAD_REACTOR_SHUTDOWN_TIMEOUT = 5000
+    PROGRESS_SYNC_INTERVAL = 250
 
     STREAM_SEGMENT_TITLE_FILTER_REGEX = ["^Amazon\|.*$"]
+    STREAM_PLAYBACK_RENEWAL_MAX_COUNT = 3
+    STREAM_PREFETCH_ENABLED = True
+    STREAM_SEGMENT_DEADLINE_GRACE = 10000
+    STREAM_HEDGE_ENABLED = True
+    STREAM_HEDGE_PERCENTILE = 95
+    STREAM_HEDGE_MIN_DELAY = 1000
+    STREAM_HEDGE_SAMPLE_SIZE = 100
+    STREAM_HEDGE_MIN_SAMPLE_SIZE = 10
+    STREAM_RECONNECT_INTERVAL = 2000
+    STREAM_RECONNECT_MAX_INTERVAL = 30000
+    STREAM_RECONNECT_TIMEOUT = 600000
+    STREAM_BACKFILL_ENABLED = True
+    STREAM_BACKFILL_MIN_LENGTH = 10000
+    STREAM_BACKFILL_TIMEOUT = 60000
+    STREAM_BACKFILL_VIDEO_SEARCH_LIMIT = 5
+    STREAM_BACKFILL_VIDEO_MATCH_TOLERANCE = 600000
+
+    SEGMENT_CACHE_ENABLED = False
+    SEGMENT_CACHE_MAX_SIZE = 2147483648
+
+    UNMUTE_PREDICTOR_MAX_DISTANCE = 30
+    UNMUTE_PROBE_BATCH_SIZE = 20
 
     UPDATE_TRACK_MAX_RETRY_COUNT = 5
     UPDATE_TRACK_INTERVAL = 120000
+    UPDATE_TRACK_MIN_INTERVAL = 10000
 
     PIPE_TIMEOUT = 3000
 
-    CHANNEL_AUTO_UPDATE_INTERVAL = 180000
\ No newline at end of file
+    CHANNEL_AUTO_UPDATE_INTERVAL = 180000
+
+    CHANNEL_STANDBY_ENABLED = True
+    CHANNEL_STANDBY_UPDATE_INTERVAL = 60000
+    CHANNEL_STANDBY_TOKEN_EXPIRATION_MARGIN = 120
\ No newline at end of file
@@ -0,0 +1,79 @@
+from ..Config import Config
+
+from Core import App
+
+from PyQt6 import QtCore, QtNetwork
+
+
+class DownloadWorker(QtCore.QObject):
+    connectRequested = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.networkAccessManager = QtNetwork.QNetworkAccessManager(parent=self)
+        self.load = 0
+        self.connectRequested.connect(self._connectToHost)
+
+    def _connectToHost(self, hostName: str) -> None:
+        self.networkAccessManager.connectToHostEncrypted(hostName)
+
+
+class DownloadReactor(QtCore.QObject):
+    shutdownRequested = QtCore.pyqtSignal()
+    _workersReleased = QtCore.pyqtSignal()
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._mutex = QtCore.QMutex()
+        self._threads: list[QtCore.QThread] = []
+        self._workers: list[DownloadWorker] = []
+        for index in range(max(Config.DOWNLOAD_REACTOR_THREAD_COUNT, 1)):
+            thread = QtCore.QThread(parent=self)
+            thread.setObjectName(f"DownloadReactor_{index}")
+            worker = DownloadWorker()
+            worker.moveToThread(thread)
+            thread.finished.connect(worker.deleteLater)
+            thread.start()
+            self._threads.append(thread)
+            self._workers.append(worker)
+        App.Instance.aboutToQuit.connect(self.shutdown)
+
+    def acquireWorker(self) -> DownloadWorker:
+        with QtCore.QMutexLocker(self._mutex):
+            worker = min(self._workers, key=lambda worker: worker.load)
+            worker.load += 1
+            return worker
+
+    def releaseWorker(self, worker: DownloadWorker) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            worker.load -= 1
+            released = all(worker.load == 0 for worker in self._workers)
+        if released:
+            self._workersReleased.emit()
+
+    def connectToHostEncrypted(self, hostName: str) -> None:
+        for worker in self._workers:
+            worker.connectRequested.emit(hostName)
+
+    def getThreadCount(self) -> int:
+        return len(self._threads)
+
+    def getLoad(self) -> int:
+        with QtCore.QMutexLocker(self._mutex):
+            return sum(worker.load for worker in self._workers)
+
+    def shutdown(self) -> None:
+        eventLoop = QtCore.QEventLoop()
+        timeoutTimer = QtCore.QTimer(parent=eventLoop)
+        timeoutTimer.setSingleShot(True)
+        timeoutTimer.timeout.connect(eventLoop.quit)
+        self._workersReleased.connect(eventLoop.quit)
+        self.shutdownRequested.emit()
+        if self.getLoad() != 0:
+            timeoutTimer.start(Config.DOWNLOAD_REACTOR_SHUTDOWN_TIMEOUT)
+            eventLoop.exec()
+        self._workersReleased.disconnect(eventLoop.quit)
+        for thread in self._threads:
+            thread.quit()
+        for thread in self._threads:
+            thread.wait()
\ No newline at end of file
@@ -15,6 +15,7 @@ class FileDownloadManager(QtCore.QObject):
         super().__init__(parent=parent)
         self._poolSize = poolSize
         self._queue = PriorityQueue()
+        self._deadlineQueue = PriorityQueue()
         self._pool = []
         self._tempPool = []
         self._startRequested.connect(self._startDownloadHandler)
@@ -28,9 +29,22 @@ class FileDownloadManager(QtCore.QObject):
 
     def _startDownloadHandler(self, fileDownloaders: typing.Iterable[FileDownloader]) -> None:
         for fileDownloader in fileDownloaders:
-            self._queue.push(fileDownloader, priority=fileDownloader.getPriority())
+            if not self._isScheduled(fileDownloader):
+                self._push(fileDownloader)
         self._updateState()
 
+    def _isScheduled(self, fileDownloader: FileDownloader) -> bool:
+        return fileDownloader.isFinished() or fileDownloader in self._pool or fileDownloader in self._tempPool or fileDownloader in self._queue or fileDownloader in self._deadlineQueue
+
+    def _push(self, fileDownloader: FileDownloader) -> None:
+        if fileDownloader.getDeadline() == None:
+            self._queue.push(fileDownloader, priority=fileDownloader.getPriority())
+        else:
+            self._deadlineQueue.push(fileDownloader, priority=-fileDownloader.getDeadline().toMSecsSinceEpoch())
+
+    def _pop(self) -> FileDownloader:
+        return self._deadlineQueue.pop() if len(self._deadlineQueue) != 0 else self._queue.pop()
+
     def cancelDownload(self, fileDownloader: FileDownloader) -> None:
         self._cancelRequested.emit([fileDownloader])
 
@@ -39,6 +53,7 @@ class FileDownloadManager(QtCore.QObject):
 
     def _cancelDownloadHandler(self, fileDownloaders: typing.Iterable[FileDownloader]) -> None:
         self._queue.removeItems([fileDownloader for fileDownloader in fileDownloaders if fileDownloader in self._queue])
+        self._deadlineQueue.removeItems([fileDownloader for fileDownloader in fileDownloaders if fileDownloader in self._deadlineQueue])
         for fileDownloader in fileDownloaders:
             fileDownloader.abort()
 
@@ -50,8 +65,8 @@ class FileDownloadManager(QtCore.QObject):
         return self._poolSize
 
     def _updateState(self) -> None:
-        while len(self._pool) < self._poolSize and len(self._queue) != 0:
-            downloader = self._queue.pop()
+        while len(self._pool) < self._poolSize and len(self._queue) + len(self._deadlineQueue) != 0:
+            downloader = self._pop()
             downloader.finished.connect(self._removeFromPool)
             downloader._retryRequired.connect(self._downloadRetryRequired)
             downloader._retryRequested.connect(self._downloadRetryRequested)
@@ -80,5 +95,5 @@ class FileDownloadManager(QtCore.QObject):
 
     def _downloadRetryRequested(self, downloader: FileDownloader) -> None:
         self._removeFromTempPool(downloader)
-        self._queue.push(downloader, priority=downloader.getPriority())
+        self._push(downloader)
         self._updateState()
\ No newline at end of file
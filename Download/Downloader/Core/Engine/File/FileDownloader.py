@@ -1,8 +1,11 @@
 from ..Config import Config
 
+from .DownloadReactor import DownloadWorker
+
+from Core import App
 from Core.GlobalExceptions import Exceptions
 
-from PyQt6 import QtCore, QtNetwork
+from PyQt6 import QtCore, QtNetwork, sip
 
 
 class FileDownloader(QtCore.QObject):
@@ -13,12 +16,14 @@ class FileDownloader(QtCore.QObject):
     _abortRequested = QtCore.pyqtSignal(object)
     _retryRequired = QtCore.pyqtSignal(object)
     _retryRequested = QtCore.pyqtSignal(object)
+    _movedToHomeThread = QtCore.pyqtSignal()
 
     def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, url: QtCore.QUrl, filePath: str, priority: int = 0, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self.url = url
         self.filePath = filePath
         self._priority = priority
+        self._deadline: QtCore.QDateTime | None = None
         self.file = QtCore.QFile(self.filePath, self)
         self.bytesReceived = 0
         self.bytesTotal = 0
@@ -29,21 +34,82 @@ class FileDownloader(QtCore.QObject):
         self._error: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError | None = None
         self._retryScheduled: bool = False
         self._retryCount = 0
+        self._finishRequested = False
         self._finished = False
+        self._discarded = False
         self._retryTimer = QtCore.QTimer(parent=self)
         self._retryTimer.setSingleShot(True)
         self._retryTimer.timeout.connect(self._retryTimerTimeout)
-        self._startRequested.connect(self._startHandler)
+        self._worker: DownloadWorker | None = None
+        self._homeThread: QtCore.QThread | None = None
+        self._homeParent: QtCore.QObject | None = None
+        self._startRequested.connect(self._startRequestedHandler)
         self._abortRequested.connect(self._abortHandler)
+        self._movedToHomeThread.connect(self._movedToHomeThreadHandler)
 
     def getPriority(self) -> int:
         return self._priority * (Config.FILE_REQUEST_MAX_RETRY_COUNT + 1) + self._retryCount
 
+    def setDeadline(self, deadline: QtCore.QDateTime | None) -> None:
+        self._deadline = deadline
+
+    def getDeadline(self) -> QtCore.QDateTime | None:
+        return self._deadline
+
+    def getRemainingTime(self) -> int | None:
+        return None if self._deadline == None else QtCore.QDateTime.currentDateTimeUtc().msecsTo(self._deadline)
+
+    def isExpired(self) -> bool:
+        return self._deadline != None and self.getRemainingTime() <= 0
+
+    def _getRetryInterval(self) -> int:
+        interval = max(App.RetryPolicy.getBackoff(self._retryCount, baseDelay=Config.FILE_REQUEST_RETRY_INTERVAL), App.RetryPolicy.getWaitTime(self.url))
+        if self._deadline == None:
+            return interval
+        remainingTime = self.getRemainingTime() // (Config.FILE_REQUEST_MAX_RETRY_COUNT - self._retryCount + 1)
+        return max(min(interval, remainingTime), Config.FILE_REQUEST_MIN_RETRY_INTERVAL)
+
     def start(self) -> None:
         self._startRequested.emit()
 
+    def _startRequestedHandler(self) -> None:
+        if self._worker == None and Config.DOWNLOAD_REACTOR_ENABLED and not self._finishRequested:
+            self._moveToWorker()
+            self._startRequested.emit()
+        else:
+            self._startHandler()
+
+    def _moveToWorker(self) -> None:
+        self._worker = App.DownloadReactor.acquireWorker()
+        self._homeThread = self.thread()
+        self._homeParent = self.parent()
+        self._networkAccessManager = self._worker.networkAccessManager
+        App.DownloadReactor.shutdownRequested.connect(self.abort)
+        self.setParent(None)
+        self.moveToThread(self._worker.thread())
+
+    def _moveToHomeThread(self) -> None:
+        if self._worker != None:
+            App.DownloadReactor.shutdownRequested.disconnect(self.abort)
+            App.DownloadReactor.releaseWorker(self._worker)
+            self._worker = None
+            self.moveToThread(self._homeThread)
+            self._movedToHomeThread.emit()
+
+    def _movedToHomeThreadHandler(self) -> None:
+        if self._homeParent != None:
+            if self.parent() == None and not self._discarded and not sip.isdeleted(self._homeParent):
+                self.setParent(self._homeParent)
+            self._homeParent = None
+        self._finishedHandler()
+
     def _startHandler(self) -> None:
         if self._reply == None:
+            if not App.RetryPolicy.allowRequest(self.url):
+                self._retryScheduled = True
+                self._retryRequired.emit(self)
+                self._retryTimer.start(App.RetryPolicy.getWaitTime(self.url))
+                return
             self._setDownloadProgress(0, 0)
             if not self.file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly):
                 self._raiseException(Exceptions.FileSystemError(self.file))
@@ -76,29 +142,44 @@ class FileDownloader(QtCore.QObject):
 
     def _onFinished(self) -> None:
         self.file.close()
-        self._reply = None
+        self._releaseReply()
         if self._retryScheduled:
             self.file.remove()
         elif self._error == None:
+            App.RetryPolicy.recordSuccess(self.url)
             self._setFinished()
 
     def _onNetworkError(self, error: QtNetwork.QNetworkReply.NetworkError) -> None:
         self._raiseException(Exceptions.NetworkError(self._reply))
 
+    def _releaseReply(self) -> None:
+        if self._reply != None:
+            reply = self._reply
+            self._reply = None
+            for signal in (reply.readyRead, reply.downloadProgress, reply.errorOccurred, reply.finished):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass
+            reply.deleteLater()
+
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError) -> None:
         if self._error != None:
             return
         self._error = exception
         if self._reply != None:
             self._reply.abort()
+            self._releaseReply()
         if self._retryTimer.isActive():
             self._retryTimer.stop()
-        if isinstance(exception, Exceptions.NetworkError) and self._retryCount < Config.FILE_REQUEST_MAX_RETRY_COUNT:
+        if isinstance(exception, Exceptions.NetworkError):
+            App.RetryPolicy.recordFailure(self.url, exception.reasonCode)
+        if isinstance(exception, Exceptions.NetworkError) and self._retryCount < Config.FILE_REQUEST_MAX_RETRY_COUNT and not self.isExpired() and App.RetryPolicy.acquireRetry():
             self._retryCount += 1
             self._retryScheduled = True
             self._error = None
             self._retryRequired.emit(self)
-            self._retryTimer.start(self._retryCount * Config.FILE_REQUEST_RETRY_INTERVAL)
+            self._retryTimer.start(self._getRetryInterval())
         else:
             self.errorOccurred.emit(self)
             self._setFinished()
@@ -109,9 +190,20 @@ class FileDownloader(QtCore.QObject):
             self._retryRequested.emit(self)
 
     def _setFinished(self) -> None:
-        if not self._finished:
-            self._finished = True
-            self.finished.emit(self)
+        if not self._finishRequested:
+            self._finishRequested = True
+            if self._worker == None:
+                self._finishedHandler()
+            else:
+                self._moveToHomeThread()
+
+    def _finishedHandler(self) -> None:
+        self._finished = True
+        self.finished.emit(self)
 
     def isFinished(self) -> bool:
-        return self._finished
\ No newline at end of file
+        return self._finished
+
+    def discard(self) -> None:
+        self._discarded = True
+        self.file.remove()
\ No newline at end of file
@@ -0,0 +1,21 @@
+from PyQt6 import QtCore
+
+import collections
+
+
+class LatencyTracker:
+    def __init__(self, sampleSize: int = 100, minSampleSize: int = 10):
+        self._samples: collections.deque[int] = collections.deque(maxlen=sampleSize)
+        self._minSampleSize = minSampleSize
+        self._mutex = QtCore.QMutex()
+
+    def addSample(self, milliseconds: int) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            self._samples.append(milliseconds)
+
+    def getPercentile(self, percentile: int) -> int | None:
+        with QtCore.QMutexLocker(self._mutex):
+            if len(self._samples) < self._minSampleSize:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) * percentile // 100, len(samples) - 1)]
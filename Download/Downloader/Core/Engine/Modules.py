@@ -107,6 +107,30 @@ class Status(QtCore.QObject):
     def isFileRemoved(self) -> bool:
         return self._fileRemoved
 
+    def getSnapshot(self) -> dict:
+        return {
+            "status": self._status,
+            "pauseState": self.pauseState._state.value,
+            "terminateState": self.terminateState._state.value,
+            "nextUpdate": None if self._nextUpdate == None else self._nextUpdate.toMSecsSinceEpoch(),
+            "waitingCount": self._waitingCount,
+            "fileRemoved": self._fileRemoved
+        }
+
+    def applySnapshot(self, snapshot: dict, error: Exception | None) -> None:
+        if snapshot["status"] not in (Status.PREPARING, Status.DOWNLOADING, Status.DONE):
+            raise ValueError(snapshot["status"])
+        pauseState = State.Types(snapshot["pauseState"])
+        terminateState = State.Types(snapshot["terminateState"])
+        nextUpdate = None if snapshot["nextUpdate"] == None else QtCore.QDateTime.fromMSecsSinceEpoch(int(snapshot["nextUpdate"]))
+        self._status = snapshot["status"]
+        self.pauseState._state = pauseState
+        self.terminateState._state = terminateState
+        self._nextUpdate = nextUpdate
+        self._waitingCount = int(snapshot["waitingCount"])
+        self._fileRemoved = bool(snapshot["fileRemoved"])
+        self._error = error
+
     def sync(self) -> None:
         self.updated.emit()
 
@@ -126,6 +150,14 @@ class Progress(QtCore.QObject):
         self.mutedMilliseconds = 0
         self.skippedMilliseconds = 0
         self.missingMilliseconds = 0
+        self.gaps = 0
+        self.gapFiles = 0
+        self.gapMilliseconds = 0
+        self.expiredFiles = 0
+        self.expiredMilliseconds = 0
+        self.hedgedFiles = 0
+        self.hedgeWonFiles = 0
+        self.liveEdgeLatency = 0
         self.byteSize = 0
         self.totalByteSize = 0
 
@@ -153,5 +185,13 @@ class Progress(QtCore.QObject):
     def totalSize(self) -> str:
         return Utils.formatByteSize(self.totalByteSize)
 
+    def getSnapshot(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if type(value) in (int, float)}
+
+    def applySnapshot(self, snapshot: dict) -> None:
+        for key, value in snapshot.items():
+            if key in self.__dict__ and type(value) in (int, float):
+                self.__dict__[key] = value
+
     def sync(self) -> None:
         self.updated.emit()
\ No newline at end of file
@@ -1,39 +1,43 @@
 from ..Config import Config
-from ..File import FileDownloadManager
+from .SegmentDownloader import SegmentDownloader
+from .MutedSegmentPredictor import MutedSegmentPredictor
 
+from Core import App
 from Core.GlobalExceptions import Exceptions
 from Services.Playlist.Segment import Segment
 
 from PyQt6 import QtCore, QtNetwork
 
 
-class MutableSegmentDownloader(FileDownloadManager.FileDownloader):
-    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, parent: QtCore.QObject | None = None):
-        self.segment = segment
-        fileName = self.segment.url.fileName()
-        if "." in fileName:
-            name, extension = fileName.rsplit(".", 1)
-        else:
-            name = fileName
-            extension = None
-        for key in ["-muted", "-unmuted"]:
-            if name.endswith(key):
-                name = name.rsplit(key, 1)[0]
-                break
-        if extension == None:
-            self._originalUrl = self.segment.url.resolved(QtCore.QUrl(name))
-            self._mutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-muted"))
-            self._unmutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-unmuted"))
-        else:
-            self._originalUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}.{extension}"))
-            self._mutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-muted.{extension}"))
-            self._unmutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-unmuted.{extension}"))
-        super().__init__(networkAccessManager, self._originalUrl, filePath, priority=priority, parent=parent)
-        self._unmuted = False
-        self._muted = False
+class MutableSegmentDownloader(SegmentDownloader):
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, cacheKey: str | None = None, predictor: MutedSegmentPredictor | None = None, parent: QtCore.QObject | None = None):
+        super().__init__(networkAccessManager, segment, filePath, priority=priority, cacheKey=cacheKey, parent=parent)
+        self._urls = MutedSegmentPredictor.getVariantUrls(self.segment.url)
+        self.url = self._urls[MutedSegmentPredictor.ORIGINAL]
+        self._request.setUrl(self.url)
+        self._predictor = predictor
+        self._variants = list(MutedSegmentPredictor.VARIANTS)
+        self._variantIndex = 0
 
     def getPriority(self) -> int:
-        return super().getPriority() + 1 if self._unmuted or self._muted else 0
+        return super().getPriority() + 1 if self._variantIndex != 0 else 0
+
+    def _setVariantIndex(self, index: int) -> None:
+        self._variantIndex = index
+        self.url = self._urls[self._variants[self._variantIndex]]
+        self._request.setUrl(self.url)
+
+    def _startHandler(self) -> None:
+        if self._reply == None and self._variantIndex == 0 and self._predictor != None:
+            self._variants = self._predictor.getVariants(self.segment.sequence)
+            self._setVariantIndex(0)
+        super()._startHandler()
+
+    def _onFinished(self) -> None:
+        if self._error == None and not self._retryScheduled and self._predictor != None:
+            self._predictor.record(self.segment.sequence, self._variants[self._variantIndex])
+            self._predictor.addRequest(self._variants[self._variantIndex])
+        super()._onFinished()
 
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError) -> None:
         if self._error != None:
@@ -43,30 +47,33 @@ class MutableSegmentDownloader(FileDownloadManager.FileDownloader):
             self._reply.abort()
         if self._retryTimer.isActive():
             self._retryTimer.stop()
-        if isinstance(exception, Exceptions.NetworkError) and (self._unmuted == False or self._muted == False):
+        if isinstance(exception, Exceptions.NetworkError):
+            App.RetryPolicy.recordFailure(self.url, exception.reasonCode)
+        if isinstance(exception, Exceptions.NetworkError) and self._variantIndex < len(self._variants) - 1:
+            if self._predictor != None:
+                self._predictor.addWastedRequest()
             self._retryScheduled = True
             self._error = None
-            if self._unmuted == False:
-                self._unmuted = True
-                self.url = self._unmutedUrl
-            else:
-                self._muted = True
-                self.url = self._mutedUrl
-            self._request.setUrl(self.url)
+            self._setVariantIndex(self._variantIndex + 1)
             self._retryRequired.emit(self)
             self._retryTimerTimeout()
-        elif isinstance(exception, Exceptions.NetworkError) and self._retryCount < Config.FILE_REQUEST_MAX_RETRY_COUNT:
-            self._unmuted = False
-            self._muted = False
+        elif isinstance(exception, Exceptions.NetworkError) and self._retryCount < Config.FILE_REQUEST_MAX_RETRY_COUNT and App.RetryPolicy.acquireRetry():
+            if self._predictor != None:
+                self._predictor.addWastedRequest()
             self._retryCount += 1
             self._retryScheduled = True
             self._error = None
-            self._request.setUrl(self._originalUrl)
+            self._setVariantIndex(0)
             self._retryRequired.emit(self)
-            self._retryTimer.start(self._retryCount * Config.FILE_REQUEST_RETRY_INTERVAL)
+            self._retryTimer.start(self._getRetryInterval())
         else:
             self.errorOccurred.emit(self)
             self._setFinished()
 
+    def _setFinished(self) -> None:
+        if self.isMuted():
+            self._cacheKey = None
+        super()._setFinished()
+
     def isMuted(self) -> bool:
-        return self._muted
\ No newline at end of file
+        return not self._cached and self._variants[self._variantIndex] == MutedSegmentPredictor.MUTED
\ No newline at end of file
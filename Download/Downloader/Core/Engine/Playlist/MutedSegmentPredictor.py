@@ -0,0 +1,140 @@
+from ..Config import Config
+
+from Services.Playlist.Segment import Segment
+
+from PyQt6 import QtCore, QtNetwork
+
+import bisect
+
+
+class MutedSegmentProbe(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, variants: list[str], url: QtCore.QUrl, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.segment = segment
+        self.variants = variants
+        self._request = QtNetwork.QNetworkRequest(url)
+        self._request.setTransferTimeout(Config.FILE_REQUEST_TIMEOUT)
+        self._reply = networkAccessManager.head(self._request)
+        self._reply.finished.connect(self._replyFinished)
+        self._found = False
+        self._rejected = False
+
+    def _replyFinished(self) -> None:
+        self._found = self._reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError
+        self._rejected = not self._found and self._reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) != None
+        self._reply = None
+        self.finished.emit(self)
+
+    def isFound(self) -> bool:
+        return self._found
+
+    def isRejected(self) -> bool:
+        return self._rejected
+
+    def abort(self) -> None:
+        if self._reply != None:
+            self._reply.abort()
+
+
+class MutedSegmentPredictor(QtCore.QObject):
+    ORIGINAL = "original"
+    UNMUTED = "unmuted"
+    MUTED = "muted"
+    VARIANTS = (ORIGINAL, UNMUTED, MUTED)
+
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._networkAccessManager = networkAccessManager
+        self._mutex = QtCore.QMutex()
+        self._sequences: list[int] = []
+        self._variants: dict[int, str] = {}
+        self._probes: list[MutedSegmentProbe] = []
+        self.requests = 0
+        self.wastedRequests = 0
+        self.baselineWastedRequests = 0
+        self.probeRequests = 0
+
+    @classmethod
+    def getVariantUrls(cls, url: QtCore.QUrl) -> dict[str, QtCore.QUrl]:
+        fileName = url.fileName()
+        if "." in fileName:
+            name, extension = fileName.rsplit(".", 1)
+            extension = f".{extension}"
+        else:
+            name = fileName
+            extension = ""
+        for key in ["-muted", "-unmuted"]:
+            if name.endswith(key):
+                name = name.rsplit(key, 1)[0]
+                break
+        return {
+            cls.ORIGINAL: url.resolved(QtCore.QUrl(f"{name}{extension}")),
+            cls.UNMUTED: url.resolved(QtCore.QUrl(f"{name}-unmuted{extension}")),
+            cls.MUTED: url.resolved(QtCore.QUrl(f"{name}-muted{extension}"))
+        }
+
+    def record(self, sequence: int, variant: str) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            if sequence not in self._variants:
+                bisect.insort(self._sequences, sequence)
+            self._variants[sequence] = variant
+
+    def isRecorded(self, sequence: int) -> bool:
+        with QtCore.QMutexLocker(self._mutex):
+            return sequence in self._variants
+
+    def addRequest(self, variant: str) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            self.requests += 1
+            self.baselineWastedRequests += self.VARIANTS.index(variant)
+
+    def addWastedRequest(self) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            self.requests += 1
+            self.wastedRequests += 1
+
+    def predict(self, sequence: int) -> str:
+        with QtCore.QMutexLocker(self._mutex):
+            index = bisect.bisect_left(self._sequences, sequence)
+            neighbours = [self._sequences[i] for i in (index - 1, index) if 0 <= i < len(self._sequences)]
+            if len(neighbours) == 0:
+                return self.ORIGINAL
+            nearest = min(neighbours, key=lambda neighbour: abs(neighbour - sequence))
+            return self._variants[nearest] if abs(nearest - sequence) <= Config.UNMUTE_PREDICTOR_MAX_DISTANCE else self.ORIGINAL
+
+    def getVariants(self, sequence: int) -> list[str]:
+        predicted = self.predict(sequence)
+        return [predicted] + [variant for variant in self.VARIANTS if variant != predicted]
+
+    def probe(self, segments: list[Segment]) -> None:
+        for index in range(0, len(segments), Config.UNMUTE_PROBE_BATCH_SIZE):
+            segment = segments[index]
+            if not self.isRecorded(segment.sequence):
+                self._sendProbe(segment, self.getVariants(segment.sequence))
+
+    def _sendProbe(self, segment: Segment, variants: list[str]) -> None:
+        self.probeRequests += 1
+        probe = MutedSegmentProbe(self._networkAccessManager, segment, variants, self.getVariantUrls(segment.url)[variants[0]], parent=self)
+        probe.finished.connect(self._probeFinished)
+        self._probes.append(probe)
+
+    def _probeFinished(self, probe: MutedSegmentProbe) -> None:
+        if probe not in self._probes:
+            return
+        self._probes.remove(probe)
+        probe.setParent(None)
+        if probe.isFound():
+            self.record(probe.segment.sequence, probe.variants[0])
+        elif probe.isRejected() and len(probe.variants) > 1 and not self.isRecorded(probe.segment.sequence):
+            self._sendProbe(probe.segment, probe.variants[1:])
+
+    def abort(self) -> None:
+        probes = self._probes
+        self._probes = []
+        for probe in probes:
+            probe.abort()
+
+    def getReport(self) -> str:
+        return f"<Requests: {self.requests} / Wasted: {self.wastedRequests} / Wasted Without Prediction: {self.baselineWastedRequests} / Probes: {self.probeRequests}>"
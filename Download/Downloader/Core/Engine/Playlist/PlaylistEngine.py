@@ -1,6 +1,7 @@
 from ..Config import Config
 from ..BaseEngine import BaseEngine
 from .SegmentDownloader import SegmentDownloader
+from .RefreshScheduler import RefreshScheduler
 from ..FFmpeg.FFmpeg import FFmpeg
 
 from Core import App
@@ -25,16 +26,22 @@ class PlaylistEngine(BaseEngine):
         self._playlistManager = PlaylistManager(self._networkAccessManager, self.downloadInfo.getUrl(), timeout=Config.PLAYLIST_REQUEST_TIMEOUT, maxRetryCount=Config.PLAYLIST_UPDATE_MAX_RETRY_COUNT, retryInterval=Config.PLAYLIST_UPDATE_RETRY_INTERVAL, parent=self)
         self._playlistManager.errorOccurred.connect(self._playlistManagerErrorOccurred)
         self._playlistManager.playlistUpdated.connect(self._playlistUpdated)
+        if Config.PLAYLIST_HUB_ENABLED and self._getPlaylistShareKey() != None:
+            self._playlistManager.setHub(App.PlaylistHub, self._getPlaylistShareKey())
         self._safeTempDirectory: SafeTempDirectory | None = None
         self._FFmpeg: FFmpeg | None = None
         self._segmentDownloaders: list[SegmentDownloader] = []
         self._refreshTimer = QtCore.QTimer(parent=self)
         self._refreshTimer.setSingleShot(True)
-        self._refreshTimer.setInterval(Config.PLAYLIST_UPDATE_INTERVAL)
         self._refreshTimer.timeout.connect(self._updatePlaylist)
+        self._refreshScheduler = RefreshScheduler(Config.PLAYLIST_UPDATE_MIN_INTERVAL, Config.PLAYLIST_UPDATE_MAX_INTERVAL)
 
     def start(self) -> None:
         super().start()
+        if self.downloadInfo.getUrl().scheme() == "https":
+            self._networkAccessManager.connectToHostEncrypted(self.downloadInfo.getUrl().host())
+            if Config.DOWNLOAD_REACTOR_ENABLED:
+                App.DownloadReactor.connectToHostEncrypted(self.downloadInfo.getUrl().host())
         self._safeTempDirectory = SafeTempDirectory(self.downloadInfo.directory, parent=self)
         if self._safeTempDirectory.getError() == None:
             self.logger.info(f"Using Temp Directory: {self._safeTempDirectory.path()}")
@@ -69,6 +76,15 @@ class PlaylistEngine(BaseEngine):
         else:
             self._raiseException(exception)
 
+    def _getPlaylistShareKey(self) -> str | None:
+        return self.downloadInfo.getUrl().adjusted(QtCore.QUrl.UrlFormattingOption.RemoveQuery | QtCore.QUrl.UrlFormattingOption.RemoveFragment).toString()
+
+    def _getSegmentShareKey(self, segment: Segment) -> str | None:
+        return segment.url.toString() if Config.PLAYLIST_HUB_ENABLED else None
+
+    def _getSegmentCacheKey(self, segment: Segment) -> str | None:
+        return None
+
     def _updatePlaylist(self) -> None:
         self._playlistManager.update()
 
@@ -77,9 +93,12 @@ class PlaylistEngine(BaseEngine):
 
     def _playlistUpdated(self) -> None:
         if self.status.terminateState.isFalse():
-            if self._playlistManager.hasNewSegments():
+            changed = self._playlistManager.hasNewSegments()
+            discontinuity = False
+            if changed:
                 segmentsToDownload = []
                 for segment in self._playlistManager.getNewSegments():
+                    discontinuity = discontinuity or segment.discontinuity
                     self.progress.totalFiles += 1
                     self.progress.totalMilliseconds += segment.totalMilliseconds
                     if self.downloadInfo.type.isStream() and self.downloadInfo.isSkipAdsEnabled() and any(re.match(filter, segment.title) for filter in Config.STREAM_SEGMENT_TITLE_FILTER_REGEX):
@@ -93,7 +112,10 @@ class PlaylistEngine(BaseEngine):
             if self._playlistManager.playlist.isEndList():
                 self._checkDone()
             else:
-                self._refreshTimer.start()
+                self._refreshTimer.start(self._getRefreshInterval(changed, discontinuity))
+
+    def _getRefreshInterval(self, changed: bool, discontinuity: bool) -> int:
+        return self._refreshScheduler.getInterval(self._playlistManager.playlist, changed, discontinuity)
 
     def _downloadSegments(self, segments: list[Segment]) -> None:
         segmentDownloaders = []
@@ -111,6 +133,8 @@ class PlaylistEngine(BaseEngine):
             segment,
             Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.ts"),
             priority=self.downloadInfo.getPriority(),
+            shareKey=self._getSegmentShareKey(segment),
+            cacheKey=self._getSegmentCacheKey(segment),
             parent=self
         )
 
@@ -130,7 +154,7 @@ class PlaylistEngine(BaseEngine):
             nextSegmentDownloader = self._segmentDownloaders.pop(0)
             if nextSegmentDownloader.getError() == None and not self.status.terminateState.isProcessing():
                 self._mergeSegment(nextSegmentDownloader)
-            nextSegmentDownloader.file.remove()
+            nextSegmentDownloader.discard()
             nextSegmentDownloader.setParent(None)
         self._checkDone()
 
@@ -0,0 +1,93 @@
+from ..Config import Config
+
+from PyQt6 import QtCore
+
+
+class SharedPlaylist:
+    def __init__(self):
+        self.text: str | None = None
+        self.updatedAt = QtCore.QElapsedTimer()
+        self.requested = False
+
+    def isFresh(self) -> bool:
+        return self.text != None and self.updatedAt.isValid() and self.updatedAt.elapsed() < Config.PLAYLIST_HUB_MAX_AGE
+
+
+class SharedSegment:
+    def __init__(self):
+        self.filePath: str | None = None
+        self.waiters: list[QtCore.QObject] = []
+
+
+class PlaylistHub(QtCore.QObject):
+    playlistPublished = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._mutex = QtCore.QMutex()
+        self._playlists: dict[str, SharedPlaylist] = {}
+        self._segments: dict[str, SharedSegment] = {}
+
+    def getPlaylist(self, key: str) -> str | None:
+        with QtCore.QMutexLocker(self._mutex):
+            sharedPlaylist = self._playlists.get(key)
+            return sharedPlaylist.text if sharedPlaylist != None and sharedPlaylist.isFresh() else None
+
+    def requestPlaylist(self, key: str) -> bool:
+        with QtCore.QMutexLocker(self._mutex):
+            sharedPlaylist = self._playlists.setdefault(key, SharedPlaylist())
+            if sharedPlaylist.requested:
+                return False
+            sharedPlaylist.requested = True
+            return True
+
+    def publishPlaylist(self, key: str, text: str | None) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            for staleKey in [staleKey for staleKey, sharedPlaylist in self._playlists.items() if staleKey != key and not sharedPlaylist.requested and not sharedPlaylist.isFresh()]:
+                del self._playlists[staleKey]
+            sharedPlaylist = self._playlists.setdefault(key, SharedPlaylist())
+            sharedPlaylist.requested = False
+            if text != None:
+                sharedPlaylist.text = text
+                sharedPlaylist.updatedAt.start()
+        self.playlistPublished.emit(key, text)
+
+    def requestSegment(self, key: str, segmentDownloader: QtCore.QObject) -> bool:
+        with QtCore.QMutexLocker(self._mutex):
+            sharedSegment = self._segments.get(key)
+            if sharedSegment == None:
+                self._segments[key] = SharedSegment()
+                return True
+            filePath = sharedSegment.filePath
+            if filePath == None:
+                sharedSegment.waiters.append(segmentDownloader)
+                return False
+        segmentDownloader.receiveSharedFile(filePath)
+        return False
+
+    def leaveSegment(self, key: str, segmentDownloader: QtCore.QObject) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            sharedSegment = self._segments.get(key)
+            if sharedSegment != None and segmentDownloader in sharedSegment.waiters:
+                sharedSegment.waiters.remove(segmentDownloader)
+
+    def publishSegment(self, key: str, filePath: str | None) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            sharedSegment = self._segments.get(key)
+            if sharedSegment == None:
+                return
+            if filePath == None:
+                del self._segments[key]
+            else:
+                sharedSegment.filePath = filePath
+            waiters = sharedSegment.waiters
+            sharedSegment.waiters = []
+        for segmentDownloader in waiters:
+            segmentDownloader.receiveSharedFile(filePath)
+
+    def releaseSegment(self, key: str) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            sharedSegment = self._segments.pop(key, None)
+            waiters = [] if sharedSegment == None else sharedSegment.waiters
+        for segmentDownloader in waiters:
+            segmentDownloader.receiveSharedFile(None)
\ No newline at end of file
@@ -0,0 +1,25 @@
+from Services.Playlist.Playlist import Playlist
+
+
+class RefreshScheduler:
+    def __init__(self, minInterval: int, maxInterval: int):
+        self._minInterval = minInterval
+        self._maxInterval = maxInterval
+
+    def getBaseInterval(self, playlist: Playlist) -> int:
+        segments = playlist.getSegments()
+        if playlist.getTargetDuration() == 0:
+            return self._maxInterval if len(segments) == 0 else segments[-1].totalMilliseconds
+        elif len(segments) == 0:
+            return playlist.getTargetDuration() * 1000
+        else:
+            return min(playlist.getTargetDuration() * 1000, segments[-1].totalMilliseconds)
+
+    def getInterval(self, playlist: Playlist, changed: bool, discontinuity: bool = False) -> int:
+        if discontinuity:
+            interval = self._minInterval
+        elif changed:
+            interval = self.getBaseInterval(playlist)
+        else:
+            interval = self.getBaseInterval(playlist) // 2
+        return min(max(interval, self._minInterval), self._maxInterval)
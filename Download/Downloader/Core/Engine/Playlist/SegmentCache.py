@@ -0,0 +1,111 @@
+from ..Config import Config
+
+from Core import App
+from Core.Config import Config as CoreConfig
+from Services.Utils.OSUtils import OSUtils
+from Services.Logging.Logger import Logger
+
+from PyQt6 import QtCore
+
+import os
+import uuid
+import hashlib
+import collections
+
+
+class SegmentCache(QtCore.QObject):
+    FILE_EXTENSION = "ts"
+
+    def __init__(self, logger: Logger, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.logger = logger
+        self._directory = OSUtils.joinPath(CoreConfig.TEMP_PATH, "segments")
+        self._mutex = QtCore.QMutex()
+        self._entries: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._pins: dict[str, int] = {}
+        self._size = 0
+        try:
+            OSUtils.createDirectory(self._directory)
+            self._loadEntries()
+        except Exception as e:
+            self.logger.exception(e)
+
+    def _loadEntries(self) -> None:
+        entries = []
+        for fileName in OSUtils.listDirectory(self._directory):
+            path = OSUtils.joinPath(self._directory, fileName)
+            if fileName.endswith(f".{self.FILE_EXTENSION}"):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, fileName, stat.st_size))
+            elif not App.Instance.isDownloadHost():
+                OSUtils.removeFile(path)
+        for modifiedTime, fileName, size in sorted(entries):
+            self._entries[fileName] = size
+            self._size += size
+        self._evict()
+
+    def _getFileName(self, key: str) -> str:
+        return f"{hashlib.sha1(key.encode()).hexdigest()}.{self.FILE_EXTENSION}"
+
+    def _getPath(self, fileName: str) -> str:
+        return OSUtils.joinPath(self._directory, fileName)
+
+    def get(self, key: str, filePath: str) -> bool:
+        fileName = self._getFileName(key)
+        with QtCore.QMutexLocker(self._mutex):
+            if fileName not in self._entries:
+                return False
+            self._entries.move_to_end(fileName)
+            self._pins[fileName] = self._pins.get(fileName, 0) + 1
+        copied = False
+        try:
+            if QtCore.QFile.exists(filePath):
+                QtCore.QFile.remove(filePath)
+            copied = QtCore.QFile.copy(self._getPath(fileName), filePath)
+            if copied:
+                os.utime(self._getPath(fileName))
+        except:
+            pass
+        finally:
+            with QtCore.QMutexLocker(self._mutex):
+                self._pins[fileName] -= 1
+                if self._pins[fileName] == 0:
+                    del self._pins[fileName]
+                if not copied and fileName in self._entries and fileName not in self._pins:
+                    self._removeEntry(fileName)
+                self._evict()
+        return copied
+
+    def put(self, key: str, filePath: str) -> None:
+        fileName = self._getFileName(key)
+        with QtCore.QMutexLocker(self._mutex):
+            if fileName in self._entries or fileName in self._pins:
+                return
+        tempPath = self._getPath(f"{fileName}.{uuid.uuid4().hex}.tmp")
+        if not QtCore.QFile.copy(filePath, tempPath):
+            return
+        with QtCore.QMutexLocker(self._mutex):
+            try:
+                os.replace(tempPath, self._getPath(fileName))
+            except Exception as e:
+                self.logger.exception(e)
+                QtCore.QFile.remove(tempPath)
+                return
+            size = os.path.getsize(self._getPath(fileName))
+            self._size += size - self._entries.pop(fileName, 0)
+            self._entries[fileName] = size
+            self._evict()
+
+    def _removeEntry(self, fileName: str) -> None:
+        self._size -= self._entries.pop(fileName)
+        try:
+            OSUtils.removeFile(self._getPath(fileName))
+        except:
+            pass
+
+    def _evict(self) -> None:
+        for fileName in list(self._entries):
+            if self._size <= Config.SEGMENT_CACHE_MAX_SIZE:
+                break
+            if fileName not in self._pins:
+                self._removeEntry(fileName)
\ No newline at end of file
@@ -1,11 +1,169 @@
+from ..Config import Config
 from ..File import FileDownloadManager
+from ..File.LatencyTracker import LatencyTracker
 
+from Core import App
+from Core.GlobalExceptions import Exceptions
 from Services.Playlist.Segment import Segment
 
 from PyQt6 import QtCore, QtNetwork
 
 
 class SegmentDownloader(FileDownloadManager.FileDownloader):
-    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, parent: QtCore.QObject | None = None):
+    _sharedFileReceived = QtCore.pyqtSignal(bool)
+
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, shareKey: str | None = None, cacheKey: str | None = None, parent: QtCore.QObject | None = None):
         super().__init__(networkAccessManager, segment.url, filePath, priority=priority, parent=parent)
-        self.segment = segment
\ No newline at end of file
+        self.segment = segment
+        self._shareKey = shareKey
+        self._shareOwner = False
+        self._shareWaiting = False
+        self._sharedFileReceived.connect(self._sharedFileReceivedHandler, QtCore.Qt.ConnectionType.QueuedConnection)
+        self._cacheKey = cacheKey
+        self._cached = False
+        self._latencyTracker: LatencyTracker | None = None
+        self._requestTimer = QtCore.QElapsedTimer()
+        self._hedgeReply: QtNetwork.QNetworkReply | None = None
+        self._hedged = False
+        self._hedgeWon = False
+        self._hedgeTimer = QtCore.QTimer(parent=self)
+        self._hedgeTimer.setSingleShot(True)
+        self._hedgeTimer.timeout.connect(self._startHedge)
+
+    def setLatencyTracker(self, latencyTracker: LatencyTracker | None) -> None:
+        self._latencyTracker = latencyTracker
+
+    def isHedged(self) -> bool:
+        return self._hedged
+
+    def isHedgeWon(self) -> bool:
+        return self._hedgeWon
+
+    def isCached(self) -> bool:
+        return self._cached
+
+    def _startHandler(self) -> None:
+        if self._cacheKey != None and self._reply == None and not self._cached and App.SegmentCache.get(self._cacheKey, self.filePath):
+            self._cached = True
+            self._setDownloadProgress(self.file.size(), self.file.size())
+            self._setFinished()
+            return
+        if self._shareKey != None and not self._shareOwner:
+            if self._shareWaiting:
+                return
+            if App.PlaylistHub.requestSegment(self._shareKey, self):
+                self._shareOwner = True
+            else:
+                self._shareWaiting = True
+                self._retryRequired.emit(self)
+                return
+        self._startRequest()
+
+    def _startRequest(self) -> None:
+        super()._startHandler()
+        if self._reply != None and self._latencyTracker != None:
+            self._requestTimer.start()
+            hedgeDelay = None if self._hedged else self._latencyTracker.getPercentile(Config.STREAM_HEDGE_PERCENTILE)
+            if hedgeDelay != None:
+                self._hedgeTimer.start(max(hedgeDelay, Config.STREAM_HEDGE_MIN_DELAY))
+
+    def _startHedge(self) -> None:
+        if self._reply != None and self._error == None and not self._retryScheduled:
+            self._hedged = True
+            self._hedgeReply = self._networkAccessManager.get(self._request)
+            self._hedgeReply.finished.connect(self._hedgeFinished)
+
+    def _hedgeFinished(self) -> None:
+        reply = self._hedgeReply
+        self._hedgeReply = None
+        if reply == None:
+            return
+        reply.deleteLater()
+        if self._reply == None or self._error != None:
+            return
+        if reply.error() != QtNetwork.QNetworkReply.NetworkError.NoError:
+            if reply.error() != QtNetwork.QNetworkReply.NetworkError.OperationCanceledError:
+                App.RetryPolicy.recordFailure(self.url, reply.error())
+            return
+        if reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) != 200:
+            return
+        data = reply.readAll()
+        self._cancelReply(self._reply)
+        self._reply = None
+        self._hedgeWon = True
+        App.RetryPolicy.recordSuccess(self.url)
+        if not self.file.resize(0) or self.file.write(data) == -1:
+            self.file.close()
+            self._raiseException(Exceptions.FileSystemError(self.file))
+            return
+        self.file.close()
+        self._setDownloadProgress(data.size(), data.size())
+        self._addLatencySample()
+        self._setFinished()
+
+    def _cancelReply(self, reply: QtNetwork.QNetworkReply) -> None:
+        for signal in (reply.readyRead, reply.downloadProgress, reply.errorOccurred, reply.finished):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        reply.abort()
+        reply.deleteLater()
+
+    def _stopHedge(self) -> None:
+        self._hedgeTimer.stop()
+        if self._hedgeReply != None:
+            reply = self._hedgeReply
+            self._hedgeReply = None
+            self._cancelReply(reply)
+
+    def _addLatencySample(self) -> None:
+        if self._latencyTracker != None and self._requestTimer.isValid():
+            self._latencyTracker.addSample(self._requestTimer.elapsed())
+
+    def _onFinished(self) -> None:
+        self._stopHedge()
+        if self._error == None and not self._retryScheduled:
+            self._addLatencySample()
+        super()._onFinished()
+
+    def receiveSharedFile(self, filePath: str | None) -> None:
+        if filePath == None:
+            self._sharedFileReceived.emit(False)
+            return
+        if QtCore.QFile.exists(self.filePath):
+            QtCore.QFile.remove(self.filePath)
+        self._sharedFileReceived.emit(QtCore.QFile.copy(filePath, self.filePath))
+
+    def _sharedFileReceivedHandler(self, received: bool) -> None:
+        if not self._shareWaiting:
+            return
+        self._shareWaiting = False
+        self._shareKey = None
+        if self._error != None:
+            return
+        if received:
+            self._setDownloadProgress(self.file.size(), self.file.size())
+            self._setFinished()
+        else:
+            self._retryRequested.emit(self)
+
+    def discard(self) -> None:
+        if self._shareOwner:
+            self._shareOwner = False
+            App.PlaylistHub.releaseSegment(self._shareKey)
+        super().discard()
+
+    def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError) -> None:
+        self._stopHedge()
+        if self._shareWaiting and self._error == None:
+            self._shareWaiting = False
+            App.PlaylistHub.leaveSegment(self._shareKey, self)
+        super()._raiseException(exception)
+
+    def _setFinished(self) -> None:
+        if self._cacheKey != None and not self._cached and not self._finishRequested and self._error == None:
+            App.SegmentCache.put(self._cacheKey, self.filePath)
+        if self._shareOwner and not self._finishRequested:
+            App.PlaylistHub.publishSegment(self._shareKey, self.filePath if self._error == None else None)
+        super()._setFinished()
@@ -0,0 +1,130 @@
+from Core.Config import Config
+from Core.GlobalExceptions import Exceptions
+from Services.Logging.Logger import Logger
+from Download.DownloadInfo import DownloadInfo
+from Download.Downloader.Core.Engine import Modules
+from Download.Downloader.Host.Config import Config as HostConfig
+from Download.Downloader.Host.HostConnection import HostConnection
+from AppData.EncoderDecoder import Encoder
+
+from PyQt6 import QtCore, QtNetwork
+
+import sys
+import uuid
+
+
+class ProcessEngine(QtCore.QObject):
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, downloadInfo: DownloadInfo, status: Modules.Status, progress: Modules.Progress, logger: Logger, options: dict, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.downloadInfo = downloadInfo
+        self.status = status
+        self.progress = progress
+        self.logger = logger
+        self._options = options
+        self._connection: HostConnection | None = None
+        self._pendingMessages: list[tuple] = []
+        self._hostFinished = False
+        self._finished = False
+        self._server = QtNetwork.QLocalServer(parent=self)
+        self._server.newConnection.connect(self._newConnection)
+        self._process = QtCore.QProcess(parent=self)
+        self._process.setStandardOutputFile(QtCore.QProcess.nullDevice())
+        self._process.setStandardErrorFile(QtCore.QProcess.nullDevice())
+        self._process.finished.connect(self._processFinished)
+        self._process.errorOccurred.connect(self._processErrorOccurred)
+        self._killTimer = QtCore.QTimer(parent=self)
+        self._killTimer.setSingleShot(True)
+        self._killTimer.setInterval(HostConfig.EXIT_TIMEOUT)
+        self._killTimer.timeout.connect(self._process.kill)
+
+    def start(self) -> None:
+        serverName = f"{Config.APP_NAME}_DownloadHost_{uuid.uuid4()}"
+        self._server.setSocketOptions(QtNetwork.QLocalServer.SocketOption.UserAccessOption)
+        if not self._server.listen(serverName):
+            self._raiseException(Exceptions.UnexpectedError(self._server.errorString()))
+            self._finish()
+            return
+        arguments = [] if getattr(sys, "frozen", False) else [sys.argv[0]]
+        self._process.setWorkingDirectory(Config.APP_ROOT)
+        self._process.start(sys.executable, arguments + [Config.DOWNLOAD_HOST_ARGUMENT, serverName])
+        self.logger.info(f"Download host process started with server '{serverName}'.")
+
+    def _newConnection(self) -> None:
+        socket = self._server.nextPendingConnection()
+        if self._connection != None:
+            socket.abort()
+            return
+        self._server.close()
+        self._connection = HostConnection(socket, parent=self)
+        self._connection.messageReceived.connect(self._messageReceived)
+        self._connection.send("start", Encoder.encode(self.downloadInfo), self._options)
+        for message in self._pendingMessages:
+            self._connection.send(*message)
+        self._pendingMessages.clear()
+
+    def _send(self, *message: object) -> None:
+        if self._connection == None:
+            self._pendingMessages.append(message)
+        else:
+            self._connection.send(*message)
+
+    def abort(self, exception: Exception) -> None:
+        self.logger.warning("Abort requested with the following exception.")
+        self.logger.warning(exception)
+        self._send("abort", HostConnection.encodeError(exception))
+
+    def pause(self) -> None:
+        self._send("pause")
+
+    def resume(self) -> None:
+        self._send("resume")
+
+    def _messageReceived(self, message: tuple) -> None:
+        messageType = message[0]
+        if messageType == "started":
+            self.logger.info(f"Download host is writing its log to '{message[1]}'.")
+        elif messageType == "state":
+            try:
+                self.status.applySnapshot(message[1], HostConnection.decodeError(message[2]))
+            except Exception as e:
+                self.logger.warning(f"Invalid state received from the download host: {e}")
+                return
+            self.progress.applySnapshot(message[3])
+            self.status.sync()
+            self.progress.sync()
+        elif messageType == "failed":
+            self._raiseException(HostConnection.decodeError(message[1]))
+        elif messageType == "finished":
+            self._hostFinished = True
+            self._killTimer.start()
+
+    def _processErrorOccurred(self, error: QtCore.QProcess.ProcessError) -> None:
+        if error == QtCore.QProcess.ProcessError.FailedToStart:
+            self._raiseException(Exceptions.ProcessError(self._process))
+            self._finish()
+
+    def _processFinished(self) -> None:
+        self._killTimer.stop()
+        if not self._hostFinished:
+            self._raiseException(Exceptions.ProcessError(self._process))
+        self._finish()
+
+    def _raiseException(self, exception: Exception) -> None:
+        self.logger.warning("The following exception occurred.")
+        self.logger.warning(exception)
+        self.status.raiseError(exception)
+
+    def _finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        if not self.status.isDone():
+            if self.status.terminateState.isInProgress():
+                self.status.terminateState.setTrue()
+            self.status.setDone()
+        self.logger.info("Download host process finished.")
+        self.status.sync()
+        self.progress.sync()
+        self.finished.emit()
\ No newline at end of file
@@ -1,5 +1,337 @@
+from .Config import Config
 from .Playlist.PlaylistEngine import PlaylistEngine
+from .Playlist.SegmentDownloader import SegmentDownloader
+from .File.LatencyTracker import LatencyTracker
+
+from Core import App
+from Core.GlobalExceptions import Exceptions
+from Services.Utils.Utils import Utils
+from Services.Logging.Logger import Logger
+from Services.Playlist import Playlist
+from Services.Playlist.Segment import Segment
+from Services.Playlist.Resolution import Resolution
+from Services.Playlist.PlaylistManager import PlaylistManager
+from Services.Twitch.Playback import TwitchPlaybackGenerator
+from Services.Twitch.Playback import TwitchPlaybackModels
+from Search.ExternalPlaybackGenerator import ExternalPlayback
+from Download.DownloadInfo import DownloadInfo
+from Download.Downloader.Core.Engine import Modules
+
+from PyQt6 import QtCore, QtNetwork
 
 
 class StreamEngine(PlaylistEngine):
-    pass
\ No newline at end of file
+    playbackRenewalRequested = QtCore.pyqtSignal()
+    backfillRequested = QtCore.pyqtSignal()
+
+    RECONNECT_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.ConnectionRefusedError,
+        QtNetwork.QNetworkReply.NetworkError.RemoteHostClosedError,
+        QtNetwork.QNetworkReply.NetworkError.HostNotFoundError,
+        QtNetwork.QNetworkReply.NetworkError.TimeoutError,
+        QtNetwork.QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+        QtNetwork.QNetworkReply.NetworkError.NetworkSessionFailedError,
+        QtNetwork.QNetworkReply.NetworkError.UnknownNetworkError,
+        QtNetwork.QNetworkReply.NetworkError.ServiceUnavailableError
+    )
+    PLAYLIST_GONE_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.ContentNotFoundError,
+        QtNetwork.QNetworkReply.NetworkError.ContentGoneError
+    )
+    PLAYBACK_RENEWAL_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.ContentAccessDenied,
+        *PLAYLIST_GONE_ERRORS
+    )
+
+    def __init__(self, downloadInfo: DownloadInfo, status: Modules.Status, progress: Modules.Progress, logger: Logger, parent: QtCore.QObject | None = None):
+        super().__init__(downloadInfo, status, progress, logger, parent=parent)
+        self._playbackRenewalCount = 0
+        self._reconnectCount = 0
+        self._lastUpdateTimer = QtCore.QElapsedTimer()
+        self._reconnectTimer = QtCore.QTimer(parent=self)
+        self._reconnectTimer.setSingleShot(True)
+        self._reconnectTimer.timeout.connect(self._updatePlaylist)
+        self._backfillEnabled = False
+        self._backfillPending = False
+        self._backfillStartedAt: QtCore.QDateTime | None = None
+        self._backfillPlaylistManager: PlaylistManager | None = None
+        self._firstSegment: Segment | None = None
+        self._prefetchDownloaders: dict[int, SegmentDownloader] = {}
+        self._discardedPrefetchDownloaders: list[SegmentDownloader] = []
+        self._latencyTracker = LatencyTracker(sampleSize=Config.STREAM_HEDGE_SAMPLE_SIZE, minSampleSize=Config.STREAM_HEDGE_MIN_SAMPLE_SIZE)
+        self._backfillTimer = QtCore.QTimer(parent=self)
+        self._backfillTimer.setSingleShot(True)
+        self._backfillTimer.setInterval(Config.STREAM_BACKFILL_TIMEOUT)
+        self._backfillTimer.timeout.connect(self._backfillTimeout)
+
+    def _getPlaylistShareKey(self) -> str | None:
+        return None
+
+    def setBackfillEnabled(self, enabled: bool) -> None:
+        self._backfillEnabled = enabled
+
+    def start(self) -> None:
+        if self._backfillEnabled and not isinstance(self.downloadInfo.playback, ExternalPlayback):
+            self._backfillPending = True
+            self._backfillTimer.start()
+            self.backfillRequested.emit()
+        super().start()
+
+    def _playlistManagerErrorOccurred(self, exception: Exceptions.AbortRequested | Exceptions.NetworkError | Playlist.Exceptions.InvalidPlaylist) -> None:
+        if self._isPlaybackRenewalRequired(exception):
+            self._playbackRenewalCount += 1
+            self.logger.warning(f"Playlist access expired, renewing playback. ({self._playbackRenewalCount}/{Config.STREAM_PLAYBACK_RENEWAL_MAX_COUNT})")
+            self.playbackRenewalRequested.emit()
+        elif self._isReconnectRequired(exception):
+            self._scheduleReconnect()
+        elif self._isPlaylistGone(exception):
+            self.logger.info(f"Playlist is no longer available, finishing download. ({exception.reasonCode})")
+            self._playlistManager.playlist.setEndList(True)
+            self._checkDone()
+        else:
+            super()._playlistManagerErrorOccurred(exception)
+
+    def _isReconnectRequired(self, exception: Exception) -> bool:
+        if not isinstance(exception, Exceptions.NetworkError) or exception.reasonCode not in self.RECONNECT_ERRORS or not self._lastUpdateTimer.isValid():
+            return False
+        return self.status.terminateState.isFalse() and self._lastUpdateTimer.elapsed() < Config.STREAM_RECONNECT_TIMEOUT
+
+    def _isPlaylistGone(self, exception: Exception) -> bool:
+        if not isinstance(exception, Exceptions.NetworkError) or exception.reasonCode not in self.PLAYLIST_GONE_ERRORS:
+            return False
+        return self.status.terminateState.isFalse() and self._lastUpdateTimer.isValid()
+
+    def _scheduleReconnect(self) -> None:
+        liveWindowInterval = max(self._playlistManager.playlist.totalMilliseconds // 2, Config.STREAM_RECONNECT_INTERVAL)
+        interval = min(Config.STREAM_RECONNECT_INTERVAL * 2 ** self._reconnectCount, Config.STREAM_RECONNECT_MAX_INTERVAL, liveWindowInterval)
+        self._reconnectCount += 1
+        self.logger.warning(f"Playlist update failed, reconnecting in {interval}ms. (Attempt: {self._reconnectCount} / Disconnected: {self._lastUpdateTimer.elapsed()}ms)")
+        self._reconnectTimer.start(interval)
+
+    def _recordGap(self) -> None:
+        nextSequence = self._playlistManager.getNextSequence()
+        lostFiles = max(self._playlistManager.playlist.getMediaSequence() - nextSequence, 0) if nextSequence != 0 else 0
+        lostMilliseconds = lostFiles * self._playlistManager.playlist.getTargetDuration() * 1000
+        self.progress.gaps += 1
+        self.progress.gapFiles += lostFiles
+        self.progress.gapMilliseconds += lostMilliseconds
+        self.logger.warning(f"Reconnected after {self._lastUpdateTimer.elapsed()}ms: <Lost Segments: {lostFiles} / Lost Length: {lostMilliseconds}ms>")
+
+    def _isPlaybackRenewalRequired(self, exception: Exception) -> bool:
+        if not isinstance(exception, Exceptions.NetworkError) or isinstance(self.downloadInfo.playback, ExternalPlayback):
+            return False
+        if exception.reasonCode not in self.PLAYBACK_RENEWAL_ERRORS:
+            return False
+        return self.status.terminateState.isFalse() and self._playbackRenewalCount < Config.STREAM_PLAYBACK_RENEWAL_MAX_COUNT
+
+    def playbackRenewed(self, playback: TwitchPlaybackModels.TwitchStreamPlayback | None, exception: Exception | None) -> None:
+        if self.status.isDone() or not self.status.terminateState.isFalse():
+            return
+        if exception == None:
+            resolution = self._findResolution(playback)
+            if resolution == None:
+                self.logger.warning(f"Unable to find resolution '{self.downloadInfo.resolution.name}' in renewed playback.")
+                self._raiseException(Exceptions.UnexpectedError("Resolution Not Found"))
+            else:
+                self.downloadInfo.updatePlayback(playback)
+                self.downloadInfo.setResolution(playback.getResolutions().index(resolution))
+                self._playlistManager.setUrl(resolution.url)
+                self.logger.info(f"Playback Renewed: {resolution.url.toString()}")
+                self._updatePlaylist()
+        elif isinstance(exception, TwitchPlaybackGenerator.Exceptions.ChannelIsOffline):
+            self.logger.info("Channel went offline while renewing playback.")
+            self._playlistManager.playlist.setEndList(True)
+            self._checkDone()
+        else:
+            self._raiseException(exception)
+
+    def _findResolution(self, playback: TwitchPlaybackModels.TwitchStreamPlayback) -> Resolution | None:
+        currentResolution = self.downloadInfo.resolution
+        for resolution in playback.getResolutions():
+            if resolution.groupId == currentResolution.groupId:
+                return resolution
+        for resolution in playback.getResolutions():
+            if resolution == currentResolution:
+                return resolution
+        return None
+
+    def _playlistUpdated(self) -> None:
+        if self._reconnectCount != 0:
+            self._reconnectCount = 0
+            self._recordGap()
+        self._playbackRenewalCount = 0
+        self._lastUpdateTimer.start()
+        super()._playlistUpdated()
+        self._updatePrefetch()
+        self._startBackfill()
+
+    def _updatePrefetch(self) -> None:
+        nextSequence = self._playlistManager.getNextSequence()
+        for sequence in [sequence for sequence in self._prefetchDownloaders if sequence < nextSequence]:
+            self._discardPrefetchDownloader(self._prefetchDownloaders.pop(sequence))
+        if not Config.STREAM_PREFETCH_ENABLED or isinstance(self.downloadInfo.playback, ExternalPlayback) or self.status.isDone() or not self.status.terminateState.isFalse() or self._playlistManager.playlist.isEndList():
+            self._discardPrefetchDownloaders()
+            return
+        prefetchDownloaders = []
+        for segment in self._playlistManager.playlist.getPrefetchSegments():
+            if segment.sequence >= nextSequence and segment.sequence not in self._prefetchDownloaders:
+                prefetchDownloader = SegmentDownloader(
+                    self._networkAccessManager,
+                    segment,
+                    Utils.joinPath(self._safeTempDirectory.path(), f"prefetch-{segment.sequence}.ts"),
+                    priority=self.downloadInfo.getPriority(),
+                    shareKey=self._getSegmentShareKey(segment),
+                    parent=self
+                )
+                self._setSegmentDeadline(prefetchDownloader)
+                self._prefetchDownloaders[segment.sequence] = prefetchDownloader
+                prefetchDownloaders.append(prefetchDownloader)
+        App.FileDownloadManager.startDownloads(prefetchDownloaders)
+
+    def _discardPrefetchDownloaders(self) -> None:
+        for prefetchDownloader in self._prefetchDownloaders.values():
+            self._discardPrefetchDownloader(prefetchDownloader)
+        self._prefetchDownloaders.clear()
+
+    def _discardPrefetchDownloader(self, prefetchDownloader: SegmentDownloader) -> None:
+        if prefetchDownloader.isFinished():
+            prefetchDownloader.discard()
+            prefetchDownloader.setParent(None)
+        else:
+            self._discardedPrefetchDownloaders.append(prefetchDownloader)
+            prefetchDownloader.finished.connect(self._prefetchDownloadDiscarded)
+            App.FileDownloadManager.cancelDownload(prefetchDownloader)
+
+    def _prefetchDownloadDiscarded(self, prefetchDownloader: SegmentDownloader) -> None:
+        self._discardedPrefetchDownloaders.remove(prefetchDownloader)
+        prefetchDownloader.discard()
+        prefetchDownloader.setParent(None)
+        self._checkDone()
+
+    def _checkDone(self) -> None:
+        if self.status.terminateState.isProcessing() or self._playlistManager.playlist.isEndList():
+            self._discardPrefetchDownloaders()
+        if len(self._discardedPrefetchDownloaders) == 0:
+            super()._checkDone()
+
+    def _downloadSegments(self, segments: list[Segment]) -> None:
+        super()._downloadSegments(segments)
+        if any(segmentDownloader.isFinished() for segmentDownloader in self._segmentDownloaders):
+            self._segmentDownloadFinished(None)
+
+    def _createSegmentDownloader(self, segment: Segment) -> SegmentDownloader:
+        if self._firstSegment == None:
+            self._firstSegment = segment
+        prefetchDownloader = self._prefetchDownloaders.pop(segment.sequence, None)
+        if prefetchDownloader != None:
+            if prefetchDownloader.url == segment.url and prefetchDownloader.getError() == None:
+                prefetchDownloader.segment = segment
+                self._setSegmentDeadline(prefetchDownloader)
+                return prefetchDownloader
+            self._discardPrefetchDownloader(prefetchDownloader)
+        segmentDownloader = super()._createSegmentDownloader(segment)
+        self._setSegmentDeadline(segmentDownloader)
+        if Config.STREAM_HEDGE_ENABLED:
+            segmentDownloader.setLatencyTracker(self._latencyTracker)
+        return segmentDownloader
+
+    def _setSegmentDeadline(self, segmentDownloader: SegmentDownloader) -> None:
+        if segmentDownloader.segment.datetime != None:
+            windowMilliseconds = self._playlistManager.playlist.totalMilliseconds + segmentDownloader.segment.totalMilliseconds
+            segmentDownloader.setDeadline(segmentDownloader.segment.datetime.addMSecs(windowMilliseconds + Config.STREAM_SEGMENT_DEADLINE_GRACE))
+
+    def _segmentDownloadFailed(self, segmentDownloader: SegmentDownloader) -> None:
+        if segmentDownloader.isExpired() and not isinstance(segmentDownloader.getError(), Exceptions.AbortRequested):
+            self.progress.expiredFiles += 1
+            self.progress.expiredMilliseconds += segmentDownloader.segment.totalMilliseconds
+            self.logger.warning(f"Segment Expired: <Sequence: {segmentDownloader.segment.sequence} / Deadline: {segmentDownloader.getDeadline().toString(QtCore.Qt.DateFormat.ISODateWithMs)}>")
+        super()._segmentDownloadFailed(segmentDownloader)
+
+    def backfillResolved(self, playback: TwitchPlaybackModels.TwitchVideoPlayback | None, startedAt: QtCore.QDateTime | None) -> None:
+        if not self._backfillPending or self.status.isDone() or not self.status.terminateState.isFalse():
+            return
+        resolution = None if playback == None else self._findResolution(playback)
+        if resolution == None:
+            self._finishBackfill()
+        else:
+            self._backfillStartedAt = startedAt
+            self._backfillPlaylistManager = PlaylistManager(self._networkAccessManager, resolution.url, timeout=Config.PLAYLIST_REQUEST_TIMEOUT, maxRetryCount=Config.PLAYLIST_UPDATE_MAX_RETRY_COUNT, retryInterval=Config.PLAYLIST_UPDATE_RETRY_INTERVAL, parent=self)
+            self._backfillPlaylistManager.errorOccurred.connect(self._backfillPlaylistErrorOccurred)
+            self._backfillPlaylistManager.playlistUpdated.connect(self._startBackfill)
+            self._backfillPlaylistManager.update()
+
+    def _backfillPlaylistErrorOccurred(self, exception: Exceptions.AbortRequested | Exceptions.NetworkError | Playlist.Exceptions.InvalidPlaylist) -> None:
+        if self._backfillPending:
+            self.logger.warning("Unable to load the archive video playlist, skipping backfill.")
+            self.logger.exception(exception)
+            self._finishBackfill()
+
+    def _backfillTimeout(self) -> None:
+        self.logger.warning("Backfill timed out.")
+        self._finishBackfill()
+
+    def _startBackfill(self) -> None:
+        if not self._backfillPending or self.status.isDone() or self._firstSegment == None or self._backfillPlaylistManager == None or self._backfillPlaylistManager.isRunning():
+            return
+        if self._firstSegment.datetime == None:
+            self.logger.info("Stream playlist has no program date time, skipping backfill.")
+        else:
+            backfillLength = self._backfillStartedAt.msecsTo(self._firstSegment.datetime)
+            segments = [segment for segment in self._backfillPlaylistManager.playlist.getSegments() if segment.endsAt <= backfillLength + segment.totalMilliseconds // 2]
+            if backfillLength < Config.STREAM_BACKFILL_MIN_LENGTH or len(segments) == 0:
+                self.logger.info(f"Nothing to backfill. <Stream Offset: {backfillLength}ms>")
+            else:
+                self.logger.info(f"Backfilling {len(segments)} segments from the archive video. <Stream Offset: {backfillLength}ms / Length: {segments[-1].endsAt}ms>")
+                self._downloadBackfillSegments(segments)
+        self._finishBackfill()
+
+    def _downloadBackfillSegments(self, segments: list[Segment]) -> None:
+        segmentDownloaders = []
+        for segment in segments:
+            self.progress.totalFiles += 1
+            self.progress.totalMilliseconds += segment.totalMilliseconds
+            segmentDownloader = SegmentDownloader(
+                self._networkAccessManager,
+                segment,
+                Utils.joinPath(self._safeTempDirectory.path(), f"backfill-{segment.sequence}.ts"),
+                priority=self.downloadInfo.getPriority(),
+                shareKey=self._getSegmentShareKey(segment),
+                parent=self
+            )
+            segmentDownloader.errorOccurred.connect(self._segmentDownloadFailed)
+            segmentDownloader.finished.connect(self._segmentDownloadFinished)
+            segmentDownloaders.append(segmentDownloader)
+        App.FileDownloadManager.startDownloads(segmentDownloaders)
+        self._segmentDownloaders[0:0] = segmentDownloaders
+        self._syncProgress()
+
+    def _finishBackfill(self) -> None:
+        if self._backfillPending:
+            self._backfillPending = False
+            self._backfillTimer.stop()
+            if self._backfillPlaylistManager != None and self._backfillPlaylistManager.isRunning():
+                self._backfillPlaylistManager.abort()
+            self._segmentDownloadFinished(None)
+
+    def _segmentDownloadFinished(self, segmentDownloader: SegmentDownloader | None) -> None:
+        if segmentDownloader != None and segmentDownloader.getError() == None:
+            if segmentDownloader.segment.datetime != None:
+                self.progress.liveEdgeLatency = max(segmentDownloader.segment.datetime.addMSecs(segmentDownloader.segment.totalMilliseconds).msecsTo(QtCore.QDateTime.currentDateTimeUtc()), 0)
+            if segmentDownloader.isHedged():
+                self.progress.hedgedFiles += 1
+                if segmentDownloader.isHedgeWon():
+                    self.progress.hedgeWonFiles += 1
+                    self.logger.info(f"Hedged request won: <Sequence: {segmentDownloader.segment.sequence}>")
+        if not self._backfillPending or not self.status.terminateState.isFalse():
+            super()._segmentDownloadFinished(segmentDownloader)
+
+    def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError | Exceptions.ProcessError | Exceptions.UnexpectedError) -> None:
+        if self._reconnectTimer.isActive():
+            self._reconnectTimer.stop()
+        self._discardPrefetchDownloaders()
+        if self._backfillPending:
+            self._backfillPending = False
+            self._backfillTimer.stop()
+            if self._backfillPlaylistManager != None and self._backfillPlaylistManager.isRunning():
+                self._backfillPlaylistManager.abort()
+        super()._raiseException(exception)
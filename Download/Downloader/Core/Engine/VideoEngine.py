@@ -2,6 +2,8 @@ from .Config import Config
 from .Playlist.PlaylistEngine import PlaylistEngine
 from .Playlist.SegmentDownloader import SegmentDownloader
 from .Playlist.MutableSegmentDownloader import MutableSegmentDownloader
+from .Playlist.MutedSegmentPredictor import MutedSegmentPredictor
+from .Playlist.RefreshScheduler import RefreshScheduler
 
 from Core import App
 from Core.GlobalExceptions import Exceptions
@@ -18,8 +20,10 @@ class VideoEngine(PlaylistEngine):
     def __init__(self, downloadInfo: DownloadInfo, status: Modules.Status, progress: Modules.Progress, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(downloadInfo, status, progress, logger, parent=parent)
         self._playlistManager.setRange(*self.downloadInfo.getCropRangeMilliseconds())
-        self._refreshTimer.setInterval(Config.UPDATE_TRACK_INTERVAL)
+        self._refreshScheduler = RefreshScheduler(Config.UPDATE_TRACK_MIN_INTERVAL, Config.UPDATE_TRACK_INTERVAL)
         self._pausedSegments: list[Segment] = []
+        self._mutedSegmentPredictor: MutedSegmentPredictor | None = None
+        self._cachedFiles = 0
 
     def _updatePlaylist(self) -> None:
         self.status.setNextUpdateDateTime(None)
@@ -32,7 +36,6 @@ class VideoEngine(PlaylistEngine):
             self.downloadInfo.setCropRangeMilliseconds(*self._playlistManager.getSegmentRange())
             if self.downloadInfo.isUpdateTrackEnabled():
                 if self._playlistManager.hasNewSegments() or self.status.getWaitingCount() < self.status.getMaxWaitingCount():
-                    self.status.setNextUpdateDateTime(QtCore.QDateTime.currentDateTimeUtc().addMSecs(Config.UPDATE_TRACK_INTERVAL))
                     if self._playlistManager.hasNewSegments():
                         self.status.setWaitingCount(0)
                     else:
@@ -43,20 +46,52 @@ class VideoEngine(PlaylistEngine):
                 self._syncStatus()
             super()._playlistUpdated()
 
+    def _getRefreshInterval(self, changed: bool, discontinuity: bool) -> int:
+        interval = super()._getRefreshInterval(changed, discontinuity) if changed else Config.UPDATE_TRACK_INTERVAL
+        if self.downloadInfo.isUpdateTrackEnabled() and self.status.getWaitingCount() != -1:
+            self.status.setNextUpdateDateTime(QtCore.QDateTime.currentDateTimeUtc().addMSecs(interval))
+            self._syncStatus()
+        return interval
+
+    def _downloadSegments(self, segments: list[Segment]) -> None:
+        if self.downloadInfo.isUnmuteVideoEnabled():
+            if self._mutedSegmentPredictor == None:
+                self._mutedSegmentPredictor = MutedSegmentPredictor(self._networkAccessManager, parent=self)
+            self._mutedSegmentPredictor.probe(segments)
+        super()._downloadSegments(segments)
+
     def _createSegmentDownloader(self, segment: Segment) -> SegmentDownloader:
-        return (MutableSegmentDownloader if self.downloadInfo.isUnmuteVideoEnabled() else SegmentDownloader)(
+        if not self.downloadInfo.isUnmuteVideoEnabled():
+            return super()._createSegmentDownloader(segment)
+        return MutableSegmentDownloader(
             self._networkAccessManager,
             segment,
             Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.ts"),
             priority=self.downloadInfo.getPriority(),
+            cacheKey=self._getSegmentCacheKey(segment),
+            predictor=self._mutedSegmentPredictor,
             parent=self
         )
 
+    def _getSegmentCacheKey(self, segment: Segment) -> str | None:
+        if not Config.SEGMENT_CACHE_ENABLED:
+            return None
+        key = f"{self.downloadInfo.content.id}:{self.downloadInfo.resolution.groupId}:{segment.sequence}"
+        return f"{key}:unmuted" if self.downloadInfo.isUnmuteVideoEnabled() else key
+
+    def _finish(self) -> None:
+        if self._mutedSegmentPredictor != None:
+            self._mutedSegmentPredictor.abort()
+            self.logger.info(f"Unmute Requests: {self._mutedSegmentPredictor.getReport()}")
+        if self._cachedFiles != 0:
+            self.logger.info(f"Loaded {self._cachedFiles} segments from the segment cache.")
+        super()._finish()
+
     def _segmentDownloadFinished(self, segmentDownloader: SegmentDownloader) -> None:
         if self.status.pauseState.isProcessing():
             while len(self._segmentDownloaders) > 0 and self._segmentDownloaders[0].isFinished():
                 nextSegmentDownloader = self._segmentDownloaders.pop(0)
-                nextSegmentDownloader.file.remove()
+                nextSegmentDownloader.discard()
                 nextSegmentDownloader.setParent(None)
             if len(self._segmentDownloaders) == 0:
                 self.status.pauseState.setTrue()
@@ -65,6 +100,8 @@ class VideoEngine(PlaylistEngine):
             super()._segmentDownloadFinished(segmentDownloader)
 
     def _mergeSegment(self, segmentDownloader: SegmentDownloader) -> None:
+        if segmentDownloader.isCached():
+            self._cachedFiles += 1
         if isinstance(segmentDownloader, MutableSegmentDownloader):
             if segmentDownloader.isMuted():
                 self.logger.warning(f"Failed to unmute segment: <Sequence: {segmentDownloader.segment.sequence} / Length: {segmentDownloader.segment.totalMilliseconds}>\n{segmentDownloader.segment.url.toString()}")
@@ -1,8 +1,36 @@
 from .BaseDownloader import BaseDownloader
+from .Engine.Config import Config
 from .Engine.StreamEngine import StreamEngine
 
+from Core import App
+from Services.Twitch.GQL import TwitchGQLAPI
+from Services.Twitch.Playback import TwitchPlaybackGenerator
+from Download.DownloadInfo import DownloadInfo
+
+from PyQt6 import QtCore
+
 
 class StreamDownloader(BaseDownloader):
+    _playbackRenewed = QtCore.pyqtSignal(object, object)
+    _backfillResolved = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, downloadInfo: DownloadInfo, parent: QtCore.QObject | None = None):
+        super().__init__(downloadInfo, parent=parent)
+        self._backfillEnabled = False
+        self._backfillStartedAt: QtCore.QDateTime | None = None
+
+    def setBackfillEnabled(self, enabled: bool) -> None:
+        self._backfillEnabled = enabled
+
+    def isBackfillEnabled(self) -> bool:
+        return self._backfillEnabled
+
+    def getHostOptions(self) -> dict:
+        return {"backfillEnabled": self.isBackfillEnabled()}
+
+    def setHostOptions(self, options: dict) -> None:
+        self.setBackfillEnabled(options.get("backfillEnabled", False))
+
     def _createEngine(self) -> StreamEngine:
         engine = StreamEngine(
             downloadInfo=self.downloadInfo,
@@ -11,5 +39,41 @@ class StreamDownloader(BaseDownloader):
             logger=self.logger,
             parent=None
         )
+        engine.setBackfillEnabled(self.isBackfillEnabled())
         self._abortRequested.connect(engine.abort)
-        return engine
\ No newline at end of file
+        engine.playbackRenewalRequested.connect(self._renewPlayback)
+        self._playbackRenewed.connect(engine.playbackRenewed)
+        engine.backfillRequested.connect(self._resolveBackfill)
+        self._backfillResolved.connect(engine.backfillResolved)
+        return engine
+
+    def _renewPlayback(self) -> None:
+        TwitchPlaybackGenerator.TwitchStreamPlaybackGenerator(self.downloadInfo.playback.login, parent=self).finished.connect(self._playbackRenewalResult)
+
+    def _playbackRenewalResult(self, generator: TwitchPlaybackGenerator.TwitchStreamPlaybackGenerator) -> None:
+        self._playbackRenewed.emit(generator.getData(), generator.getError())
+
+    def _resolveBackfill(self) -> None:
+        App.TwitchGQL.getChannelVideos(channel=self.downloadInfo.playback.login, videoType="ARCHIVE", sort="TIME", limit=Config.STREAM_BACKFILL_VIDEO_SEARCH_LIMIT).finished.connect(self._backfillVideosResult)
+
+    def _backfillVideosResult(self, response: TwitchGQLAPI.TwitchGQLResponse) -> None:
+        if response.getError() == None:
+            streamCreatedAt = self.downloadInfo.content.createdAt
+            for video in response.getData().data:
+                if abs(video.createdAt.msecsTo(streamCreatedAt)) <= Config.STREAM_BACKFILL_VIDEO_MATCH_TOLERANCE:
+                    self._backfillStartedAt = video.createdAt
+                    TwitchPlaybackGenerator.TwitchVideoPlaybackGenerator(video.id, parent=self).finished.connect(self._backfillPlaybackResult)
+                    return
+            self.logger.info("Unable to find the archive video of this stream, skipping backfill.")
+        else:
+            self.logger.warning("Unable to search the archive video of this stream, skipping backfill.")
+            self.logger.exception(response.getError())
+        self._backfillResolved.emit(None, None)
+
+    def _backfillPlaybackResult(self, generator: TwitchPlaybackGenerator.TwitchVideoPlaybackGenerator) -> None:
+        if generator.getError() == None:
+            self._backfillResolved.emit(generator.getData(), self._backfillStartedAt)
+        else:
+            self.logger.warning("Unable to load the archive video of this stream, skipping backfill.")
+            self.logger.exception(generator.getError())
+            self._backfillResolved.emit(None, None)
@@ -1,5 +1,6 @@
 from .BaseDownloader import BaseDownloader
 from .Engine.VideoEngine import VideoEngine
+from .Engine.ProcessEngine import ProcessEngine
 
 from PyQt6 import QtCore
 
@@ -21,6 +22,12 @@ class VideoDownloader(BaseDownloader):
         self._resumeRequested.connect(engine.resume, QtCore.Qt.ConnectionType.BlockingQueuedConnection)
         return engine
 
+    def _createProcessEngine(self) -> ProcessEngine:
+        engine = super()._createProcessEngine()
+        self._pauseRequested.connect(engine.pause)
+        self._resumeRequested.connect(engine.resume, QtCore.Qt.ConnectionType.BlockingQueuedConnection)
+        return engine
+
     def pause(self) -> None:
         self.logger.warning("[ACTION] Pause")
         if self.status.pauseState.isFalse() and not self.status.isDone():
@@ -0,0 +1,4 @@
+class Config:
+    CONNECTION_TIMEOUT = 10000
+    EXIT_TIMEOUT = 30000
+    MAX_MESSAGE_SIZE = 16777216
\ No newline at end of file
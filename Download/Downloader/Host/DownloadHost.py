@@ -0,0 +1,84 @@
+from .Config import Config
+from .HostConnection import HostConnection
+
+from Core import App
+from Download.Downloader.TwitchDownloader import TwitchDownloader
+from Download.Downloader.Core.BaseDownloader import BaseDownloader
+from Download.Downloader.Core.VideoDownloader import VideoDownloader
+from AppData.EncoderDecoder import Decoder
+
+from PyQt6 import QtCore, QtNetwork
+
+
+class DownloadHost(QtCore.QObject):
+    def __init__(self, serverName: str, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.serverName = serverName
+        self.logger = App.Instance.logger
+        self._downloader: BaseDownloader | None = None
+        self._connection = HostConnection(QtNetwork.QLocalSocket(), parent=self)
+        self._connection.messageReceived.connect(self._messageReceived)
+        self._connection.disconnected.connect(self._disconnected)
+
+    def start(self) -> bool:
+        if self._connection.connectToServer(self.serverName, Config.CONNECTION_TIMEOUT):
+            return True
+        self.logger.error(f"Unable to connect to download host server '{self.serverName}'.")
+        return False
+
+    def _messageReceived(self, message: tuple) -> None:
+        messageType = message[0]
+        if messageType == "start":
+            self._startDownload(message[1], message[2])
+        elif self._downloader == None:
+            return
+        elif messageType == "abort":
+            self._downloader.abort(HostConnection.decodeError(message[1]))
+        elif messageType == "pause" and isinstance(self._downloader, VideoDownloader):
+            self._downloader.pause()
+        elif messageType == "resume" and isinstance(self._downloader, VideoDownloader):
+            self._downloader.resume()
+
+    def _startDownload(self, downloadInfo: dict, options: dict) -> None:
+        if self._downloader != None:
+            return
+        try:
+            TwitchDownloader.setCreationEnabled(True)
+            self._downloader = TwitchDownloader.create(Decoder.decode(downloadInfo), parent=self)
+        except Exception as e:
+            self.logger.exception(e)
+            self._connection.send("failed", HostConnection.encodeError(e))
+            self._exit()
+            return
+        self._downloader.setHostOptions(options)
+        self._downloader.status.updated.connect(self._sendState)
+        self._downloader.progress.updated.connect(self._sendState)
+        self._downloader.finished.connect(self._downloadFinished)
+        self._connection.send("started", self._downloader.logger.getPath())
+        self._downloader.start()
+
+    def _sendState(self) -> None:
+        self._connection.send(
+            "state",
+            self._downloader.status.getSnapshot(),
+            HostConnection.encodeError(self._downloader.status.getError()),
+            self._downloader.progress.getSnapshot()
+        )
+
+    def _downloadFinished(self) -> None:
+        self._sendState()
+        self._connection.send("finished")
+        self._exit()
+
+    def _disconnected(self) -> None:
+        if self._downloader != None and self._downloader.isRunning():
+            self.logger.warning("Download host server disconnected, canceling download.")
+            self._downloader.cancel()
+        else:
+            self._exit()
+
+    def _exit(self) -> None:
+        if self._connection.isConnected():
+            self._connection.waitForBytesWritten(Config.CONNECTION_TIMEOUT)
+            self._connection.close()
+        App.Instance.exit(App.Instance.EXIT_CODE.EXIT)
\ No newline at end of file
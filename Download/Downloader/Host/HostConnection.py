@@ -0,0 +1,135 @@
+from .Config import Config
+
+from Core.GlobalExceptions import Exceptions
+from Services.ContentManager import Exceptions as ContentManagerExceptions
+from Services.FileNameLocker import Exceptions as FileNameLockerExceptions
+from Services.Playlist.Playlist import Exceptions as PlaylistExceptions
+from Services.Twitch.GQL.TwitchGQLAPI import Exceptions as TwitchGQLAPIExceptions
+from Services.Twitch.Playback.TwitchPlaybackGenerator import Exceptions as TwitchPlaybackGeneratorExceptions
+from AppData.EncoderDecoder import Encoder, Decoder
+
+from PyQt6 import QtCore, QtNetwork
+
+import enum
+import json
+import struct
+
+
+class HostConnection(QtCore.QObject):
+    messageReceived = QtCore.pyqtSignal(object)
+    disconnected = QtCore.pyqtSignal()
+
+    HEADER = struct.Struct(">I")
+
+    ERROR_TYPES: dict[str, type[Exception]] = {
+        "UnexpectedError": Exceptions.UnexpectedError,
+        "FileSystemError": Exceptions.FileSystemError,
+        "NetworkError": Exceptions.NetworkError,
+        "ProcessError": Exceptions.ProcessError,
+        "AbortRequested": Exceptions.AbortRequested,
+        "RestrictedContent": ContentManagerExceptions.RestrictedContent,
+        "FileNameUnavailable": FileNameLockerExceptions.FileNameUnavailable,
+        "InvalidPlaylist": PlaylistExceptions.InvalidPlaylist,
+        "ApiError": TwitchGQLAPIExceptions.ApiError,
+        "IntegrityError": TwitchGQLAPIExceptions.IntegrityError,
+        "AuthorizationError": TwitchGQLAPIExceptions.AuthorizationError,
+        "DataNotFound": TwitchGQLAPIExceptions.DataNotFound,
+        "Forbidden": TwitchPlaybackGeneratorExceptions.Forbidden,
+        "GeoBlock": TwitchPlaybackGeneratorExceptions.GeoBlock,
+        "ChannelIsOffline": TwitchPlaybackGeneratorExceptions.ChannelIsOffline,
+        "ChannelNotFound": TwitchPlaybackGeneratorExceptions.ChannelNotFound,
+        "StreamRestricted": TwitchPlaybackGeneratorExceptions.StreamRestricted,
+        "VideoRestricted": TwitchPlaybackGeneratorExceptions.VideoRestricted,
+        "VideoNotFound": TwitchPlaybackGeneratorExceptions.VideoNotFound,
+        "ClipNotFound": TwitchPlaybackGeneratorExceptions.ClipNotFound
+    }
+    ERROR_ENUM_FIELDS: dict[str, dict[str, type[enum.Enum]]] = {
+        "FileSystemError": {"exceptionType": QtCore.QFileDevice.FileError},
+        "NetworkError": {"reasonCode": QtNetwork.QNetworkReply.NetworkError}
+    }
+
+    def __init__(self, socket: QtNetwork.QLocalSocket, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._socket = socket
+        self._socket.setParent(self)
+        self._socket.readyRead.connect(self._readyRead)
+        self._socket.disconnected.connect(self.disconnected)
+        self._buffer = bytearray()
+
+    def connectToServer(self, serverName: str, timeout: int) -> bool:
+        self._socket.connectToServer(serverName)
+        return self._socket.waitForConnected(timeout)
+
+    def isConnected(self) -> bool:
+        return self._socket.state() == QtNetwork.QLocalSocket.LocalSocketState.ConnectedState
+
+    def send(self, *message: object) -> None:
+        data = json.dumps(message, separators=(",", ":")).encode()
+        self._socket.write(self.HEADER.pack(len(data)) + data)
+        self._socket.flush()
+
+    def waitForBytesWritten(self, timeout: int) -> bool:
+        return self._socket.bytesToWrite() == 0 or self._socket.waitForBytesWritten(timeout)
+
+    def close(self) -> None:
+        self._socket.disconnectFromServer()
+
+    def _readyRead(self) -> None:
+        self._buffer += self._socket.readAll().data()
+        while len(self._buffer) >= self.HEADER.size:
+            size = self.HEADER.unpack_from(self._buffer)[0]
+            if size > Config.MAX_MESSAGE_SIZE:
+                self._abort()
+                return
+            if len(self._buffer) < self.HEADER.size + size:
+                break
+            try:
+                message = json.loads(self._buffer[self.HEADER.size:self.HEADER.size + size])
+            except:
+                message = None
+            if not isinstance(message, list) or len(message) == 0 or not isinstance(message[0], str):
+                self._abort()
+                return
+            del self._buffer[:self.HEADER.size + size]
+            self.messageReceived.emit(tuple(message))
+
+    def _abort(self) -> None:
+        self._buffer.clear()
+        self._socket.abort()
+
+    @classmethod
+    def encodeError(cls, error: Exception | None) -> dict | None:
+        if error == None:
+            return None
+        for name, errorType in cls.ERROR_TYPES.items():
+            if type(error) is errorType:
+                return {"type": name, "data": {key: cls._encodeErrorValue(value) for key, value in error.__dict__.items()}}
+        return {"type": "UnexpectedError", "data": {"exception": Encoder.encode(str(error))}}
+
+    @staticmethod
+    def _encodeErrorValue(value: object) -> object:
+        if isinstance(value, enum.Enum):
+            return value.value
+        try:
+            data = Encoder.encode(value)
+            json.dumps(data)
+            return data
+        except:
+            return Encoder.encode(str(value))
+
+    @classmethod
+    def decodeError(cls, data: dict | None) -> Exception | None:
+        if data == None:
+            return None
+        try:
+            name = data["type"]
+            errorType = cls.ERROR_TYPES[name]
+            state = Decoder.decode(data["data"])
+            for key, enumType in cls.ERROR_ENUM_FIELDS.get(name, {}).items():
+                if isinstance(state.get(key), int):
+                    state[key] = enumType(state[key])
+            error = errorType.__new__(errorType)
+            error.__dict__.update({key: value for key, value in state.items() if isinstance(key, str)})
+            return error
+        except Exception as e:
+            return Exceptions.UnexpectedError(f"Invalid error data received from the download host: {e}")
\ No newline at end of file
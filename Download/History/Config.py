@@ -0,0 +1,3 @@
+class Config:
+    WRITE_INTERVAL = 5000
+    PAGE_SIZE = 50
\ No newline at end of file
@@ -21,6 +21,11 @@ class ProgressDetails(Serializable):
         self.mutedMilliseconds = 0
         self.skippedMilliseconds = 0
         self.missingMilliseconds = 0
+        self.gaps = 0
+        self.gapFiles = 0
+        self.gapMilliseconds = 0
+        self.expiredFiles = 0
+        self.expiredMilliseconds = 0
         self.byteSize = 0
         self.totalByteSize = 0
 
@@ -35,6 +40,11 @@ class ProgressDetails(Serializable):
         self.mutedMilliseconds = progress.mutedMilliseconds
         self.skippedMilliseconds = progress.skippedMilliseconds
         self.missingMilliseconds = progress.missingMilliseconds
+        self.gaps = progress.gaps
+        self.gapFiles = progress.gapFiles
+        self.gapMilliseconds = progress.gapMilliseconds
+        self.expiredFiles = progress.expiredFiles
+        self.expiredMilliseconds = progress.expiredMilliseconds
         self.byteSize = progress.byteSize
         self.totalByteSize = progress.totalByteSize
 
@@ -0,0 +1,82 @@
+from .DownloadHistory import DownloadHistory
+
+from AppData.EncoderDecoder import Encoder
+
+import json
+import sqlite3
+
+
+class DownloadHistoryDatabase:
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS downloadHistory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel TEXT NOT NULL,
+                type TEXT NOT NULL,
+                startedAt INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS downloadHistoryChannel ON downloadHistory (channel, startedAt);
+            CREATE INDEX IF NOT EXISTS downloadHistoryStartedAt ON downloadHistory (startedAt);
+            CREATE INDEX IF NOT EXISTS downloadHistoryResult ON downloadHistory (result, startedAt);
+            """
+        )
+        self._connection.execute("UPDATE downloadHistory SET result = ? WHERE result = ?", (DownloadHistory.Result.aborted, DownloadHistory.Result.downloading))
+        self._connection.commit()
+
+    @staticmethod
+    def _getChannel(downloadHistory: DownloadHistory) -> str:
+        content = downloadHistory.downloadInfo.content
+        return (content.owner if downloadHistory.downloadInfo.type.isVideo() else content.broadcaster).login
+
+    @staticmethod
+    def _getRow(downloadHistory: DownloadHistory) -> tuple:
+        return (
+            DownloadHistoryDatabase._getChannel(downloadHistory),
+            downloadHistory.downloadInfo.type.toString(),
+            downloadHistory.startedAt.toMSecsSinceEpoch(),
+            downloadHistory.result,
+            json.dumps(Encoder.encode(downloadHistory))
+        )
+
+    def insert(self, downloadHistory: DownloadHistory) -> int:
+        cursor = self._connection.execute("INSERT INTO downloadHistory (channel, type, startedAt, result, data) VALUES (?, ?, ?, ?, ?)", self._getRow(downloadHistory))
+        self._connection.commit()
+        return cursor.lastrowid
+
+    def insertMany(self, downloadHistoryList: list[DownloadHistory]) -> None:
+        self._connection.executemany("INSERT INTO downloadHistory (channel, type, startedAt, result, data) VALUES (?, ?, ?, ?, ?)", [self._getRow(downloadHistory) for downloadHistory in downloadHistoryList])
+        self._connection.commit()
+
+    def updateMany(self, downloadHistoryList: list[tuple[int, DownloadHistory]]) -> None:
+        self._connection.executemany("UPDATE downloadHistory SET channel = ?, type = ?, startedAt = ?, result = ?, data = ? WHERE id = ?", [(*self._getRow(downloadHistory), historyId) for historyId, downloadHistory in downloadHistoryList])
+        self._connection.commit()
+
+    def delete(self, historyId: int) -> None:
+        self._connection.execute("DELETE FROM downloadHistory WHERE id = ?", (historyId,))
+        self._connection.commit()
+
+    def _getCondition(self, channel: str | None, result: str | None, startedAfter: int | None, startedBefore: int | None) -> tuple[str, list]:
+        conditions = []
+        parameters = []
+        for condition, value in (("channel = ?", channel), ("result = ?", result), ("startedAt >= ?", startedAfter), ("startedAt < ?", startedBefore)):
+            if value != None:
+                conditions.append(condition)
+                parameters.append(value)
+        return ("" if len(conditions) == 0 else f" WHERE {' AND '.join(conditions)}"), parameters
+
+    def count(self, channel: str | None = None, result: str | None = None, startedAfter: int | None = None, startedBefore: int | None = None) -> int:
+        condition, parameters = self._getCondition(channel, result, startedAfter, startedBefore)
+        return self._connection.execute(f"SELECT COUNT(*) FROM downloadHistory{condition}", parameters).fetchone()[0]
+
+    def select(self, offset: int, limit: int, channel: str | None = None, result: str | None = None, startedAfter: int | None = None, startedBefore: int | None = None) -> list[tuple[int, dict]]:
+        condition, parameters = self._getCondition(channel, result, startedAfter, startedBefore)
+        rows = self._connection.execute(f"SELECT id, data FROM downloadHistory{condition} ORDER BY startedAt DESC, id DESC LIMIT ? OFFSET ?", parameters + [limit, offset]).fetchall()
+        return [(historyId, json.loads(data)) for historyId, data in rows]
+
+    def close(self) -> None:
+        self._connection.close()
\ No newline at end of file
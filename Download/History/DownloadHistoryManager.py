@@ -1,8 +1,15 @@
+from .Config import Config
 from .DownloadHistory import DownloadHistory
+from .DownloadHistoryDatabase import DownloadHistoryDatabase
 
+from Core import App
+from Core.Config import Config as CoreConfig
+from Services.Logging.Logger import Logger
+from Services.Utils.OSUtils import OSUtils
 from Download.Downloader.Core.StreamDownloader import StreamDownloader
 from Download.Downloader.Core.VideoDownloader import VideoDownloader
 from Download.Downloader.Core.ClipDownloader import ClipDownloader
+from AppData.EncoderDecoder import Decoder
 
 from PyQt6 import QtCore
 
@@ -11,21 +18,106 @@ class DownloadHistoryManager(QtCore.QObject):
     historyCreated = QtCore.pyqtSignal(DownloadHistory)
     historyRemoved = QtCore.pyqtSignal(DownloadHistory)
 
-    def __init__(self, parent: QtCore.QObject | None = None):
+    def __init__(self, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
-        self.downloadHistory = []
+        self.logger = logger
+        self._histories: dict[int, DownloadHistory] = {}
+        self._historyIds: dict[DownloadHistory, int] = {}
+        self._activeHistories: list[DownloadHistory] = []
+        self._writeTimer = QtCore.QTimer(parent=self)
+        self._writeTimer.setSingleShot(True)
+        self._writeTimer.setInterval(Config.WRITE_INTERVAL)
+        self._writeTimer.timeout.connect(self._writeActiveHistories)
+        self._database = self._openDatabase()
+        App.Instance.aboutToQuit.connect(self._writeActiveHistories)
 
-    def setHistoryList(self, historyList: DownloadHistory) -> None:
-        self.downloadHistory = historyList
+    def _openDatabase(self) -> DownloadHistoryDatabase:
+        if not App.Instance.isDownloadHost():
+            try:
+                OSUtils.createDirectory(CoreConfig.APPDATA_PATH)
+                return DownloadHistoryDatabase(CoreConfig.HISTORY_DATABASE_FILE)
+            except Exception as e:
+                self.logger.error("Unable to open download history database.")
+                self.logger.exception(e)
+        return DownloadHistoryDatabase(":memory:")
 
-    def getHistoryList(self) -> list[DownloadHistory]:
-        return self.downloadHistory
+    def importHistoryList(self, historyList: list[DownloadHistory]) -> bool:
+        if len(historyList) == 0:
+            return True
+        try:
+            self._database.insertMany(historyList)
+        except Exception as e:
+            self.logger.error("Unable to import download history.")
+            self.logger.exception(e)
+            return False
+        self.logger.info(f"Imported {len(historyList)} download history entries.")
+        return True
+
+    def getHistoryCount(self, channel: str | None = None, result: str | None = None, startedAfter: QtCore.QDateTime | None = None, startedBefore: QtCore.QDateTime | None = None) -> int:
+        self._writeActiveHistories()
+        return self._database.count(
+            channel=channel,
+            result=result,
+            startedAfter=None if startedAfter == None else startedAfter.toMSecsSinceEpoch(),
+            startedBefore=None if startedBefore == None else startedBefore.toMSecsSinceEpoch()
+        )
+
+    def getHistoryPage(self, offset: int, limit: int = Config.PAGE_SIZE, channel: str | None = None, result: str | None = None, startedAfter: QtCore.QDateTime | None = None, startedBefore: QtCore.QDateTime | None = None) -> list[DownloadHistory]:
+        self._writeActiveHistories()
+        rows = self._database.select(
+            offset,
+            limit,
+            channel=channel,
+            result=result,
+            startedAfter=None if startedAfter == None else startedAfter.toMSecsSinceEpoch(),
+            startedBefore=None if startedBefore == None else startedBefore.toMSecsSinceEpoch()
+        )
+        historyList = []
+        for historyId, data in rows:
+            if historyId not in self._histories:
+                try:
+                    self._addHistory(historyId, Decoder.decode(data))
+                except Exception as e:
+                    self.logger.warning(f"Unable to load download history entry {historyId}.")
+                    self.logger.exception(e)
+                    continue
+            historyList.append(self._histories[historyId])
+        return historyList
+
+    def _addHistory(self, historyId: int, downloadHistory: DownloadHistory) -> None:
+        self._histories[historyId] = downloadHistory
+        self._historyIds[downloadHistory] = historyId
 
     def createHistory(self, downloader: StreamDownloader | VideoDownloader | ClipDownloader) -> None:
         downloadHistory = DownloadHistory(downloader, parent=None)
-        self.downloadHistory.append(downloadHistory)
+        self._addHistory(self._database.insert(downloadHistory), downloadHistory)
+        self._activeHistories.append(downloadHistory)
+        downloadHistory.historyUpdated.connect(self._scheduleWrite)
         self.historyCreated.emit(downloadHistory)
 
     def removeHistory(self, downloadHistory: DownloadHistory) -> None:
-        self.downloadHistory.remove(downloadHistory)
-        self.historyRemoved.emit(downloadHistory)
\ No newline at end of file
+        historyId = self._historyIds.pop(downloadHistory)
+        del self._histories[historyId]
+        if downloadHistory in self._activeHistories:
+            self._activeHistories.remove(downloadHistory)
+            downloadHistory.historyUpdated.disconnect(self._scheduleWrite)
+        self._database.delete(historyId)
+        self.historyRemoved.emit(downloadHistory)
+
+    def _scheduleWrite(self) -> None:
+        if not self._writeTimer.isActive():
+            self._writeTimer.start()
+
+    def _writeActiveHistories(self) -> None:
+        self._writeTimer.stop()
+        if len(self._activeHistories) == 0:
+            return
+        try:
+            self._database.updateMany([(self._historyIds[downloadHistory], downloadHistory) for downloadHistory in self._activeHistories])
+        except Exception as e:
+            self.logger.error("Unable to save download history.")
+            self.logger.exception(e)
+            return
+        for downloadHistory in [downloadHistory for downloadHistory in self._activeHistories if downloadHistory.result != DownloadHistory.Result.downloading]:
+            self._activeHistories.remove(downloadHistory)
+            downloadHistory.historyUpdated.disconnect(self._scheduleWrite)
\ No newline at end of file
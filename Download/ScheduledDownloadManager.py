@@ -14,6 +14,7 @@ from Download.Downloader.Core.StreamDownloader import StreamDownloader
 from Download.Downloader.Core.Engine.Config import Config
 from Download.ScheduledDownloadPreset import ScheduledDownloadPreset
 from Download.ScheduledDownloadPubSubManager import ScheduledDownloadPubSubSubscriber
+from Download.ScheduledDownloadStandby import ScheduledDownloadStandby
 from Ui.Components.Utils.FileNameGenerator import FileNameGenerator
 
 from PyQt6 import QtCore
@@ -105,6 +106,10 @@ class ScheduledDownload(QtCore.QObject):
         self._autoUpdateTimer = QtCore.QTimer(parent=self)
         self._autoUpdateTimer.setInterval(Config.CHANNEL_AUTO_UPDATE_INTERVAL)
         self._autoUpdateTimer.timeout.connect(self.updateChannelData)
+        self._standby = ScheduledDownloadStandby(self.preset.channel, parent=self)
+        self._streamUpTimer = QtCore.QElapsedTimer()
+        self._stageTimings: dict[str, int] = {}
+        self._integrityWarm = False
         self.downloader: StreamDownloader | None = None
         self.status = ScheduledDownloadStatus(parent=self)
         self.updateChannelData()
@@ -177,8 +182,10 @@ class ScheduledDownload(QtCore.QObject):
     def _syncAutoUpdate(self) -> None:
         if self.isActive() and self.isChannelRetrieved() and self.isOffline():
             self._autoUpdateTimer.start()
+            self._standby.start()
         else:
             self._autoUpdateTimer.stop()
+            self._standby.stop()
 
     def canStartDownload(self) -> bool:
         return self.isActive() and self.isChannelRetrieved() and self.isOnline() and not self.status.isGeneratingPlayback() and not self.status.isDownloading()
@@ -239,6 +246,7 @@ class ScheduledDownload(QtCore.QObject):
         topic, data = event.topic, event.data
         if topic.eventType == EventTypes.VideoPlaybackById:
             if data["type"] == "stream-up":
+                self._streamUpTimer.start()
                 self.setOnline()
                 self.channel.stream.createdAt = QtCore.QDateTime.fromSecsSinceEpoch(data["server_time"], QtCore.Qt.TimeSpec.UTC)
             elif data["type"] == "stream-down":
@@ -280,9 +288,21 @@ class ScheduledDownload(QtCore.QObject):
             self.status.setError(e)
         else:
             self.status.setGeneratingPlayback()
-            TwitchPlaybackGenerator.TwitchStreamPlaybackGenerator(self.channel.stream.broadcaster.login, parent=self).finished.connect(self._processStreamPlaybackResult)
+            if not self._streamUpTimer.isValid():
+                self._streamUpTimer.start()
+            self._stageTimings = {}
+            self._integrityWarm = App.TwitchIntegrityGenerator.hasValidIntegrity()
+            self._markStage("playback-requested")
+            TwitchPlaybackGenerator.TwitchStreamPlaybackGenerator(self.channel.stream.broadcaster.login, token=self._standby.takeToken(), parent=self).finished.connect(self._processStreamPlaybackResult)
+
+    def _markStage(self, stage: str) -> None:
+        if self._streamUpTimer.isValid():
+            self._stageTimings[stage] = self._streamUpTimer.elapsed()
 
     def _processStreamPlaybackResult(self, generator: TwitchPlaybackGenerator.TwitchStreamPlaybackGenerator) -> None:
+        requestedAt = self._stageTimings.get("playback-requested", 0)
+        for stage, elapsed in generator.getTimings().items():
+            self._stageTimings[f"{stage}(cached)" if stage == "access-token" and generator.isTokenReused() else stage] = requestedAt + elapsed
         if generator.getError() == None:
             if self.isActive() and self.isOnline():
                 streamPlayback = generator.getData()
@@ -311,12 +331,32 @@ class ScheduledDownload(QtCore.QObject):
             downloadInfo.setSkipAdsEnabled(self.preset.isSkipAdsEnabled())
         downloadInfo.setRemuxEnabled(self.preset.isRemuxEnabled())
         self.downloader = TwitchDownloader.create(downloadInfo, parent=self)
+        self.downloader.setBackfillEnabled(Config.STREAM_BACKFILL_ENABLED)
+        self.downloader.started.connect(self._downloaderStarted)
+        self.downloader.progress.updated.connect(self._downloaderProgressUpdated)
         self.downloader.finished.connect(self.downloadResultHandler)
+        self._markStage("downloader-created")
         self.downloaderCreated.emit(self, self.downloader)
         self.status.setDownloading()
         self.downloader.start()
 
+    def _downloaderStarted(self, downloader: StreamDownloader) -> None:
+        self._markStage("downloader-started")
+
+    def _downloaderProgressUpdated(self) -> None:
+        if self.downloader != None and self.downloader.progress.byteSize != 0:
+            self.downloader.progress.updated.disconnect(self._downloaderProgressUpdated)
+            self._markStage("first-segment")
+            self._logStageTimings(self.downloader)
+
+    def _logStageTimings(self, downloader: StreamDownloader) -> None:
+        if self._streamUpTimer.isValid():
+            stages = " / ".join(f"{stage}: {elapsed}ms" for stage, elapsed in sorted(self._stageTimings.items(), key=lambda item: item[1]))
+            downloader.logger.info(f"Stream-Up Latency: <integrity: {'warm' if self._integrityWarm else 'cold'} / {stages}>")
+            self._streamUpTimer.invalidate()
+
     def downloadResultHandler(self, downloader: StreamDownloader) -> None:
+        self._streamUpTimer.invalidate()
         error = downloader.status.getError()
         if error == None:
             self.setOffline()
@@ -390,7 +430,7 @@ class ScheduledDownloadManager(QtCore.QObject):
         if not self.isBlocked() and self.isEnabled() and any(scheduledDownload.isEnabled() for scheduledDownload in self.scheduledDownloads.values()):
             if not App.ScheduledDownloadPubSubManager.isOpened():
                 App.ScheduledDownloadPubSubManager.open()
-        else:
+        elif App.isServiceCreated("ScheduledDownloadPubSubManager"):
             if App.ScheduledDownloadPubSubManager.isOpened():
                 App.ScheduledDownloadPubSubManager.close()
 
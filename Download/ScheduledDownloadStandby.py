@@ -0,0 +1,54 @@
+from Core import App
+from Services.Twitch.GQL import TwitchGQLAPI
+from Services.Twitch.GQL import TwitchGQLModels
+from Services.Twitch.GQL.TwitchGQLConfig import Config as GQLConfig
+from Services.Twitch.Playback.TwitchPlaybackConfig import Config as PlaybackConfig
+from Services.Twitch.Authentication.Integrity.IntegrityToken import IntegrityToken
+from Download.Downloader.Core.Engine.Config import Config
+
+from PyQt6 import QtCore
+
+
+class ScheduledDownloadStandby(QtCore.QObject):
+    def __init__(self, login: str, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.login = login
+        self._token: TwitchGQLModels.StreamPlaybackAccessToken | None = None
+        self._tokenResponse: TwitchGQLAPI.TwitchGQLResponse | None = None
+        self._updateTimer = QtCore.QTimer(parent=self)
+        self._updateTimer.setInterval(Config.CHANNEL_STANDBY_UPDATE_INTERVAL)
+        self._updateTimer.timeout.connect(self.update)
+
+    def start(self) -> None:
+        if Config.CHANNEL_STANDBY_ENABLED and not self.isActive():
+            self._updateTimer.start()
+            self.update()
+
+    def stop(self) -> None:
+        self._updateTimer.stop()
+
+    def isActive(self) -> bool:
+        return self._updateTimer.isActive()
+
+    def update(self) -> None:
+        App.Account.getIntegrityToken(self._integrityTokenUpdated)
+        for url in (GQLConfig.SERVER, PlaybackConfig.HLS_SERVER):
+            App.NetworkAccessManager.connectToHostEncrypted(QtCore.QUrl(url).host())
+
+    def _integrityTokenUpdated(self, integrityToken: IntegrityToken | None) -> None:
+        if self.isActive() and not self.hasValidToken() and self._tokenResponse == None:
+            self._tokenResponse = App.TwitchGQL.getStreamPlaybackAccessToken(self.login)
+            self._tokenResponse.finished.connect(self._tokenUpdated)
+
+    def _tokenUpdated(self, response: TwitchGQLAPI.TwitchGQLResponse) -> None:
+        self._tokenResponse = None
+        if response.getError() == None:
+            self._token = response.getData()
+
+    def hasValidToken(self) -> bool:
+        return self._token != None and not self._token.isExpired(margin=Config.CHANNEL_STANDBY_TOKEN_EXPIRATION_MARGIN)
+
+    def takeToken(self) -> TwitchGQLModels.StreamPlaybackAccessToken | None:
+        token = self._token if self.hasValidToken() else None
+        self._token = None
+        return token
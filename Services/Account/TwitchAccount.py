@@ -64,8 +64,8 @@ class TwitchAccount(QtCore.QObject, Serializable):
         else:
             return self.oAuthToken.value
 
-    def updateIntegrityToken(self) -> None:
-        App.TwitchIntegrityGenerator.updateIntegrity(forceUpdate=True)
+    def updateIntegrityToken(self, forceUpdate: bool = True) -> None:
+        App.TwitchIntegrityGenerator.updateIntegrity(forceUpdate=forceUpdate)
 
     def getIntegrityToken(self, callback: typing.Callable) -> None:
         App.TwitchIntegrityGenerator.getIntegrity(callback)
\ No newline at end of file
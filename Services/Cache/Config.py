@@ -0,0 +1,23 @@
+from Core.Config import Config as CoreConfig, _P
+
+
+class Config:
+    CACHE_DIRECTORY = _P(CoreConfig.TEMP_PATH, "cache")
+    VARIANT_INDEX_FILE_NAME = "variants.json"
+    VARIANT_INDEX_MAX_SIZE = 10000
+
+    MAX_CACHE_SIZE = 268435456
+
+    CONTENT_TYPE_TTLS = [
+        ("image/", 604800)
+    ]
+    NON_CACHEABLE_CONTENT_TYPES = [
+        "application/json",
+        "application/vnd.apple.mpegurl",
+        "application/x-mpegurl",
+        "audio/mpegurl",
+        "audio/x-mpegurl"
+    ]
+    NON_CACHEABLE_EXTENSIONS = [
+        ".m3u8"
+    ]
\ No newline at end of file
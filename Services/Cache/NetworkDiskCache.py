@@ -0,0 +1,160 @@
+from .Config import Config
+
+from Core import App
+from Services.Utils.OSUtils import OSUtils
+from Services.Image.UrlFormatter import ImageUrlFormatter
+
+from PyQt6 import QtCore, QtNetwork
+
+import json
+
+
+class NetworkDiskCache(QtNetwork.QNetworkDiskCache):
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.setCacheDirectory(Config.CACHE_DIRECTORY)
+        self.setMaximumCacheSize(Config.MAX_CACHE_SIZE)
+        self._hits = 0
+        self._variantHits = 0
+        self._misses = 0
+        self._bytesSaved = 0
+        self._preparedUrls: dict[QtCore.QIODevice, QtCore.QUrl] = {}
+        self._variants: dict[str, dict[str, str]] = self._loadVariantIndex()
+        App.Instance.aboutToQuit.connect(self._shutdown)
+
+    def _getVariantIndexPath(self) -> str:
+        return OSUtils.joinPath(self.cacheDirectory(), Config.VARIANT_INDEX_FILE_NAME)
+
+    def _loadVariantIndex(self) -> dict[str, dict[str, str]]:
+        try:
+            with open(self._getVariantIndexPath(), encoding="utf-8") as file:
+                return json.load(file)
+        except:
+            return {}
+
+    def _saveVariantIndex(self) -> None:
+        try:
+            OSUtils.writeFileAtomic(self._getVariantIndexPath(), json.dumps(self._variants, separators=(",", ":")))
+        except:
+            pass
+
+    @staticmethod
+    def _getContentType(metaData: QtNetwork.QNetworkCacheMetaData) -> str:
+        for name, value in metaData.rawHeaders():
+            if name.data().decode().lower() == "content-type":
+                return value.data().decode().split(";", 1)[0].strip().lower()
+        return ""
+
+    @staticmethod
+    def _getTtl(contentType: str) -> int | None:
+        for prefix, ttl in Config.CONTENT_TYPE_TTLS:
+            if contentType.startswith(prefix):
+                return ttl
+        return None
+
+    @staticmethod
+    def _isCacheable(metaData: QtNetwork.QNetworkCacheMetaData, contentType: str) -> bool:
+        if not metaData.saveToDisk() or contentType in Config.NON_CACHEABLE_CONTENT_TYPES:
+            return False
+        path = metaData.url().path().lower()
+        return not any(path.endswith(extension) for extension in Config.NON_CACHEABLE_EXTENSIONS)
+
+    def prepare(self, metaData: QtNetwork.QNetworkCacheMetaData) -> QtCore.QIODevice | None:
+        contentType = self._getContentType(metaData)
+        if not self._isCacheable(metaData, contentType):
+            return None
+        now = QtCore.QDateTime.currentDateTimeUtc()
+        if metaData.expirationDate().isValid():
+            if metaData.expirationDate() <= now:
+                return None
+        else:
+            ttl = self._getTtl(contentType)
+            if ttl == None:
+                return None
+            metaData.setExpirationDate(now.addSecs(ttl))
+        self._misses += 1
+        device = super().prepare(metaData)
+        if device != None:
+            self._preparedUrls[device] = metaData.url()
+        return device
+
+    def insert(self, device: QtCore.QIODevice) -> None:
+        url = self._preparedUrls.pop(device, None)
+        super().insert(device)
+        if url != None:
+            self._addVariant(url.toString())
+
+    def remove(self, url: QtCore.QUrl) -> bool:
+        for device in [device for device, preparedUrl in self._preparedUrls.items() if preparedUrl == url]:
+            del self._preparedUrls[device]
+        return super().remove(url)
+
+    def metaData(self, url: QtCore.QUrl) -> QtNetwork.QNetworkCacheMetaData:
+        metaData = super().metaData(url)
+        if metaData.isValid():
+            return metaData
+        variantUrl = self._findVariant(url)
+        if variantUrl == None:
+            return metaData
+        variantMetaData = super().metaData(variantUrl)
+        variantMetaData.setUrl(url)
+        return variantMetaData
+
+    def data(self, url: QtCore.QUrl) -> QtCore.QIODevice | None:
+        device = super().data(url)
+        if device != None:
+            self._hits += 1
+            self._bytesSaved += device.size()
+            return device
+        variantUrl = self._findVariant(url)
+        if variantUrl == None:
+            return None
+        device = super().data(variantUrl)
+        if device != None:
+            self._variantHits += 1
+            self._bytesSaved += device.size()
+        return device
+
+    def _addVariant(self, url: str) -> None:
+        size = ImageUrlFormatter.getSize(url)
+        if size == None:
+            return
+        baseUrl = ImageUrlFormatter.formatUrl(url)
+        variants = self._variants.pop(baseUrl, {})
+        variants[f"{size[0]}x{size[1]}"] = url
+        self._variants[baseUrl] = variants
+        while len(self._variants) > Config.VARIANT_INDEX_MAX_SIZE:
+            del self._variants[next(iter(self._variants))]
+
+    def _findVariant(self, url: QtCore.QUrl) -> QtCore.QUrl | None:
+        urlString = url.toString()
+        size = ImageUrlFormatter.getSize(urlString)
+        if size == None:
+            return None
+        variants = self._variants.get(ImageUrlFormatter.formatUrl(urlString), {})
+        candidates = []
+        for variantSize, variantUrl in list(variants.items()):
+            width, height = (int(value) for value in variantSize.split("x"))
+            if variantUrl != urlString and width >= size[0] and height >= size[1]:
+                candidates.append((width * height, variantSize, variantUrl))
+        for area, variantSize, variantUrl in sorted(candidates):
+            if super().metaData(QtCore.QUrl(variantUrl)).isValid():
+                return QtCore.QUrl(variantUrl)
+            del variants[variantSize]
+        return None
+
+    def getStatistics(self) -> dict:
+        requests = self._hits + self._variantHits + self._misses
+        return {
+            "hits": self._hits,
+            "variantHits": self._variantHits,
+            "misses": self._misses,
+            "hitRate": 0 if requests == 0 else (self._hits + self._variantHits) / requests,
+            "bytesSaved": self._bytesSaved,
+            "cacheSize": self.cacheSize()
+        }
+
+    def _shutdown(self) -> None:
+        self._saveVariantIndex()
+        statistics = self.getStatistics()
+        App.Instance.logger.info(f"Network cache: {statistics['hits']} hits, {statistics['variantHits']} scaled variant hits, {statistics['misses']} misses ({statistics['hitRate']:.1%} hit rate), {statistics['bytesSaved']} bytes saved, {statistics['cacheSize']} bytes cached.")
\ No newline at end of file
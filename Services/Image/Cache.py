@@ -0,0 +1,48 @@
+from .Config import Config
+
+from PyQt6 import QtCore, QtGui
+
+import collections
+
+
+class ImageCache:
+    def __init__(self, maxSize: int = Config.MEMORY_CACHE_SIZE):
+        self.maxSize = maxSize
+        self._size = 0
+        self._entries: collections.OrderedDict[tuple[str, int, int], QtGui.QPixmap] = collections.OrderedDict()
+
+    @staticmethod
+    def getKey(url: QtCore.QUrl, size: QtCore.QSize | None) -> tuple[str, int, int]:
+        return (url.toString(), -1, -1) if size == None else (url.toString(), size.width(), size.height())
+
+    @staticmethod
+    def _getCost(pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key: tuple[str, int, int]) -> QtGui.QPixmap | None:
+        pixmap = self._entries.get(key)
+        if pixmap != None:
+            self._entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key: tuple[str, int, int], pixmap: QtGui.QPixmap) -> None:
+        self.remove(key)
+        cost = self._getCost(pixmap)
+        if cost > self.maxSize:
+            return
+        self._entries[key] = pixmap
+        self._size += cost
+        while self._size > self.maxSize:
+            self._size -= self._getCost(self._entries.popitem(last=False)[1])
+
+    def remove(self, key: tuple[str, int, int]) -> None:
+        pixmap = self._entries.pop(key, None)
+        if pixmap != None:
+            self._size -= self._getCost(pixmap)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def getSize(self) -> int:
+        return self._size
\ No newline at end of file
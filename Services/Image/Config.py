@@ -1,4 +1,7 @@
 class Config:
     IMAGE_FORCED_SIZE_POLICY = [
         ("vod-secure.twitch.tv/_404/", (320, 180))
-    ]
\ No newline at end of file
+    ]
+
+    MEMORY_CACHE_SIZE = 67108864
+    DECODER_THREAD_COUNT = 2
\ No newline at end of file
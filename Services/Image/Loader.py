@@ -1,3 +1,7 @@
+from .Config import Config
+from .Cache import ImageCache
+from .UrlFormatter import ImageUrlFormatter
+
 from Core import App
 
 from PyQt6 import QtCore, QtGui, QtNetwork
@@ -5,15 +9,39 @@ from PyQt6 import QtCore, QtGui, QtNetwork
 import typing
 
 
+class ImageDecoder(QtCore.QRunnable):
+    def __init__(self, request: "ImageRequest", data: bytes, size: QtCore.QSize | None):
+        super().__init__()
+        self.request = request
+        self.data = data
+        self.size = size
+
+    def run(self) -> None:
+        buffer = QtCore.QBuffer()
+        buffer.setData(self.data)
+        reader = QtGui.QImageReader(buffer)
+        reader.setAutoTransform(True)
+        imageSize = reader.size()
+        if self.size != None and imageSize.isValid() and (imageSize.width() > self.size.width() or imageSize.height() > self.size.height()):
+            reader.setScaledSize(imageSize.scaled(self.size, QtCore.Qt.AspectRatioMode.KeepAspectRatio))
+        self.request._imageDecoded.emit(reader.read())
+
+
 class ImageRequest(QtCore.QObject):
-    urlLoaded = QtCore.pyqtSignal(QtCore.QUrl)
+    requestFinished = QtCore.pyqtSignal(object)
     imageLoaded = QtCore.pyqtSignal(QtGui.QPixmap)
+    _imageDecoded = QtCore.pyqtSignal(QtGui.QImage)
 
-    def __init__(self, reply: QtNetwork.QNetworkReply, parent: QtCore.QObject | None = None):
+    def __init__(self, reply: QtNetwork.QNetworkReply, key: tuple[str, int, int], size: QtCore.QSize | None, decoderPool: QtCore.QThreadPool, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
+        self.key = key
+        self.pixmap = QtGui.QPixmap()
         self._clients = 0
+        self._size = size
+        self._decoderPool = decoderPool
         self._reply = reply
         self._reply.finished.connect(self._requestDone)
+        self._imageDecoded.connect(self._imageDecodedHandler)
 
     def connect(self, callback: typing.Callable) -> None:
         self.imageLoaded.connect(callback)
@@ -26,11 +54,19 @@ class ImageRequest(QtCore.QObject):
             self._reply.abort()
 
     def _requestDone(self) -> None:
-        pixmap = QtGui.QPixmap()
         if self._reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
-            pixmap.loadFromData(self._reply.readAll().data())
-        self.urlLoaded.emit(self._reply.request().url())
-        self.imageLoaded.emit(pixmap)
+            self._decoderPool.start(ImageDecoder(self, self._reply.readAll().data(), self._size))
+        else:
+            self._finish()
+
+    def _imageDecodedHandler(self, image: QtGui.QImage) -> None:
+        if not image.isNull():
+            self.pixmap = QtGui.QPixmap.fromImage(image)
+        self._finish()
+
+    def _finish(self) -> None:
+        self.requestFinished.emit(self)
+        self.imageLoaded.emit(self.pixmap)
         self.deleteLater()
 
 
@@ -38,27 +74,45 @@ class ImageLoader(QtCore.QObject):
     def __init__(self, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self._requests = {}
+        self._cache = ImageCache()
+        self._decoderPool = QtCore.QThreadPool(parent=self)
+        self._decoderPool.setMaxThreadCount(Config.DECODER_THREAD_COUNT)
+        App.Instance.aboutToQuit.connect(self._decoderPool.waitForDone)
 
-    def request(self, url: QtCore.QUrl, callback: typing.Callable, refresh: bool = False) -> None:
-        if not self._hasRequest(url):
+    def request(self, url: QtCore.QUrl, callback: typing.Callable, size: QtCore.QSize | None = None, refresh: bool = False) -> None:
+        key = ImageCache.getKey(url, size)
+        if not refresh and not self._hasRequest(key):
+            pixmap = self._cache.get(key)
+            if pixmap != None:
+                callback(pixmap)
+                return
+        if not self._hasRequest(key):
             networkRequest = QtNetwork.QNetworkRequest(url)
             networkRequest.setPriority(QtNetwork.QNetworkRequest.Priority.LowPriority)
             if refresh:
                 networkRequest.setAttribute(QtNetwork.QNetworkRequest.Attribute.CacheLoadControlAttribute, QtNetwork.QNetworkRequest.CacheLoadControl.AlwaysNetwork)
-            request = ImageRequest(reply=App.NetworkAccessManager.get(networkRequest), parent=self)
-            request.urlLoaded.connect(self._urlLoaded)
-            self._requests[url] = request
-        self._getRequest(url).connect(callback)
+            if size == None:
+                urlSize = ImageUrlFormatter.getSize(url.toString())
+                decodeSize = None if urlSize == None else QtCore.QSize(*urlSize)
+            else:
+                decodeSize = size
+            request = ImageRequest(reply=App.NetworkAccessManager.get(networkRequest), key=key, size=decodeSize, decoderPool=self._decoderPool, parent=self)
+            request.requestFinished.connect(self._requestFinished)
+            self._requests[key] = request
+        self._getRequest(key).connect(callback)
 
-    def cancelRequest(self, url: QtCore.QUrl, callback: typing.Callable) -> None:
-        if self._hasRequest(url):
-            self._getRequest(url).disconnect(callback)
+    def cancelRequest(self, url: QtCore.QUrl, callback: typing.Callable, size: QtCore.QSize | None = None) -> None:
+        key = ImageCache.getKey(url, size)
+        if self._hasRequest(key):
+            self._getRequest(key).disconnect(callback)
 
-    def _urlLoaded(self, url: QtCore.QUrl) -> None:
-        self._requests.pop(url)
+    def _requestFinished(self, request: ImageRequest) -> None:
+        self._requests.pop(request.key)
+        if not request.pixmap.isNull():
+            self._cache.put(request.key, request.pixmap)
 
-    def _hasRequest(self, url: QtCore.QUrl) -> bool:
-        return url in self._requests
+    def _hasRequest(self, key: tuple[str, int, int]) -> bool:
+        return key in self._requests
 
-    def _getRequest(self, url: QtCore.QUrl) -> ImageRequest:
-        return self._requests[url]
\ No newline at end of file
+    def _getRequest(self, key: tuple[str, int, int]) -> ImageRequest:
+        return self._requests[key]
\ No newline at end of file
@@ -20,4 +20,12 @@ class ImageUrlFormatter:
             try:
                 return url.format(width=width, height=height)
             except:
-                return url
\ No newline at end of file
+                return url
+
+    @classmethod
+    def getSize(cls, url: str) -> tuple[int, int] | None:
+        sizes = re.findall(cls.IMAGE_SIZE_FILTER, url)
+        if len(sizes) == 0:
+            return None
+        width, height = sizes[-1][1:].split("x")
+        return int(width), int(height)
\ No newline at end of file
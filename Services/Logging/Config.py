@@ -41,4 +41,14 @@ class Config:
             "maxLevel": logging.CRITICAL,
             "formatString": "[%(asctime)s][%(levelname)s][%(filename)s:%(lineno)s] %(message)s"
         }
-    ]
\ No newline at end of file
+    ]
+
+    MAX_FILE_SIZE = 10485760
+    BACKUP_COUNT = 5
+    WRITE_BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 1
+    FLUSH_TIMEOUT = 5
+
+    RATE_LIMIT_MAX_LEVEL = logging.WARNING
+    RATE_LIMIT_INTERVAL = 10
+    RATE_LIMIT_BURST = 50
\ No newline at end of file
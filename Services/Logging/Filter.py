@@ -1,4 +1,9 @@
+from .Config import Config
+
+from PyQt6 import QtCore
+
 import logging
+import time
 
 
 class RangeFilter(logging.Filter):
@@ -8,4 +13,35 @@ class RangeFilter(logging.Filter):
         self.maxLevel = maxLevel
 
     def filter(self, record: logging.LogRecord) -> bool:
-        return self.minLevel <= record.levelno <= self.maxLevel
\ No newline at end of file
+        return self.minLevel <= record.levelno <= self.maxLevel
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, maxLevel: int = Config.RATE_LIMIT_MAX_LEVEL, interval: float = Config.RATE_LIMIT_INTERVAL, burst: int = Config.RATE_LIMIT_BURST):
+        super().__init__()
+        self.maxLevel = maxLevel
+        self.interval = interval
+        self.burst = burst
+        self._mutex = QtCore.QMutex()
+        self._sources: dict[tuple[str, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.maxLevel:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with QtCore.QMutexLocker(self._mutex):
+            source = self._sources.get(key)
+            if source == None or now - source[0] >= self.interval:
+                suppressedCount = 0 if source == None else source[2]
+                self._sources[key] = [now, 1, 0]
+            elif source[1] < self.burst:
+                source[1] += 1
+                suppressedCount = 0
+            else:
+                source[2] += 1
+                return False
+        if suppressedCount != 0:
+            record.msg = f"{record.getMessage()} ({suppressedCount} similar messages were suppressed)"
+            record.args = None
+        return True
\ No newline at end of file
@@ -1,6 +1,12 @@
-from .Filter import RangeFilter
+from .Config import Config
+from .Filter import RangeFilter, RateLimitFilter
 
 import logging
+import logging.handlers
+import gzip
+import os
+import queue
+import shutil
 
 
 class StreamHandler(logging.StreamHandler):
@@ -12,8 +18,60 @@ class StreamHandler(logging.StreamHandler):
 
 
 class FileHandler(logging.FileHandler):
-    def __init__(self, filePath: str, minLevel: int = logging.DEBUG, maxLevel: int = logging.CRITICAL, formatString: str | None = None):
-        super().__init__(filePath, encoding="utf-8")
-        self.setLevel(minLevel)
-        self.setFormatter(logging.Formatter(formatString))
-        self.addFilter(RangeFilter(minLevel, maxLevel))
\ No newline at end of file
+    def __init__(self, filePath: str, formats: list[dict]):
+        super().__init__(filePath, encoding="utf-8", delay=True)
+        self._formats = [(RangeFilter(handler["minLevel"], handler["maxLevel"]), logging.Formatter(handler["formatString"])) for handler in formats]
+        self._size = os.path.getsize(filePath) if os.path.isfile(filePath) else 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=Config.WRITE_BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
+
+    def _getFormatter(self, record: logging.LogRecord) -> logging.Formatter | None:
+        for rangeFilter, formatter in self._formats:
+            if rangeFilter.filter(record):
+                return formatter
+        return None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        formatter = self._getFormatter(record)
+        if formatter == None:
+            return
+        try:
+            message = f"{formatter.format(record)}{self.terminator}"
+            if self._size != 0 and self._size + len(message) > Config.MAX_FILE_SIZE:
+                self._rotate()
+            if self.stream == None:
+                self.stream = self._open()
+            self.stream.write(message)
+            self._size += len(message)
+        except Exception:
+            self.handleError(record)
+
+    def _getBackupPath(self, index: int) -> str:
+        return f"{self.baseFilename}.{index}.gz"
+
+    def _rotate(self) -> None:
+        if self.stream != None:
+            self.stream.close()
+            self.stream = None
+        for index in range(Config.BACKUP_COUNT - 1, 0, -1):
+            if os.path.isfile(self._getBackupPath(index)):
+                os.replace(self._getBackupPath(index), self._getBackupPath(index + 1))
+        with open(self.baseFilename, "rb") as source, gzip.open(self._getBackupPath(1), "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(self.baseFilename)
+        self._size = 0
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, recordQueue: queue.SimpleQueue, filePath: str, formats: list[dict]):
+        super().__init__(recordQueue)
+        self.filePath = filePath
+        self.formats = formats
+        self.addFilter(RateLimitFilter())
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.logFilePath = self.filePath
+        record.logFormats = self.formats
+        return record
\ No newline at end of file
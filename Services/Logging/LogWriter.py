@@ -0,0 +1,76 @@
+from .Config import Config
+from .Handler import FileHandler
+
+import logging
+import logging.handlers
+import atexit
+import queue
+import threading
+import time
+
+
+class _CloseRequest:
+    def __init__(self, filePath: str):
+        self.filePath = filePath
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.event = threading.Event()
+
+
+class LogWriter(logging.handlers.QueueListener):
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self._fileHandlers: dict[str, FileHandler] = {}
+        self._pendingHandlers: set[FileHandler] = set()
+        self._lastFlush = time.monotonic()
+
+    def handle(self, request: logging.LogRecord | _CloseRequest | _FlushRequest) -> None:
+        if isinstance(request, _FlushRequest):
+            self._flush()
+            request.event.set()
+            return
+        elif isinstance(request, _CloseRequest):
+            fileHandler = self._fileHandlers.pop(request.filePath, None)
+            if fileHandler != None:
+                self._pendingHandlers.discard(fileHandler)
+                fileHandler.close()
+            return
+        fileHandler = self._fileHandlers.get(request.logFilePath)
+        if fileHandler == None:
+            fileHandler = FileHandler(request.logFilePath, request.logFormats)
+            self._fileHandlers[request.logFilePath] = fileHandler
+        fileHandler.handle(request)
+        self._pendingHandlers.add(fileHandler)
+        if self.queue.empty() or time.monotonic() - self._lastFlush >= Config.FLUSH_INTERVAL:
+            self._flush()
+
+    def _flush(self) -> None:
+        for fileHandler in self._pendingHandlers:
+            fileHandler.flush()
+        self._pendingHandlers.clear()
+        self._lastFlush = time.monotonic()
+
+    def close(self, filePath: str) -> None:
+        self.queue.put_nowait(_CloseRequest(filePath))
+
+    def flush(self, timeout: float = Config.FLUSH_TIMEOUT) -> None:
+        if self._thread == None:
+            return
+        request = _FlushRequest()
+        self.queue.put_nowait(request)
+        request.event.wait(timeout)
+
+    def stop(self) -> None:
+        if self._thread != None:
+            super().stop()
+        for fileHandler in self._fileHandlers.values():
+            fileHandler.close()
+        self._fileHandlers.clear()
+        self._pendingHandlers.clear()
+
+
+Writer = LogWriter()
+Writer.start()
+atexit.register(Writer.stop)
\ No newline at end of file
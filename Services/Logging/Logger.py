@@ -1,4 +1,5 @@
-from .Handler import StreamHandler, FileHandler
+from .Handler import StreamHandler, QueueHandler
+from .LogWriter import Writer
 from .Config import Config
 
 from Services.Utils.OSUtils import OSUtils
@@ -49,18 +50,15 @@ class Logger:
                     ))
             if self.filePath == "":
                 return
-            for handler in Config.FILE_HANDLERS:
-                if self._filterHandler(handler):
-                    self.logger.addHandler(FileHandler(
-                        self.filePath,
-                        minLevel=handler["minLevel"],
-                        maxLevel=handler["maxLevel"],
-                        formatString=handler["formatString"]
-                    ))
+            self.logger.addHandler(QueueHandler(Writer.queue, self.filePath, [handler for handler in Config.FILE_HANDLERS if self._filterHandler(handler)]))
 
     def getPath(self) -> str:
         return self.filePath
 
+    @classmethod
+    def flush(cls) -> None:
+        Writer.flush()
+
     @classmethod
     def getFormattedTime(cls) -> str:
         return QtCore.QDateTime.currentDateTimeUtc().toString("yyyy.MM.dd_HH-mm-ss")
@@ -98,4 +96,7 @@ class Logger:
             if self.instanceList[self.logger.name] == 0:
                 self.instanceList.pop(self.logger.name)
                 while len(self.logger.handlers) != 0:
-                    self.logger.removeHandler(self.logger.handlers[0])
\ No newline at end of file
+                    handler = self.logger.handlers[0]
+                    self.logger.removeHandler(handler)
+                    if isinstance(handler, QueueHandler):
+                        Writer.close(handler.filePath)
\ No newline at end of file
@@ -1,5 +1,4 @@
-from Core.Config import Config
-from Services.Utils.OSUtils import OSUtils
+from Services.Cache.NetworkDiskCache import NetworkDiskCache
 
 from PyQt6 import QtCore, QtNetwork
 
@@ -7,6 +6,4 @@ from PyQt6 import QtCore, QtNetwork
 class NetworkAccessManager(QtNetwork.QNetworkAccessManager):
     def __init__(self, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
-        cache = QtNetwork.QNetworkDiskCache()
-        cache.setCacheDirectory(OSUtils.joinPath(Config.TEMP_PATH, "cache"))
-        self.setCache(cache)
\ No newline at end of file
+        self.setCache(NetworkDiskCache())
\ No newline at end of file
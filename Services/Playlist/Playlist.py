@@ -18,6 +18,7 @@ class Playlist:
         self._targetDuration: int = 0
         self._endList = False
         self._segments: list[Segment] = []
+        self._prefetchSegments: list[Segment] = []
 
     def setVersion(self, version: int) -> None:
         self._version = version
@@ -46,6 +47,12 @@ class Playlist:
     def getSegments(self) -> list[Segment]:
         return self._segments
 
+    def setPrefetchSegments(self, prefetchSegments: list[Segment]) -> None:
+        self._prefetchSegments = prefetchSegments
+
+    def getPrefetchSegments(self) -> list[Segment]:
+        return self._prefetchSegments
+
     @property
     def totalMilliseconds(self) -> int:
         return 0 if len(self._segments) == 0 else self._segments[-1].endsAt
@@ -62,6 +69,7 @@ class Playlist:
             mediaSequence = 0
             endList = False
             segments = []
+            prefetchUrls = []
             expectSegment = []
             elapsedMilliseconds = 0
             assert PlaylistTagReader.getTag(lines[0]) == PlaylistTag("EXTM3U")
@@ -81,20 +89,32 @@ class Playlist:
                     elif tag.name == "EXTINF":
                         expectSegment.append(tag)
                     elif tag.name == "EXT-X-DISCONTINUITY":
-                        pass
+                        expectSegment.append(tag)
+                    elif tag.name == "EXT-X-TWITCH-PREFETCH":
+                        prefetchUrls.append(line.split(":", 1)[1])
                 elif len(expectSegment) != 0:
                     programDateTime = None
                     durationMilliseconds = None
+                    discontinuity = False
                     for tag in expectSegment:
                         if tag.name == "EXT-X-PROGRAM-DATE-TIME":
                             programDateTime = QtCore.QDateTime.fromString(tag.data[0], QtCore.Qt.DateFormat.ISODateWithMs)
                         elif tag.name == "EXTINF":
                             durationMilliseconds = int(float(tag.data[0]) * 1000)
+                            title = tag.data[1]
+                        elif tag.name == "EXT-X-DISCONTINUITY":
+                            discontinuity = True
                     if durationMilliseconds == None:
                         continue
-                    segments.append(Segment(mediaSequence + len(segments), QtCore.QUrl(line) if baseUrl == None else baseUrl.resolved(QtCore.QUrl(line)), programDateTime, durationMilliseconds, elapsedMilliseconds, tag.data[1]))
+                    segments.append(Segment(mediaSequence + len(segments), QtCore.QUrl(line) if baseUrl == None else baseUrl.resolved(QtCore.QUrl(line)), programDateTime, durationMilliseconds, elapsedMilliseconds, title, discontinuity))
                     elapsedMilliseconds += durationMilliseconds
                     expectSegment.clear()
+            prefetchSegments = []
+            for url in prefetchUrls:
+                durationMilliseconds = segments[-1].totalMilliseconds if len(segments) != 0 else targetDuration * 1000
+                programDateTime = None if len(segments) == 0 or segments[-1].datetime == None else segments[-1].datetime.addMSecs(elapsedMilliseconds - segments[-1].startsAt)
+                prefetchSegments.append(Segment(mediaSequence + len(segments) + len(prefetchSegments), QtCore.QUrl(url) if baseUrl == None else baseUrl.resolved(QtCore.QUrl(url)), programDateTime, durationMilliseconds, elapsedMilliseconds))
+                elapsedMilliseconds += durationMilliseconds
         except:
             raise Exceptions.InvalidPlaylist
         else:
@@ -102,6 +122,7 @@ class Playlist:
             self.setTargetDuration(targetDuration)
             self.setEndList(endList)
             self.setSegments(segments)
+            self.setPrefetchSegments(prefetchSegments)
 
     def getSegmentRange(self, mSecsFrom: int | None = None, mSecsTo: int | None = None) -> tuple[int | None, int | None]:
         if mSecsFrom != None:
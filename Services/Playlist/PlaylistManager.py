@@ -1,3 +1,4 @@
+from Core import App
 from Core.GlobalExceptions import Exceptions
 from Services.Playlist import Playlist
 from Services.Playlist.Segment import Segment
@@ -10,6 +11,7 @@ import typing
 class PlaylistManager(QtCore.QObject):
     playlistUpdated = QtCore.pyqtSignal()
     errorOccurred = QtCore.pyqtSignal(Exception)
+    _sharedPlaylistLoaded = QtCore.pyqtSignal(str, object)
 
     def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, url: QtCore.QUrl, timeout: int = 10000, maxRetryCount: int = 2, retryInterval: int = 1000, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
@@ -30,6 +32,13 @@ class PlaylistManager(QtCore.QObject):
         self._currentNetworkError: QtNetwork.QNetworkReply.NetworkError | None = None
         self._retryCount = 0
         self._nextSequence = 0
+        self._text: str | None = None
+        self._endList = False
+        self._hub: QtCore.QObject | None = None
+        self._hubKey: str | None = None
+        self._hubOwner = False
+        self._hubWaiting = False
+        self._sharedPlaylistLoaded.connect(self._sharedPlaylistReceived, QtCore.Qt.ConnectionType.QueuedConnection)
 
     def update(self) -> None:
         if self._reply == None:
@@ -38,15 +47,60 @@ class PlaylistManager(QtCore.QObject):
             self._updatePlaylist()
 
     def _updatePlaylist(self) -> None:
-        if self._reply == None:
+        if self._reply == None and not self._hubWaiting:
             self._error = None
             self._running = True
+            if self._hub != None and self._retryCount == 0:
+                text = self._hub.getPlaylist(self._hubKey)
+                if text != None:
+                    self._hubWaiting = True
+                    self._sharedPlaylistLoaded.emit(self._hubKey, text)
+                    return
+                elif not self._hub.requestPlaylist(self._hubKey):
+                    self._hubWaiting = True
+                    return
+                self._hubOwner = True
+            self._sendRequest()
+
+    def _sendRequest(self) -> None:
+        if App.RetryPolicy.allowRequest(self.url):
             self._reply = self._networkAccessManager.get(self._request)
             self._reply.finished.connect(self._requestDone)
+        else:
+            self._publishPlaylist(None)
+            self._retryTimer.start(App.RetryPolicy.getWaitTime(self.url))
+
+    def setHub(self, hub: QtCore.QObject, key: str) -> None:
+        self._hub = hub
+        self._hubKey = key
+        self._hub.playlistPublished.connect(self._sharedPlaylistReceived)
+
+    def _sharedPlaylistReceived(self, key: str, text: str | None) -> None:
+        if not self._hubWaiting or key != self._hubKey:
+            return
+        self._hubWaiting = False
+        if self._error != None:
+            return
+        if text == None:
+            self._sendRequest()
+        else:
+            self._loadPlaylist(text)
+
+    def _publishPlaylist(self, text: str | None) -> None:
+        if self._hubOwner:
+            self._hubOwner = False
+            self._hub.publishPlaylist(self._hubKey, text)
 
     def abort(self) -> None:
         self._raiseException(Exceptions.AbortRequested())
 
+    def setUrl(self, url: QtCore.QUrl) -> None:
+        self.url = url
+        self._text = None
+        timeout = self._request.transferTimeout()
+        self._request = QtNetwork.QNetworkRequest(self.url)
+        self._request.setTransferTimeout(timeout)
+
     def isRunning(self) -> bool:
         return self._running
 
@@ -56,27 +110,53 @@ class PlaylistManager(QtCore.QObject):
         if self._error != None:
             return
         if reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
+            App.RetryPolicy.recordSuccess(self.url)
             self._currentNetworkError = None
-            try:
-                self.playlist.loads(reply.readAll().data().decode(), baseUrl=self.url)
-            except Exception as e:
-                self._raiseException(e)
+            if reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 304 and self._text != None:
+                text = self._text
             else:
-                self._running = False
-                self.playlistUpdated.emit()
-        elif self._currentNetworkError == QtNetwork.QNetworkReply.NetworkError.ContentAccessDenied and self._retryCount != 0:
+                text = reply.readAll().data().decode()
+                self._updateValidators(reply)
+            self._publishPlaylist(text)
+            self._loadPlaylist(text)
+            return
+        self._publishPlaylist(None)
+        App.RetryPolicy.recordFailure(self.url, reply.error())
+        if self._currentNetworkError in (QtNetwork.QNetworkReply.NetworkError.ContentAccessDenied, QtNetwork.QNetworkReply.NetworkError.ContentGoneError) and self._retryCount != 0:
             self._raiseException(Exceptions.NetworkError(reply))
         elif self._retryCount < self._maxRetryCount:
             self._currentNetworkError = reply.error()
             self._retryCount += 1
-            self._retryTimer.start(self._retryInterval)
+            self._retryTimer.start(max(App.RetryPolicy.getBackoff(self._retryCount, baseDelay=self._retryInterval, maxDelay=self._retryInterval * 2), App.RetryPolicy.getWaitTime(self.url)))
         else:
             self._raiseException(Exceptions.NetworkError(reply))
 
+    def _updateValidators(self, reply: QtNetwork.QNetworkReply) -> None:
+        for headerName, validatorName in ((b"ETag", b"If-None-Match"), (b"Last-Modified", b"If-Modified-Since")):
+            value = reply.rawHeader(headerName)
+            if not value.isEmpty():
+                self._request.setRawHeader(QtCore.QByteArray(validatorName), value)
+
+    def _loadPlaylist(self, text: str) -> None:
+        if text == self._text:
+            self.playlist.setEndList(self._endList)
+        else:
+            try:
+                self.playlist.loads(text, baseUrl=self.url)
+            except Exception as e:
+                self._raiseException(e)
+                return
+            self._text = text
+            self._endList = self.playlist.isEndList()
+        self._running = False
+        self.playlistUpdated.emit()
+
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.NetworkError | Playlist.Exceptions.InvalidPlaylist) -> None:
         if self._error != None:
             return
         self._error = exception
+        self._hubWaiting = False
+        self._publishPlaylist(None)
         if self._reply != None:
             self._reply.abort()
         if self._retryTimer.isActive():
@@ -94,6 +174,9 @@ class PlaylistManager(QtCore.QObject):
         else:
             return segments[-1].sequence >= self._nextSequence
 
+    def getNextSequence(self) -> int:
+        return self._nextSequence
+
     def getNewSegments(self) -> typing.Generator[Segment, None, None]:
         for segment in self.playlist.getRangedSegments(*self._range):
             if segment.sequence >= self._nextSequence:
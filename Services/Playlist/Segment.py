@@ -2,13 +2,14 @@ from PyQt6 import QtCore
 
 
 class Segment:
-    def __init__(self, sequence: int, url: QtCore.QUrl, datetime: QtCore.QDateTime | None, totalMilliseconds: int, startsAt: int, title: str = ""):
+    def __init__(self, sequence: int, url: QtCore.QUrl, datetime: QtCore.QDateTime | None, totalMilliseconds: int, startsAt: int, title: str = "", discontinuity: bool = False):
         self.sequence = sequence
         self.url = url
         self.datetime = datetime
         self.totalMilliseconds = totalMilliseconds
         self.startsAt = startsAt
         self.title = title
+        self.discontinuity = discontinuity
 
     @property
     def endsAt(self) -> int:
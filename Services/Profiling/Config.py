@@ -0,0 +1,7 @@
+class Config:
+    ENVIRONMENT_VARIABLE = "TWITCHLINK_PROFILE_STARTUP"
+    REPORT_ENVIRONMENT_VARIABLE = "TWITCHLINK_PROFILE_STARTUP_REPORT"
+    ARGUMENT = "--profile-startup"
+    EXIT_VALUE = "exit"
+
+    REPORT_IMPORT_COUNT = 50
\ No newline at end of file
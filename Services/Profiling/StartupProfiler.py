@@ -0,0 +1,140 @@
+from .Config import Config
+
+import contextlib
+import importlib.abc
+import json
+import os
+import sys
+import time
+import typing
+
+
+class ProfilerPhase:
+    def __init__(self, name: str, startedAt: float):
+        self.name = name
+        self.startedAt = startedAt
+        self.finishedAt: float | None = None
+
+    def getElapsed(self) -> int:
+        return int(((self.finishedAt or time.perf_counter()) - self.startedAt) * 1000)
+
+
+class _TimedLoader:
+    def __init__(self, profiler: "StartupProfiler", loader: importlib.abc.Loader):
+        self._profiler = profiler
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: typing.Any) -> typing.Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: typing.Any) -> None:
+        module.__loader__ = self._loader
+        if module.__spec__ != None:
+            module.__spec__.loader = self._loader
+        self._profiler._enterImport(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exitImport()
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path: typing.Any, target: typing.Any = None) -> typing.Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec != None:
+                if spec.loader != None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(self._profiler, spec.loader)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    def __init__(self):
+        self._startedAt = time.perf_counter()
+        value = os.getenv(Config.ENVIRONMENT_VARIABLE, "")
+        self._enabled = value != "" or Config.ARGUMENT in sys.argv
+        self._exitRequested = value == Config.EXIT_VALUE
+        self._phases: list[ProfilerPhase] = []
+        self._imports: list[tuple[str, int, float, float]] = []
+        self._importStack: list[list] = []
+        self._importTimer: _ImportTimer | None = None
+        if self._enabled:
+            self._importTimer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._importTimer)
+
+    def isEnabled(self) -> bool:
+        return self._enabled
+
+    def isExitRequested(self) -> bool:
+        return self._exitRequested
+
+    def getElapsed(self) -> int:
+        return int((time.perf_counter() - self._startedAt) * 1000)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[ProfilerPhase]:
+        phase = ProfilerPhase(name, time.perf_counter())
+        self._phases.append(phase)
+        try:
+            yield phase
+        finally:
+            phase.finishedAt = time.perf_counter()
+
+    def _enterImport(self, name: str) -> None:
+        self._importStack.append([name, time.perf_counter(), 0.0])
+
+    def _exitImport(self) -> None:
+        name, startedAt, childTime = self._importStack.pop()
+        cumulativeTime = time.perf_counter() - startedAt
+        if len(self._importStack) != 0:
+            self._importStack[-1][2] += cumulativeTime
+        self._imports.append((name, len(self._importStack), cumulativeTime - childTime, cumulativeTime))
+
+    def stop(self) -> None:
+        if self._importTimer != None:
+            sys.meta_path.remove(self._importTimer)
+            self._importTimer = None
+
+    def getReport(self) -> dict:
+        toMilliseconds = lambda value: round(value * 1000, 3)
+        return {
+            "total": toMilliseconds(time.perf_counter() - self._startedAt),
+            "phases": [
+                {
+                    "name": phase.name,
+                    "start": toMilliseconds(phase.startedAt - self._startedAt),
+                    "duration": None if phase.finishedAt == None else toMilliseconds(phase.finishedAt - phase.startedAt)
+                } for phase in self._phases
+            ],
+            "imports": {
+                "count": len(self._imports),
+                "total": toMilliseconds(sum(cumulativeTime for name, depth, selfTime, cumulativeTime in self._imports if depth == 0)),
+                "slowest": [
+                    {
+                        "module": name,
+                        "depth": depth,
+                        "self": toMilliseconds(selfTime),
+                        "cumulative": toMilliseconds(cumulativeTime)
+                    } for name, depth, selfTime, cumulativeTime in sorted(self._imports, key=lambda item: item[3], reverse=True)[:Config.REPORT_IMPORT_COUNT]
+                ]
+            }
+        }
+
+    def writeReport(self, defaultPath: str) -> str:
+        self.stop()
+        path = os.getenv(Config.REPORT_ENVIRONMENT_VARIABLE) or defaultPath
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.getReport(), file, indent=4)
+        return path
+
+
+Profiler = StartupProfiler()
\ No newline at end of file
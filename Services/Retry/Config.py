@@ -0,0 +1,11 @@
+class Config:
+    BACKOFF_BASE_DELAY = 1000
+    BACKOFF_MAX_DELAY = 30000
+
+    BUDGET_MAX_TOKENS = 100
+    BUDGET_TOKENS_PER_REQUEST = 0.2
+
+    CIRCUIT_BREAKER_WINDOW_SIZE = 20
+    CIRCUIT_BREAKER_MIN_REQUESTS = 10
+    CIRCUIT_BREAKER_ERROR_RATE = 0.5
+    CIRCUIT_BREAKER_OPEN_TIME = 10000
@@ -0,0 +1,117 @@
+from .Config import Config
+
+from Services.Logging.Logger import Logger
+
+from PyQt6 import QtCore, QtNetwork
+
+import collections
+import random
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self):
+        self._state = self.CLOSED
+        self._results: collections.deque[bool] = collections.deque(maxlen=Config.CIRCUIT_BREAKER_WINDOW_SIZE)
+        self._openTimer = QtCore.QElapsedTimer()
+
+    def getState(self) -> str:
+        return self._state
+
+    def allowRequest(self) -> bool:
+        if self._state == self.CLOSED:
+            return True
+        if self._openTimer.elapsed() < Config.CIRCUIT_BREAKER_OPEN_TIME:
+            return False
+        self._state = self.HALF_OPEN
+        self._openTimer.start()
+        return True
+
+    def getWaitTime(self) -> int:
+        return 0 if self._state == self.CLOSED else max(Config.CIRCUIT_BREAKER_OPEN_TIME - self._openTimer.elapsed(), 0)
+
+    def recordResult(self, success: bool) -> bool:
+        if self._state == self.HALF_OPEN:
+            if success:
+                self._state = self.CLOSED
+                self._results.clear()
+            else:
+                self._open()
+            return False
+        self._results.append(success)
+        if self._state == self.CLOSED and len(self._results) >= Config.CIRCUIT_BREAKER_MIN_REQUESTS and self._results.count(False) / len(self._results) >= Config.CIRCUIT_BREAKER_ERROR_RATE:
+            self._open()
+            return True
+        return False
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._openTimer.start()
+
+
+class RetryPolicy(QtCore.QObject):
+    HOST_FAILURE_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.ConnectionRefusedError,
+        QtNetwork.QNetworkReply.NetworkError.RemoteHostClosedError,
+        QtNetwork.QNetworkReply.NetworkError.HostNotFoundError,
+        QtNetwork.QNetworkReply.NetworkError.TimeoutError,
+        QtNetwork.QNetworkReply.NetworkError.OperationCanceledError,
+        QtNetwork.QNetworkReply.NetworkError.SslHandshakeFailedError,
+        QtNetwork.QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+        QtNetwork.QNetworkReply.NetworkError.NetworkSessionFailedError,
+        QtNetwork.QNetworkReply.NetworkError.UnknownNetworkError,
+        QtNetwork.QNetworkReply.NetworkError.ProxyTimeoutError,
+        QtNetwork.QNetworkReply.NetworkError.InternalServerError,
+        QtNetwork.QNetworkReply.NetworkError.ServiceUnavailableError,
+        QtNetwork.QNetworkReply.NetworkError.UnknownServerError
+    )
+
+    def __init__(self, logger: Logger, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.logger = logger
+        self._mutex = QtCore.QMutex()
+        self._circuitBreakers: dict[str, CircuitBreaker] = {}
+        self._retryTokens = float(Config.BUDGET_MAX_TOKENS)
+
+    def getBackoff(self, attempt: int, baseDelay: int | None = None, maxDelay: int | None = None) -> int:
+        baseDelay = Config.BACKOFF_BASE_DELAY if baseDelay == None else baseDelay
+        maxDelay = Config.BACKOFF_MAX_DELAY if maxDelay == None else maxDelay
+        return random.randint(0, min(maxDelay, baseDelay * 2 ** max(attempt - 1, 0)))
+
+    def _getCircuitBreaker(self, host: str) -> CircuitBreaker:
+        if host not in self._circuitBreakers:
+            self._circuitBreakers[host] = CircuitBreaker()
+        return self._circuitBreakers[host]
+
+    def allowRequest(self, url: QtCore.QUrl) -> bool:
+        with QtCore.QMutexLocker(self._mutex):
+            return self._getCircuitBreaker(url.host()).allowRequest()
+
+    def getWaitTime(self, url: QtCore.QUrl) -> int:
+        with QtCore.QMutexLocker(self._mutex):
+            return self._getCircuitBreaker(url.host()).getWaitTime()
+
+    def recordSuccess(self, url: QtCore.QUrl) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            self._retryTokens = min(self._retryTokens + Config.BUDGET_TOKENS_PER_REQUEST, Config.BUDGET_MAX_TOKENS)
+            self._getCircuitBreaker(url.host()).recordResult(True)
+
+    def recordFailure(self, url: QtCore.QUrl, error: QtNetwork.QNetworkReply.NetworkError) -> None:
+        if error not in self.HOST_FAILURE_ERRORS:
+            self.recordSuccess(url)
+            return
+        with QtCore.QMutexLocker(self._mutex):
+            self._retryTokens = min(self._retryTokens + Config.BUDGET_TOKENS_PER_REQUEST, Config.BUDGET_MAX_TOKENS)
+            tripped = self._getCircuitBreaker(url.host()).recordResult(False)
+        if tripped:
+            self.logger.warning(f"Circuit breaker opened for host '{url.host()}'.")
+
+    def acquireRetry(self) -> bool:
+        with QtCore.QMutexLocker(self._mutex):
+            if self._retryTokens < 1:
+                return False
+            self._retryTokens -= 1
+            return True
@@ -1,5 +1,6 @@
 from .Config import Config
 
+from Core import App
 from Core.GlobalExceptions import Exceptions
 from Services.Utils.OSUtils import OSUtils
 from Services.Logging.Logger import Logger
@@ -22,16 +23,19 @@ class SafeTempDirectory(QtCore.QObject):
             OSUtils.hideFileOrDirectory(self._directory.path())
         except:
             pass
+        self._dirLock = QtCore.QLockFile(OSUtils.joinPath(self._directory.path(), Config.DIRECTORY_LOCK_FILE_NAME))
+        self._dirLock.setStaleLockTime(0)
+        if not self._dirLock.tryLock(0):
+            self._directory.removeRecursively()
+            self._raiseException(Exceptions.FileSystemError(self._directory))
+            return
         self._keyFile = QtCore.QTemporaryFile(OSUtils.joinPath(Config.TEMP_LIST_DIRECTORY, Config.TEMP_KEY_FILE_PREFIX), self)
         if not self._keyFile.open() or self._keyFile.write(self._directory.path().encode()) == -1:
+            self._dirLock.unlock()
             self._directory.removeRecursively()
             self._raiseException(Exceptions.FileSystemError(self._keyFile))
             return
         self._keyFile.close()
-        self._dirLock = QtCore.QFile(OSUtils.joinPath(self._directory.path(), Config.DIRECTORY_LOCK_FILE_NAME), self)
-        if not self._dirLock.open(QtCore.QFile.OpenModeFlag.ReadWrite):
-            self._directory.removeRecursively()
-            self._raiseException(Exceptions.FileSystemError(self._dirLock))
 
     def _raiseException(self, exception: Exception) -> None:
         self._error = exception
@@ -43,18 +47,41 @@ class SafeTempDirectory(QtCore.QObject):
         return self._directory.path()
 
     def clear(self):
-        self._dirLock.close()
-        self._dirLock.remove()
+        self._dirLock.unlock()
         self._directory.removeRecursively()
 
 
+class TempDirectoryCleaner(QtCore.QRunnable):
+    def __init__(self, tempManager: "TempManager", tempDirKeyFile: str):
+        super().__init__()
+        self.tempManager = tempManager
+        self.tempDirKeyFile = tempDirKeyFile
+
+    def run(self) -> None:
+        try:
+            removed = self.tempManager.cleanTempDirKeyFile(self.tempDirKeyFile)
+        except Exception as e:
+            self.tempManager.logger.exception(e)
+            removed = False
+        self.tempManager._cleanerFinished(removed)
+
+
 class TempManager(QtCore.QObject):
     def __init__(self, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self.logger = logger
+        self._mutex = QtCore.QMutex()
+        self._cleanupPool = QtCore.QThreadPool(parent=self)
+        self._cleanupPool.setMaxThreadCount(Config.CLEANUP_THREAD_COUNT)
+        self._cleanupTotal = 0
+        self._cleanupDone = 0
+        self._cleanupRemoved = 0
+        self._cleanupTimer = QtCore.QElapsedTimer()
+        App.Instance.aboutToQuit.connect(self._stopCleanup)
         try:
             OSUtils.createDirectory(Config.TEMP_LIST_DIRECTORY)
-            self.cleanup()
+            if not App.Instance.isDownloadHost():
+                self.cleanup()
         except:
             pass
 
@@ -62,22 +89,51 @@ class TempManager(QtCore.QObject):
         files = os.listdir(Config.TEMP_LIST_DIRECTORY)
         if len(files) == 0:
             return
-        else:
-            self.logger.info("Cleaning up temp files.")
+        with QtCore.QMutexLocker(self._mutex):
+            if self._cleanupDone != self._cleanupTotal:
+                return
+            self._cleanupTotal = len(files)
+            self._cleanupDone = 0
+            self._cleanupRemoved = 0
+            self._cleanupTimer.start()
+        self.logger.info(f"Cleaning up {len(files)} temp directories in the background.")
         for filename in files:
-            path = OSUtils.joinPath(Config.TEMP_LIST_DIRECTORY, filename)
-            try:
-                self.cleanTempDirKeyFile(path)
-            except Exception as e:
-                self.logger.exception(e)
-
-    def cleanTempDirKeyFile(self, tempDirKeyFile: str) -> None:
-        if OSUtils.isFile(tempDirKeyFile):
-            file = QtCore.QFile(tempDirKeyFile, self)
-            if file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
-                tempDir = file.readAll().data().decode()
-                if OSUtils.isDirectory(tempDir):
-                    self.logger.info(f"Removing temp directory: {tempDir}")
-                    OSUtils.removeDirectory(tempDir)
-            file.remove()
-            file.deleteLater()
\ No newline at end of file
+            self._cleanupPool.start(TempDirectoryCleaner(self, OSUtils.joinPath(Config.TEMP_LIST_DIRECTORY, filename)))
+
+    def _cleanerFinished(self, removed: bool) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            self._cleanupDone += 1
+            if removed:
+                self._cleanupRemoved += 1
+            done, total, removedCount = self._cleanupDone, self._cleanupTotal, self._cleanupRemoved
+        self.logger.info(f"Temp cleanup progress: {done}/{total}")
+        if done == total:
+            self.logger.info(f"Temp cleanup finished in {self._cleanupTimer.elapsed()} ms. Removed {removedCount} and kept {total - removedCount} temp directories.")
+
+    def _stopCleanup(self) -> None:
+        self._cleanupPool.clear()
+        self._cleanupPool.waitForDone()
+
+    def cleanTempDirKeyFile(self, tempDirKeyFile: str) -> bool:
+        if not OSUtils.isFile(tempDirKeyFile):
+            return False
+        with open(tempDirKeyFile, "rb") as file:
+            tempDir = file.read().decode()
+        if tempDir == "":
+            return False
+        if OSUtils.isDirectory(tempDir):
+            dirLock = QtCore.QLockFile(OSUtils.joinPath(tempDir, Config.DIRECTORY_LOCK_FILE_NAME))
+            dirLock.setStaleLockTime(0)
+            if not dirLock.tryLock(0):
+                if dirLock.error() != QtCore.QLockFile.LockError.LockFailedError or dirLock.getLockInfo()[0]:
+                    self.logger.info(f"Keeping temp directory in use: {tempDir}")
+                    return False
+                dirLock.removeStaleLockFile()
+                if not dirLock.tryLock(0):
+                    self.logger.info(f"Keeping temp directory in use: {tempDir}")
+                    return False
+            dirLock.unlock()
+            self.logger.info(f"Removing temp directory: {tempDir}")
+            OSUtils.removeDirectory(tempDir)
+        OSUtils.removeFile(tempDirKeyFile)
+        return True
\ No newline at end of file
@@ -27,7 +27,8 @@ class Translator(QtCore.QObject):
                     self.translations.update(json.load(file))
             except:
                 pass
-        self.setLanguage(self.getDefaultLanguage())
+        self.language = self.getDefaultLanguage()
+        self.load()
 
     def reload(self) -> None:
         self.unload()
@@ -74,11 +75,11 @@ class Translator(QtCore.QObject):
         return self.getLanguageKeyList()[index]
 
     def setLanguage(self, language: str) -> None:
-        if language in Config.LANGUAGES:
+        if language not in Config.LANGUAGES:
+            raise Exceptions.LanguageNotFound
+        if language != self.language:
             self.language = language
             self.reload()
-        else:
-            raise Exceptions.LanguageNotFound
 
     def getLanguage(self) -> str:
         return self.language
@@ -1,4 +1,8 @@
 class Config:
     ACCOUNT_PAGE_URL = "https://twitch.tv/login"
     INTEGRITY_URL = "https://gql.twitch.tv/integrity"
-    TIMEOUT = 30000
\ No newline at end of file
+    TIMEOUT = 30000
+    REFRESH_MARGIN = 600000
+    REFRESH_CHECK_INTERVAL = 3600000
+    REFRESH_RETRY_INTERVAL = 30000
+    REFRESH_RETRY_MAX_INTERVAL = 300000
\ No newline at end of file
@@ -3,12 +3,15 @@ from .IntegrityConfig import Config
 
 from Core import App
 from Core import GlobalExceptions
+from Services.Utils.OSUtils import OSUtils
 from Services.Logging.Logger import Logger
+from AppData.EncoderDecoder import Encoder, Decoder
 
 from PyQt6 import QtCore, QtNetwork, QtWebEngineCore, QtWebEngineWidgets
 
 import typing
 import json
+import base64
 
 
 class Exceptions(GlobalExceptions.Exceptions):
@@ -34,11 +37,12 @@ class TwitchIntegrityGenerator(QtCore.QObject):
         super().__init__(parent=parent)
         self.logger = logger
         self.integrity = None
+        self._exportedIntegrity: tuple[IntegrityToken, str] | None = None
         self._isUpdating = False
-        interceptor = IntegrityRequestInterceptor(parent=self)
-        interceptor.intercepted.connect(self._interceptedHandler)
-        self._profile = QtWebEngineCore.QWebEngineProfile(parent=self)
-        self._profile.setUrlRequestInterceptor(interceptor)
+        self._isRefreshing = False
+        self._forceUpdatePending = False
+        self._refreshFailureCount = 0
+        self._profile: QtWebEngineCore.QWebEngineProfile | None = None
         self._webEngineView: QtWebEngineWidgets.QWebEngineView | None = None
         self._headers: dict | None = None
         self._reply: QtNetwork.QNetworkReply | None = None
@@ -46,42 +50,100 @@ class TwitchIntegrityGenerator(QtCore.QObject):
         self._timeoutTimer.setSingleShot(True)
         self._timeoutTimer.setInterval(Config.TIMEOUT)
         self._timeoutTimer.timeout.connect(self._webEngineViewtimeoutHandler)
+        self._refreshTimer = QtCore.QTimer(parent=self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.timeout.connect(self._refreshIntegrity)
+        self._elapsedTimer = QtCore.QElapsedTimer()
+        self._pageLoadTime = 0
         self._updateRequested.connect(self.updateIntegrity)
+        self.importIntegrity(App.Preferences.account.takeIntegrityData())
+
+    def warmUp(self) -> None:
+        self._getProfile()
+
+    def _getProfile(self) -> QtWebEngineCore.QWebEngineProfile:
+        if self._profile == None:
+            interceptor = IntegrityRequestInterceptor(parent=self)
+            interceptor.intercepted.connect(self._interceptedHandler)
+            self._profile = QtWebEngineCore.QWebEngineProfile(parent=self)
+            self._profile.setUrlRequestInterceptor(interceptor)
+        return self._profile
 
     def updateIntegrity(self, forceUpdate: bool = False) -> None:
         if QtCore.QThread.currentThread() != App.Instance.thread():
             raise Exceptions.ThreadError
-        if self._isUpdating:
-            return
-        elif self.hasValidIntegrity() and not forceUpdate:
+        if self.hasValidIntegrity() and not forceUpdate:
             self._integrityUpdated.emit(self.integrity)
+        elif self._isUpdating:
+            if forceUpdate and self._isRefreshing:
+                self._forceUpdatePending = True
         else:
             self.logger.info("Updating Integrity(Forced)" if forceUpdate else "Updating Integrity")
-            self._timeoutTimer.start()
-            self._createWebEngineView()
+            self.integrity = None
+            self._startUpdate()
+
+    def _refreshIntegrity(self) -> None:
+        if self._isUpdating or self.integrity == None:
+            return
+        elif self._getRemainingTime() > Config.REFRESH_MARGIN:
+            self._scheduleRefresh()
+        else:
+            self.logger.info("Refreshing Integrity")
+            self._startUpdate(refresh=True)
+
+    def _getRemainingTime(self) -> int:
+        return QtCore.QDateTime.currentDateTimeUtc().msecsTo(self.integrity.expiration)
+
+    def _scheduleRefresh(self) -> None:
+        if self.integrity == None or self.integrity.expiration == None:
+            self._refreshTimer.stop()
+        elif self.integrity.isExpired():
+            self.logger.warning("Integrity expired before it could be refreshed.")
+            self.integrity = None
+            self._refreshTimer.stop()
+        else:
+            interval = min(max(self._getRemainingTime() - Config.REFRESH_MARGIN, 0), Config.REFRESH_CHECK_INTERVAL)
+            if self._refreshFailureCount != 0:
+                interval = max(interval, min(Config.REFRESH_RETRY_INTERVAL * 2 ** (self._refreshFailureCount - 1), Config.REFRESH_RETRY_MAX_INTERVAL))
+            self._refreshTimer.start(interval)
+
+    def _startUpdate(self, refresh: bool = False) -> None:
+        self._isRefreshing = refresh
+        self._destroyWebEngineView()
+        self._refreshTimer.stop()
+        self._elapsedTimer.start()
+        self._pageLoadTime = 0
+        self._timeoutTimer.start()
+        self._createWebEngineView()
 
     def _createWebEngineView(self) -> None:
         self._isUpdating = True
-        self.integrity = None
         self._webEngineView = QtWebEngineWidgets.QWebEngineView()
         self._webEngineView.setVisible(False)
-        self._webEngineView.setPage(QtWebEngineCore.QWebEnginePage(self._profile, self._webEngineView))
+        self._webEngineView.setPage(QtWebEngineCore.QWebEnginePage(self._getProfile(), self._webEngineView))
         self._webEngineView.load(QtCore.QUrl(Config.ACCOUNT_PAGE_URL))
 
+    def _destroyWebEngineView(self) -> None:
+        if self._webEngineView != None:
+            self._webEngineView.stop()
+            self._webEngineView.close()
+            self._webEngineView.deleteLater()
+            self._webEngineView = None
+
     def _webEngineViewtimeoutHandler(self) -> None:
         if self._webEngineView == None:
             return
-        self._webEngineView.close()
-        self._webEngineView = None
-        self._isUpdating = False
-        self._integrityUpdated.emit(self.integrity)
+        self._destroyWebEngineView()
+        self.logger.warning(f"Integrity update timed out after {self._elapsedTimer.elapsed()}ms.")
+        self._refreshFailureCount += 1
+        self._updateFinished()
 
     def _interceptedHandler(self, headers: dict) -> None:
         if self._webEngineView == None:
             return
         self._timeoutTimer.stop()
-        self._webEngineView.close()
-        self._webEngineView = None
+        self._destroyWebEngineView()
+        self._pageLoadTime = self._elapsedTimer.elapsed()
         oAuthToken = App.Account.getOAuthToken()
         if oAuthToken != "":
             headers.update({"Authorization": f"OAuth {oAuthToken}"})
@@ -94,6 +156,7 @@ class TwitchIntegrityGenerator(QtCore.QObject):
         self._reply.finished.connect(self._requestDone)
 
     def _requestDone(self) -> None:
+        requestTime = self._elapsedTimer.elapsed() - self._pageLoadTime
         if self._reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
             try:
                 data = json.loads(self._reply.readAll().data().decode())
@@ -103,18 +166,32 @@ class TwitchIntegrityGenerator(QtCore.QObject):
                     expiration=data["expiration"]
                 )
             except:
+                self._refreshFailureCount += 1
                 self.logger.error("Unable to update integrity token.")
                 self.logger.exception(Exceptions.UnexpectedError())
             else:
-                self.logger.info("Integrity Updated")
+                self._refreshFailureCount = 0
+                self.logger.info(f"Integrity Updated: <page: {self._pageLoadTime}ms / request: {requestTime}ms / total: {self._elapsedTimer.elapsed()}ms>")
                 self.logger.debug(Logger.generateObjectLog(self.integrity))
         else:
+            self._refreshFailureCount += 1
             self.logger.error("Unable to update integrity token.")
             self.logger.exception(Exceptions.NetworkError(self._reply))
         self._headers = None
         self._reply = None
+        self._updateFinished()
+
+    def _updateFinished(self) -> None:
         self._isUpdating = False
-        self._integrityUpdated.emit(self.integrity)
+        self._isRefreshing = False
+        if self._forceUpdatePending:
+            self._forceUpdatePending = False
+            self.logger.info("Updating Integrity(Forced)")
+            self.integrity = None
+            self._startUpdate()
+        else:
+            self._scheduleRefresh()
+            self._integrityUpdated.emit(self.integrity)
 
     def hasValidIntegrity(self) -> bool:
         if self.integrity != None:
@@ -122,6 +199,39 @@ class TwitchIntegrityGenerator(QtCore.QObject):
                 return True
         return False
 
+    def _getAuthorization(self) -> str | None:
+        oAuthToken = App.Account.getData()[1]
+        return None if oAuthToken == None else f"OAuth {oAuthToken.value}"
+
+    def exportIntegrity(self) -> str | None:
+        if self.hasValidIntegrity():
+            if self._exportedIntegrity != None and self._exportedIntegrity[0] is self.integrity:
+                return self._exportedIntegrity[1]
+            try:
+                data = base64.b64encode(OSUtils.protectData(json.dumps(Encoder.encode(self.integrity)).encode())).decode()
+                self._exportedIntegrity = (self.integrity, data)
+                return data
+            except Exception as e:
+                self.logger.warning("Unable to export integrity token.")
+                self.logger.exception(e)
+        return None
+
+    def importIntegrity(self, data: str | None) -> None:
+        if data == None:
+            return
+        try:
+            integrity = Decoder.decode(json.loads(OSUtils.unprotectData(base64.b64decode(data)).decode()))
+        except Exception as e:
+            self.logger.warning("Unable to import integrity token.")
+            self.logger.exception(e)
+        else:
+            if integrity.isValid() and integrity.headers.get("Authorization") == self._getAuthorization():
+                self.integrity = integrity
+                self._exportedIntegrity = (integrity, data)
+                self.logger.info("Integrity Restored")
+                self.logger.debug(Logger.generateObjectLog(self.integrity))
+                self._scheduleRefresh()
+
     def getIntegrity(self, callback: typing.Callable) -> None:
         self._integrityUpdated.connect(callback, QtCore.Qt.ConnectionType.SingleShotConnection)
         self._updateRequested.emit()
\ No newline at end of file
@@ -171,6 +171,13 @@ class StreamPlaybackAccessToken(TwitchGQLObject):
     def getGeoBlockReason(self) -> str | None:
         return self.tokenData.get("geoblock_reason") if self.geoBlock else None
 
+    @property
+    def expiration(self) -> int:
+        return self.tokenData.get("expires", 0)
+
+    def isExpired(self, margin: int = 0) -> bool:
+        return QtCore.QDateTime.currentSecsSinceEpoch() + margin >= self.expiration
+
 class VideoPlaybackAccessToken(TwitchGQLObject):
     def __init__(self, data: dict):
         self.signature: str = data.get("signature") or ""
@@ -76,29 +76,47 @@ class Exceptions(GlobalExceptions.Exceptions):
 class TwitchStreamPlaybackGenerator(QtCore.QObject):
     finished = QtCore.pyqtSignal(object)
 
-    def __init__(self, login: str, parent: QtCore.QObject | None = None):
+    def __init__(self, login: str, token: TwitchGQLModels.StreamPlaybackAccessToken | None = None, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self.login = login
         self.token: TwitchGQLModels.StreamPlaybackAccessToken | None = None
         self._reply: QtNetwork.QNetworkReply | None = None
         self._error: Exception | None = None
         self._data: TwitchPlaybackModels.TwitchStreamPlayback | None = None
+        self._tokenReused = False
+        self._elapsedTimer = QtCore.QElapsedTimer()
+        self._elapsedTimer.start()
+        self._timings: dict[str, int] = {}
+        if token == None:
+            self._requestStreamPlaybackAccessToken()
+        else:
+            self._tokenReused = True
+            self._setToken(token)
+
+    def _requestStreamPlaybackAccessToken(self) -> None:
         App.TwitchGQL.getStreamPlaybackAccessToken(self.login).finished.connect(self._streamPlaybackAccessTokenHandler)
 
     def _streamPlaybackAccessTokenHandler(self, response: TwitchGQLAPI.TwitchGQLResponse) -> None:
         if response.getError() == None:
-            self.token = response.getData()
-            try:
-                self._validateToken()
-            except Exception as e:
-                self._raiseException(e)
-            else:
-                self._getStreamPlayback()
+            self._setToken(response.getData())
         elif isinstance(response.getError(), TwitchGQLAPI.Exceptions.DataNotFound):
             self._raiseException(Exceptions.ChannelNotFound(self.login))
         else:
             self._raiseException(response.getError())
 
+    def _setToken(self, token: TwitchGQLModels.StreamPlaybackAccessToken) -> None:
+        self.token = token
+        self._timings["access-token"] = self._elapsedTimer.elapsed()
+        try:
+            self._validateToken()
+        except Exception as e:
+            self._raiseException(e)
+        else:
+            self._getStreamPlayback()
+
+    def isTokenReused(self) -> bool:
+        return self._tokenReused
+
     def _validateToken(self) -> None:
         if self.token.forbidden:
             if self.token.getForbiddenReason() == "UNAUTHORIZED_ENTITLMENTS":
@@ -120,6 +138,7 @@ class TwitchStreamPlaybackGenerator(QtCore.QObject):
         self._reply.finished.connect(self._replyFinished)
 
     def _replyFinished(self) -> None:
+        self._timings["variant-playlist"] = self._elapsedTimer.elapsed()
         if self._reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
             resolutions = VariantPlaylistReader.loads(self._reply.readAll().data().decode(), baseUrl=self._reply.url())
             if len(resolutions) == 0:
@@ -133,6 +152,9 @@ class TwitchStreamPlaybackGenerator(QtCore.QObject):
                 self._setFinished()
         elif self._reply.error() == QtNetwork.QNetworkReply.NetworkError.ContentNotFoundError:
             self._raiseException(Exceptions.ChannelIsOffline(self.login))
+        elif self._reply.error() == QtNetwork.QNetworkReply.NetworkError.ContentAccessDenied and self._tokenReused:
+            self._tokenReused = False
+            self._requestStreamPlaybackAccessToken()
         else:
             self._raiseException(Exceptions.NetworkError(self._reply))
 
@@ -150,6 +172,9 @@ class TwitchStreamPlaybackGenerator(QtCore.QObject):
     def getData(self) -> TwitchPlaybackModels.TwitchStreamPlayback | None:
         return self._data
 
+    def getTimings(self) -> dict[str, int]:
+        return self._timings
+
 
 class TwitchVideoPlaybackGenerator(QtCore.QObject):
     finished = QtCore.pyqtSignal(object)
@@ -2,6 +2,7 @@ from Core.GlobalExceptions import Exceptions
 
 import os
 import ctypes
+import typing
 import platform
 import shutil
 
@@ -10,6 +11,10 @@ from urllib.parse import urlencode
 from PyQt6 import QtCore, QtGui
 
 
+class _DataBlob(ctypes.Structure):
+    _fields_ = [("cbData", ctypes.c_ulong), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+
 class OSUtils:
     @staticmethod
     def listDirectory(path: str) -> list[str]:
@@ -35,6 +40,15 @@ class OSUtils:
     def renameFile(path: str, newPath: str) -> None:
         os.rename(path, newPath)
 
+    @staticmethod
+    def writeFileAtomic(path: str, data: str) -> None:
+        tempPath = f"{path}.tmp"
+        with open(tempPath, "w", encoding="utf-8") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tempPath, path)
+
     @staticmethod
     def openFolder(path: str) -> None:
         os.startfile(path)
@@ -114,6 +128,26 @@ class OSUtils:
     def hideFileOrDirectory(target: str) -> None:
         ctypes.windll.kernel32.SetFileAttributesW(target, 2)
 
+    @staticmethod
+    def _callDataProtectionApi(function: typing.Callable, data: bytes) -> bytes:
+        buffer = ctypes.create_string_buffer(data, len(data))
+        dataIn = _DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+        dataOut = _DataBlob()
+        if not function(ctypes.byref(dataIn), None, None, None, None, 0, ctypes.byref(dataOut)):
+            raise Exceptions.UnexpectedError
+        try:
+            return ctypes.string_at(dataOut.pbData, dataOut.cbData)
+        finally:
+            ctypes.windll.kernel32.LocalFree(dataOut.pbData)
+
+    @staticmethod
+    def protectData(data: bytes) -> bytes:
+        return OSUtils._callDataProtectionApi(ctypes.windll.crypt32.CryptProtectData, data)
+
+    @staticmethod
+    def unprotectData(data: bytes) -> bytes:
+        return OSUtils._callDataProtectionApi(ctypes.windll.crypt32.CryptUnprotectData, data)
+
     @staticmethod
     def getOSInfo() -> str:
         return f"{platform.system()} {platform.release()} {platform.version()}; {platform.machine()};"
@@ -1,11 +1,24 @@
+from Services.Profiling.StartupProfiler import Profiler
 from Core.Ui import *
+from Download.Downloader.Host.DownloadHost import DownloadHost
 
 import os
 import sys
 
 
+def TwitchLinkDownloadHost() -> int:
+    downloadHost = DownloadHost(App.Instance.getDownloadHostServerName(), parent=App.Instance)
+    if not downloadHost.start():
+        return App.Instance.EXIT_CODE.UNEXPECTED_ERROR
+    return App.Instance.exec()
+
+
 def TwitchLink() -> int:
-    exitCode = App.Instance.start(Ui.MainWindow(parent=None))
+    if App.Instance.isDownloadHost():
+        return TwitchLinkDownloadHost()
+    with Profiler.phase("Main window"):
+        mainWindow = Ui.MainWindow(parent=None)
+    exitCode = App.Instance.start(mainWindow)
     if exitCode in (App.Instance.EXIT_CODE.RESTART, App.Instance.EXIT_CODE.UNEXPECTED_ERROR_RESTART):
         os.execl(sys.executable, *sys.argv)
     return exitCode
@@ -0,0 +1,264 @@
+from Core.Ui import *
+from Services.Image.UrlFormatter import ImageUrlFormatter
+
+import functools
+
+
+class VideoListModel(QtCore.QAbstractListModel):
+    ContentRole = QtCore.Qt.ItemDataRole.UserRole
+    InfoRole = QtCore.Qt.ItemDataRole.UserRole + 1
+    ThumbnailImageRole = QtCore.Qt.ItemDataRole.UserRole + 2
+    CategoryImageRole = QtCore.Qt.ItemDataRole.UserRole + 3
+
+    IMAGE_ROLES = {
+        ThumbnailImageRole: "thumbnailImage",
+        CategoryImageRole: "categoryImage"
+    }
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._contents = []
+        self._infos: dict[int, dict] = {}
+        self._images: dict[tuple[int, int], QtGui.QPixmap] = {}
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._contents)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> typing.Any:
+        if not index.isValid():
+            return None
+        if role == self.ContentRole:
+            return self._contents[index.row()]
+        elif role == self.InfoRole:
+            return self.getInfo(index.row())
+        elif role == QtCore.Qt.ItemDataRole.DisplayRole or role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return self.getInfo(index.row())["title"]
+        elif role in self.IMAGE_ROLES:
+            return self._images.get((index.row(), role))
+        return None
+
+    def getInfo(self, row: int) -> dict:
+        if row not in self._infos:
+            self._infos[row] = Ui.VideoWidget.getInfo(self._contents[row])
+        return self._infos[row]
+
+    def getContent(self, row: int) -> typing.Any:
+        return self._contents[row]
+
+    def hasImage(self, row: int, role: int) -> bool:
+        return (row, role) in self._images
+
+    def releaseImages(self, rows: range) -> None:
+        for key in [key for key in self._images if key[0] not in rows]:
+            del self._images[key]
+
+    def setImage(self, row: int, role: int, pixmap: QtGui.QPixmap) -> None:
+        self._images[(row, role)] = pixmap
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [role])
+
+    def addContents(self, contents: list) -> None:
+        if len(contents) == 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), len(self._contents), len(self._contents) + len(contents) - 1)
+        self._contents.extend(contents)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._contents.clear()
+        self._infos.clear()
+        self._images.clear()
+        self.endResetModel()
+
+
+class VideoListDelegate(QtWidgets.QStyledItemDelegate):
+    MARGIN = 10
+    SPACING = 6
+    THUMBNAIL_SIZE = QtCore.QSize(384, 216)
+    CATEGORY_IMAGE_SIZE = QtCore.QSize(45, 60)
+    BUTTON_HEIGHT = 30
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._itemSize = QtCore.QSize(self.THUMBNAIL_SIZE.width() + self.MARGIN * 2, self.THUMBNAIL_SIZE.height() + self.CATEGORY_IMAGE_SIZE.height() + self.BUTTON_HEIGHT + self.SPACING * 2 + self.MARGIN * 2)
+        self._defaultImages: dict[str, QtGui.QPixmap] = {}
+
+    def setItemSize(self, size: QtCore.QSize) -> None:
+        self._itemSize = size
+
+    def getItemSize(self) -> QtCore.QSize:
+        return self._itemSize
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return self._itemSize
+
+    def getThumbnailRect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        contentRect = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        return QtCore.QRect(contentRect.topLeft(), self.THUMBNAIL_SIZE.scaled(contentRect.width(), self.THUMBNAIL_SIZE.height(), QtCore.Qt.AspectRatioMode.KeepAspectRatio))
+
+    def _getDefaultImage(self, filePath: str) -> QtGui.QPixmap:
+        if filePath not in self._defaultImages:
+            self._defaultImages[filePath] = QtGui.QPixmap(filePath)
+        return self._defaultImages[filePath]
+
+    def _getText(self, value: typing.Any) -> str:
+        if isinstance(value, QtCore.QDateTime):
+            return value.toTimeZone(App.Preferences.localization.getTimezone()).toString("yyyy-MM-dd HH:mm:ss")
+        return str(value)
+
+    def _drawImage(self, painter: QtGui.QPainter, rect: QtCore.QRect, pixmap: QtGui.QPixmap | None, defaultImage: str) -> None:
+        painter.drawPixmap(rect, self._getDefaultImage(defaultImage) if pixmap == None or pixmap.isNull() else pixmap)
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        info = index.data(VideoListModel.InfoRole)
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
+        contentRect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        thumbnailRect = self.getThumbnailRect(option.rect)
+        self._drawImage(painter, thumbnailRect, index.data(VideoListModel.ThumbnailImageRole), info["thumbnailImage"][0])
+        categoryRect = QtCore.QRect(QtCore.QPoint(contentRect.left(), thumbnailRect.bottom() + self.SPACING), self.CATEGORY_IMAGE_SIZE)
+        self._drawImage(painter, categoryRect, index.data(VideoListModel.CategoryImageRole), info["categoryImage"][0])
+        textRect = QtCore.QRect(categoryRect.right() + self.SPACING, categoryRect.top(), contentRect.right() - categoryRect.right() - self.SPACING, categoryRect.height())
+        lineHeight = textRect.height() // 3
+        painter.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        for line, key in enumerate(("title", "info_1", "info_2")):
+            font = QtGui.QFont(option.font)
+            font.setBold(key == "title")
+            painter.setFont(font)
+            lineRect = QtCore.QRect(textRect.left(), textRect.top() + lineHeight * line, textRect.width(), lineHeight)
+            painter.drawText(lineRect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, QtGui.QFontMetrics(font).elidedText(self._getText(info[key]), QtCore.Qt.TextElideMode.ElideRight, lineRect.width()))
+        buttonOption = QtWidgets.QStyleOptionButton()
+        buttonOption.rect = QtCore.QRect(contentRect.left(), contentRect.bottom() - self.BUTTON_HEIGHT + 1, contentRect.width(), self.BUTTON_HEIGHT)
+        buttonOption.text = T("download")
+        buttonOption.state = QtWidgets.QStyle.StateFlag.State_Enabled
+        buttonOption.palette = option.palette
+        style = option.widget.style() if option.widget != None else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_PushButton, buttonOption, painter, option.widget)
+        painter.restore()
+
+
+class VideoListViewer(QtCore.QObject):
+    def __init__(self, listView: QtWidgets.QListView, widgetFactory: typing.Callable[[typing.Any], QtWidgets.QWidget], parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._listView = listView
+        self._widgetFactory = widgetFactory
+        self._model = VideoListModel(parent=self)
+        self._delegate = VideoListDelegate(parent=self)
+        self._listView.setModel(self._model)
+        self._listView.setItemDelegate(self._delegate)
+        self._listView.setUniformItemSizes(True)
+        self._listView.setMovement(QtWidgets.QListView.Movement.Static)
+        self._listView.setMouseTracking(True)
+        self._listView.verticalScrollBar().setSingleStep(30)
+        self._listView.entered.connect(self._showWidget)
+        self._listView.viewportEntered.connect(self._hideWidget)
+        self._listView.viewport().installEventFilter(self)
+        self._listView.verticalScrollBar().valueChanged.connect(self._scheduleUpdate)
+        self._model.rowsInserted.connect(self._scheduleUpdate)
+        self._model.modelReset.connect(self._scheduleUpdate)
+        self._itemSizeMeasured = False
+        self._widgetIndex: QtCore.QPersistentModelIndex | None = None
+        self._imageRequests: dict[tuple[int, int], tuple[QtCore.QUrl, QtCore.QSize, typing.Callable]] = {}
+        self._updateTimer = QtCore.QTimer(parent=self)
+        self._updateTimer.setSingleShot(True)
+        self._updateTimer.setInterval(0)
+        self._updateTimer.timeout.connect(self._updateVisibleRows)
+
+    def count(self) -> int:
+        return self._model.rowCount()
+
+    def addContents(self, contents: list) -> None:
+        if len(contents) != 0 and not self._itemSizeMeasured:
+            self._measureItemSize(contents[0])
+        self._model.addContents(contents)
+
+    def clear(self) -> None:
+        self._hideWidget()
+        self._cancelImageRequests(list(self._imageRequests))
+        self._model.clear()
+
+    def _measureItemSize(self, content: typing.Any) -> None:
+        widget = self._widgetFactory(content)
+        widget.setContentsMargins(VideoListDelegate.MARGIN, VideoListDelegate.MARGIN, VideoListDelegate.MARGIN, VideoListDelegate.MARGIN)
+        self._delegate.setItemSize(widget.sizeHint())
+        widget.deleteLater()
+        self._itemSizeMeasured = True
+
+    def _showWidget(self, index: QtCore.QModelIndex) -> None:
+        if self._widgetIndex != None and self._widgetIndex == index:
+            return
+        if not self._hideWidget():
+            return
+        widget = self._widgetFactory(self._model.getContent(index.row()))
+        widget.setContentsMargins(VideoListDelegate.MARGIN, VideoListDelegate.MARGIN, VideoListDelegate.MARGIN, VideoListDelegate.MARGIN)
+        self._listView.setIndexWidget(index, widget)
+        self._widgetIndex = QtCore.QPersistentModelIndex(index)
+
+    def _hideWidget(self) -> bool:
+        if self._widgetIndex == None:
+            return True
+        if QtWidgets.QApplication.activeModalWidget() != None or QtWidgets.QApplication.activePopupWidget() != None:
+            return False
+        if self._widgetIndex.isValid():
+            self._listView.setIndexWidget(QtCore.QModelIndex(self._widgetIndex), None)
+        self._widgetIndex = None
+        return True
+
+    def _scheduleUpdate(self) -> None:
+        if not self._updateTimer.isActive():
+            self._updateTimer.start()
+
+    def _findEdgeRow(self, rect: QtCore.QRect, reverse: bool) -> int | None:
+        itemSize = self._delegate.getItemSize()
+        xRange = range(rect.left(), rect.right() + 1, max(itemSize.width() // 4, 1))
+        yRange = range(rect.top(), rect.bottom() + 1, max(itemSize.height() // 4, 1))
+        for y in reversed(yRange) if reverse else yRange:
+            for x in reversed(xRange) if reverse else xRange:
+                index = self._listView.indexAt(QtCore.QPoint(x, y))
+                if index.isValid():
+                    return index.row()
+        return None
+
+    def _getVisibleRows(self) -> range:
+        viewportRect = self._listView.viewport().rect()
+        firstRow = self._findEdgeRow(viewportRect, reverse=False)
+        lastRow = self._findEdgeRow(viewportRect, reverse=True)
+        if firstRow == None or lastRow == None:
+            return range(0)
+        return range(firstRow, lastRow + 1)
+
+    def _updateVisibleRows(self) -> None:
+        visibleRows = self._getVisibleRows()
+        self._cancelImageRequests([key for key in self._imageRequests if key[0] not in visibleRows])
+        self._model.releaseImages(visibleRows)
+        devicePixelRatio = self._listView.devicePixelRatioF()
+        for row in visibleRows:
+            info = self._model.getInfo(row)
+            self._requestImage(row, VideoListModel.ThumbnailImageRole, ImageUrlFormatter.formatUrl(info["thumbnailImage"][1], *info["thumbnailImage"][2]), VideoListDelegate.THUMBNAIL_SIZE * devicePixelRatio)
+            self._requestImage(row, VideoListModel.CategoryImageRole, ImageUrlFormatter.formatUrl(info["categoryImage"][1], *ImageSize.CATEGORY), VideoListDelegate.CATEGORY_IMAGE_SIZE * devicePixelRatio)
+
+    def _requestImage(self, row: int, role: int, url: str, size: QtCore.QSize) -> None:
+        key = (row, role)
+        if url == "" or key in self._imageRequests or self._model.hasImage(row, role):
+            return
+        callback = functools.partial(self._imageLoaded, row, role)
+        self._imageRequests[key] = (QtCore.QUrl(url), size, callback)
+        App.ImageLoader.request(QtCore.QUrl(url), callback, size=size)
+
+    def _cancelImageRequests(self, keys: list[tuple[int, int]]) -> None:
+        for key in keys:
+            url, size, callback = self._imageRequests.pop(key)
+            App.ImageLoader.cancelRequest(url, callback, size=size)
+
+    def _imageLoaded(self, row: int, role: int, pixmap: QtGui.QPixmap) -> None:
+        self._imageRequests.pop((row, role), None)
+        if not pixmap.isNull() and row < self._model.rowCount():
+            self._model.setImage(row, role, pixmap)
+
+    def eventFilter(self, object: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.Type.Resize:
+            self._scheduleUpdate()
+        elif event.type() == QtCore.QEvent.Type.Leave:
+            self._hideWidget()
+        return super().eventFilter(object, event)
\ No newline at end of file
@@ -6,32 +6,50 @@ from Download.History.DownloadHistory import DownloadHistory
 class DownloadHistories(QtWidgets.QWidget):
     accountPageShowRequested = QtCore.pyqtSignal()
 
+    LOAD_SCROLL_THRESHOLD = 300
+
     def __init__(self, parent: QtWidgets.QWidget | None = None):
         super().__init__(parent=parent)
         self.previewWidgets = {}
+        self._hasMoreHistory = True
         self._ui = UiLoader.load("downloadHistories", self)
         self._ui.infoIcon = Utils.setSvgIcon(self._ui.infoIcon, Icons.HISTORY_ICON)
         self._ui.stackedWidget.setStyleSheet(f"#stackedWidget {{background-color: {self._ui.stackedWidget.palette().color(QtGui.QPalette.ColorGroup.Normal, QtGui.QPalette.ColorRole.Base).name()};}}")
         self._widgetListViewer = PartnerContentInFeedWidgetListViewer(self._ui.previewWidgetView, partnerContentSize=QtCore.QSize(320, 100), parent=self)
         self._widgetListViewer.widgetClicked.connect(self.openFile)
+        self._ui.previewWidgetView.verticalScrollBar().valueChanged.connect(self.loadMoreHistory)
         App.DownloadHistory.historyCreated.connect(self.createHistoryView)
         App.DownloadHistory.historyRemoved.connect(self.removeHistoryView)
         self.loadHistory()
 
     def loadHistory(self) -> None:
+        historyList = App.DownloadHistory.getHistoryPage(len(self.previewWidgets))
+        self._hasMoreHistory = len(historyList) != 0
         self._widgetListViewer.setAutoReloadEnabled(False)
-        for downloadHistory in App.DownloadHistory.getHistoryList():
-            self.createHistoryView(downloadHistory)
+        for downloadHistory in historyList:
+            if downloadHistory not in self.previewWidgets:
+                self.appendHistoryView(downloadHistory)
         self._widgetListViewer.setAutoReloadEnabled(True)
 
+    def loadMoreHistory(self, value: int) -> None:
+        if self._hasMoreHistory and self._ui.previewWidgetView.verticalScrollBar().maximum() - self.LOAD_SCROLL_THRESHOLD <= value:
+            self.loadHistory()
+
     def historyCountChanged(self) -> None:
         self._ui.stackedWidget.setCurrentIndex(0 if len(self.previewWidgets) == 0 else 1)
 
-    def createHistoryView(self, downloadHistory: DownloadHistory) -> None:
+    def _createHistoryWidget(self, downloadHistory: DownloadHistory) -> Ui.DownloadHistoryView:
         widget = Ui.DownloadHistoryView(downloadHistory, parent=None)
         widget.accountPageShowRequested.connect(self.accountPageShowRequested)
-        self._widgetListViewer.insertWidget(0, widget)
         self.previewWidgets[downloadHistory] = widget
+        return widget
+
+    def createHistoryView(self, downloadHistory: DownloadHistory) -> None:
+        self._widgetListViewer.insertWidget(0, self._createHistoryWidget(downloadHistory))
+        self.historyCountChanged()
+
+    def appendHistoryView(self, downloadHistory: DownloadHistory) -> None:
+        self._widgetListViewer.addWidget(self._createHistoryWidget(downloadHistory))
         self.historyCountChanged()
 
     def removeHistoryView(self, downloadHistory: DownloadHistory) -> None:
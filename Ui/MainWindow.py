@@ -115,7 +115,7 @@ class MainWindow(QtWidgets.QMainWindow, WindowGeometryManager):
 
     def _termsOfServiceAccepted(self) -> None:
         self.account.refreshAccount()
-        App.Account.updateIntegrityToken()
+        App.Account.updateIntegrityToken(forceUpdate=False)
 
     def show(self) -> None:
         if self._webViewEnabled:
@@ -1,6 +1,6 @@
 from Core.Ui import *
 from Services.Messages import Messages
-from Services.PartnerContent.PartnerContentInFeedWidgetListViewer import PartnerContentInFeedWidgetListViewer
+from Ui.Components.Operators.VideoListViewer import VideoListViewer
 from Services.Twitch.GQL import TwitchGQLAPI
 from Services.Twitch.GQL import TwitchGQLModels
 
@@ -44,7 +44,7 @@ class SearchResult(QtWidgets.QWidget):
         self._ui.stackedWidget.setStyleSheet(f"#stackedWidget {{background-color: {self._ui.stackedWidget.palette().color(QtGui.QPalette.ColorGroup.Normal, QtGui.QPalette.ColorRole.Window).name()};}}")
         self._ui.videoArea.setStyleSheet("#videoArea {background-color: transparent;}")
         self._ui.videoArea.verticalScrollBar().valueChanged.connect(self.searchMoreVideos)
-        self._widgetListViewer = PartnerContentInFeedWidgetListViewer(self._ui.videoArea, responsive=False, parent=self)
+        self._videoListViewer = VideoListViewer(self._ui.videoArea, self._createVideoWidget, parent=self)
         self.setup()
 
     def setLoading(self, loading: bool, showErrorMessage: bool = False) -> None:
@@ -61,7 +61,7 @@ class SearchResult(QtWidgets.QWidget):
             self._ui.refreshVideoListButton.setEnabled(True)
             self._ui.statusLabel.setText(T("#A temporary error has occurred.\nPlease try again later." if showErrorMessage else "no-results-found"))
             self._ui.loadingInfoArea.hide()
-        if self._widgetListViewer.count() == 0:
+        if self._videoListViewer.count() == 0:
             self._ui.stackedWidget.setCurrentIndex(0)
         else:
             self._ui.stackedWidget.setCurrentIndex(1)
@@ -200,13 +200,13 @@ class SearchResult(QtWidgets.QWidget):
             if self._ui.videoArea.verticalScrollBar().maximum() - self.SEARCH_SCROLL_THRESHOLD <= value:
                 self.searchVideos(self.searchResult.cursor)
 
+    def _createVideoWidget(self, data: TwitchGQLModels.Video | TwitchGQLModels.Clip) -> QtWidgets.QWidget:
+        videoDownloadWidget = Ui.VideoDownloadWidget(data, resizable=False, parent=None)
+        videoDownloadWidget.accountPageShowRequested.connect(self.accountPageShowRequested)
+        return videoDownloadWidget
+
     def addVideos(self, videos: list[TwitchGQLModels.Video | TwitchGQLModels.Clip]) -> None:
-        self._widgetListViewer.setAutoReloadEnabled(False)
-        for data in videos:
-            videoDownloadWidget = Ui.VideoDownloadWidget(data, resizable=False, parent=None)
-            videoDownloadWidget.accountPageShowRequested.connect(self.accountPageShowRequested)
-            self._widgetListViewer.addWidget(videoDownloadWidget)
-        self._widgetListViewer.setAutoReloadEnabled(True)
+        self._videoListViewer.addContents(videos)
 
     def clearVideoList(self) -> None:
-        self._widgetListViewer.clear()
\ No newline at end of file
+        self._videoListViewer.clear()
\ No newline at end of file
@@ -31,45 +31,68 @@ class VideoWidget(QtWidgets.QWidget):
     def thumbnailImage(self) -> QtWidgets.QLabel:
         return self._ui.thumbnailImage
 
-    def setBroadcastInfo(self) -> None:
-        data = {
-            "title": self.content.lastBroadcast.title,
-            "info_1": self.content.lastBroadcast.game.displayName,
-            "info_2": self.content.lastBroadcast.startedAt,
-            "thumbnailImage": (Images.OFFLINE_IMAGE, self.content.offlineImageURL, ImageSize.CHANNEL_OFFLINE),
-            "categoryImage": (Images.CATEGORY_IMAGE, self.content.lastBroadcast.game.boxArtURL)
+    @staticmethod
+    def getBroadcastInfo(content: Channel) -> dict:
+        return {
+            "title": content.lastBroadcast.title,
+            "info_1": content.lastBroadcast.game.displayName,
+            "info_2": content.lastBroadcast.startedAt,
+            "thumbnailImage": (Images.OFFLINE_IMAGE, content.offlineImageURL, ImageSize.CHANNEL_OFFLINE),
+            "categoryImage": (Images.CATEGORY_IMAGE, content.lastBroadcast.game.boxArtURL)
         }
-        self.setInfo(data)
 
-    def setStreamInfo(self) -> None:
-        data = {
-            "title": self.content.title,
-            "info_1": self.content.game.displayName,
-            "info_2": self.content.createdAt,
-            "thumbnailImage": (Images.PREVIEW_IMAGE, self.content.previewImageURL, ImageSize.STREAM_PREVIEW),
-            "categoryImage": (Images.CATEGORY_IMAGE, self.content.game.boxArtURL)
+    @staticmethod
+    def getStreamInfo(content: Stream) -> dict:
+        return {
+            "title": content.title,
+            "info_1": content.game.displayName,
+            "info_2": content.createdAt,
+            "thumbnailImage": (Images.PREVIEW_IMAGE, content.previewImageURL, ImageSize.STREAM_PREVIEW),
+            "categoryImage": (Images.CATEGORY_IMAGE, content.game.boxArtURL)
         }
-        self.setInfo(data)
 
-    def setVideoInfo(self) -> None:
-        data = {
-            "title": self.content.title,
-            "info_1": self.content.publishedAt,
-            "info_2": self.content.durationString,
-            "thumbnailImage": (Images.THUMBNAIL_IMAGE, self.content.previewThumbnailURL, ImageSize.VIDEO_THUMBNAIL),
-            "categoryImage": (Images.CATEGORY_IMAGE, self.content.game.boxArtURL)
+    @staticmethod
+    def getVideoInfo(content: Video) -> dict:
+        return {
+            "title": content.title,
+            "info_1": content.publishedAt,
+            "info_2": content.durationString,
+            "thumbnailImage": (Images.THUMBNAIL_IMAGE, content.previewThumbnailURL, ImageSize.VIDEO_THUMBNAIL),
+            "categoryImage": (Images.CATEGORY_IMAGE, content.game.boxArtURL)
         }
-        self.setInfo(data)
 
-    def setClipInfo(self) -> None:
-        data = {
-            "title": self.content.title,
-            "info_1": self.content.createdAt,
-            "info_2": self.content.durationString,
-            "thumbnailImage": (Images.THUMBNAIL_IMAGE, self.content.thumbnailURL, ImageSize.CLIP_THUMBNAIL),
-            "categoryImage": (Images.CATEGORY_IMAGE, self.content.game.boxArtURL)
+    @staticmethod
+    def getClipInfo(content: Clip) -> dict:
+        return {
+            "title": content.title,
+            "info_1": content.createdAt,
+            "info_2": content.durationString,
+            "thumbnailImage": (Images.THUMBNAIL_IMAGE, content.thumbnailURL, ImageSize.CLIP_THUMBNAIL),
+            "categoryImage": (Images.CATEGORY_IMAGE, content.game.boxArtURL)
         }
-        self.setInfo(data)
+
+    @classmethod
+    def getInfo(cls, content: Channel | Stream | Video | Clip) -> dict:
+        if isinstance(content, Channel):
+            return cls.getBroadcastInfo(content)
+        elif isinstance(content, Stream):
+            return cls.getStreamInfo(content)
+        elif isinstance(content, Video):
+            return cls.getVideoInfo(content)
+        else:
+            return cls.getClipInfo(content)
+
+    def setBroadcastInfo(self) -> None:
+        self.setInfo(self.getBroadcastInfo(self.content))
+
+    def setStreamInfo(self) -> None:
+        self.setInfo(self.getStreamInfo(self.content))
+
+    def setVideoInfo(self) -> None:
+        self.setInfo(self.getVideoInfo(self.content))
+
+    def setClipInfo(self) -> None:
+        self.setInfo(self.getClipInfo(self.content))
 
     def setInfo(self, data: dict) -> None:
         self._ui.title.setText(data["title"])